@@ -0,0 +1,206 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, 'src'))
+sys.path.insert(0, os.path.join(ROOT_DIR, 'examples'))
+
+from create_sample_data import XLSX_MAX_DATA_ROWS, create_large_sample_data
+from excel_processor import (
+    add_time_column,
+    clean_headers,
+    load_file,
+    process_file_streaming,
+    process_sample_columns,
+    save_processed_file,
+)
+from output_writers import OUTPUT_FORMATS
+
+# 미리 정의된 데이터 크기: (행 수, 채널 수, 중복 sample 열 수)
+SIZE_PRESETS = {
+    'tiny': (10_000, 4, 4),
+    'small': (100_000, 8, 8),
+    'medium': (1_000_000, 32, 32),
+    'large': (10_000_000, 64, 64),
+    'xlarge': (50_000_000, 128, 128),
+}
+
+# DataFrame 전체를 메모리에 올리는 단계를 측정할 최대 예상 크기 (GB, 넘으면 스트리밍 단계만 측정)
+DEFAULT_IN_MEMORY_LIMIT_GB = 4.0
+
+def estimated_frame_bytes(rows, channels, sample_columns):
+    """프리셋 데이터를 float64/int64 DataFrame으로 읽었을 때의 예상 크기 (바이트)"""
+    return rows * (channels + sample_columns + 1) * 8
+
+def measure(func, *args, trace_memory=True):
+    """
+    함수 하나를 실행하며 걸린 시간과 Python 할당 메모리 최고치를 잽니다.
+
+    Args:
+        func (callable): 측정할 함수
+        trace_memory (bool): tracemalloc으로 메모리를 측정할지 여부 (느려짐)
+
+    Returns:
+        tuple: (함수 반환값, {'seconds': 초, 'peak_mb': MB 또는 None})
+    """
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        value = func(*args)
+    finally:
+        seconds = time.perf_counter() - start
+        peak_mb = None
+        if trace_memory:
+            peak_mb = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+            tracemalloc.stop()
+    return value, {'seconds': seconds, 'peak_mb': peak_mb}
+
+def benchmark_file(input_path, output_formats, work_dir, trace_memory=True, streaming=False, in_memory=True):
+    """
+    파일 하나에 대해 파이프라인의 각 단계를 측정합니다.
+
+    in_memory가 False이면(메모리에 올릴 수 없는 크기) 전체 로드 단계는 건너뛰고
+    CSV 스트리밍 처리만 출력 형식별로 측정합니다.
+
+    Args:
+        input_path (str): 입력 파일 경로
+        output_formats (list): 저장 단계에서 측정할 출력 형식 목록
+        work_dir (str): 출력 파일을 쓸 폴더
+        trace_memory (bool): 메모리 측정 여부
+        streaming (bool): CSV 입력의 스트리밍 처리도 측정할지 여부
+        in_memory (bool): DataFrame 전체를 메모리에 올리는 단계를 측정할지 여부
+
+    Returns:
+        dict: 단계별 측정 결과
+    """
+    if not in_memory:
+        return benchmark_streaming_only(input_path, output_formats, work_dir, trace_memory)
+
+    stages = {}
+    df, stages['load_file'] = measure(load_file, input_path, trace_memory=trace_memory)
+    rows = len(df)
+    df, stages['clean_headers'] = measure(clean_headers, df, trace_memory=trace_memory)
+    (df, sample_column_name), stages['process_sample_columns'] = measure(
+        process_sample_columns, df, trace_memory=trace_memory)
+    df, stages['add_time_column'] = measure(
+        add_time_column, df, sample_column_name, trace_memory=trace_memory)
+
+    for output_format in output_formats:
+        extension = OUTPUT_FORMATS[output_format]
+        output_path = os.path.join(work_dir, f"bench_output{extension}")
+        _, stages[f'save_{output_format}'] = measure(
+            save_processed_file, df, output_path, trace_memory=trace_memory)
+        stages[f'save_{output_format}']['bytes'] = os.path.getsize(output_path)
+        os.remove(output_path)
+
+    del df
+    if streaming and input_path.lower().endswith('.csv'):
+        output_path = os.path.join(work_dir, 'bench_stream.csv')
+        _, stages['streaming_csv'] = measure(
+            process_file_streaming, input_path, output_path, trace_memory=trace_memory)
+        os.remove(output_path)
+
+    for result in stages.values():
+        result['rows_per_second'] = rows / result['seconds'] if result['seconds'] else None
+    return {'input': input_path, 'rows': rows, 'bytes': os.path.getsize(input_path), 'stages': stages}
+
+def benchmark_streaming_only(input_path, output_formats, work_dir, trace_memory=True):
+    """
+    CSV 파일을 조각 단위 스트리밍 처리로만 출력 형식별로 측정합니다 (메모리 사용량이 조각 크기에 비례).
+
+    Args:
+        input_path (str): 입력 CSV 파일 경로
+        output_formats (list): 측정할 출력 형식 목록
+        work_dir (str): 출력 파일을 쓸 폴더
+        trace_memory (bool): 메모리 측정 여부
+
+    Returns:
+        dict: 단계별 측정 결과
+    """
+    if not input_path.lower().endswith('.csv'):
+        raise ValueError(f"메모리에 올릴 수 없는 크기는 CSV 스트리밍으로만 측정할 수 있습니다: {input_path}")
+    stages = {}
+    rows = 0
+    for output_format in output_formats:
+        output_path = os.path.join(work_dir, f"bench_stream{OUTPUT_FORMATS[output_format]}")
+        rows, stages[f'stream_{output_format}'] = measure(
+            process_file_streaming, input_path, output_path, trace_memory=trace_memory)
+        stages[f'stream_{output_format}']['bytes'] = os.path.getsize(output_path)
+        os.remove(output_path)
+
+    for result in stages.values():
+        result['rows_per_second'] = rows / result['seconds'] if result['seconds'] else None
+    return {'input': input_path, 'rows': rows, 'bytes': os.path.getsize(input_path), 'stages': stages}
+
+def print_table(report):
+    """측정 결과를 사람이 읽기 쉬운 표로 출력합니다."""
+    for case in report['cases']:
+        print(f"\n[{case['size']} / {case['input_format']}] "
+              f"{case['rows']:,}행, {case['bytes'] / (1024 * 1024):,.1f} MB")
+        print(f"  {'단계':<24}{'초':>10}{'행/초':>16}{'메모리(MB)':>14}")
+        for name, result in case['stages'].items():
+            peak = f"{result['peak_mb']:.1f}" if result['peak_mb'] is not None else '-'
+            rate = f"{result['rows_per_second']:,.0f}" if result['rows_per_second'] else '-'
+            print(f"  {name:<24}{result['seconds']:>10.3f}{rate:>16}{peak:>14}")
+
+def main(argv=None):
+    """벤치마크 실행 진입점"""
+    parser = argparse.ArgumentParser(description="파이프라인 단계별 성능 벤치마크")
+    parser.add_argument('--sizes', default='small',
+                        help=f"쉼표로 구분한 크기 프리셋 ({', '.join(SIZE_PRESETS)})")
+    parser.add_argument('--inputs', default='csv',
+                        help="쉼표로 구분한 입력 형식 (csv, xlsx)")
+    parser.add_argument('--outputs', default='csv',
+                        help=f"쉼표로 구분한 저장 단계 출력 형식 ({', '.join(OUTPUT_FORMATS)})")
+    parser.add_argument('--data-dir', default=None,
+                        help="생성한 입력 데이터를 보관할 폴더 (있으면 재사용)")
+    parser.add_argument('--no-memory', action='store_true',
+                        help="tracemalloc 메모리 측정을 끕니다 (시간 측정이 더 정확해짐)")
+    parser.add_argument('--streaming', action='store_true',
+                        help="CSV 스트리밍 처리도 측정합니다")
+    parser.add_argument('--max-memory-gb', type=float, default=DEFAULT_IN_MEMORY_LIMIT_GB,
+                        help="예상 크기가 이보다 큰 데이터는 전체 로드 없이 스트리밍 단계만 측정합니다 "
+                             f"(기본값: {DEFAULT_IN_MEMORY_LIMIT_GB:g})")
+    parser.add_argument('--json', default=None, help="결과를 JSON 파일로 저장합니다")
+    args = parser.parse_args(argv)
+
+    data_dir = args.data_dir or os.path.join(tempfile.gettempdir(), 'labview_processor_bench')
+    os.makedirs(data_dir, exist_ok=True)
+
+    report = {'cases': []}
+    with tempfile.TemporaryDirectory() as work_dir:
+        for size in args.sizes.split(','):
+            rows, channels, sample_columns = SIZE_PRESETS[size]
+            for input_format in args.inputs.split(','):
+                if input_format == 'xlsx' and rows > XLSX_MAX_DATA_ROWS:
+                    print(f"건너뜀: {size} 크기는 엑셀 행 수 제한을 넘습니다.")
+                    continue
+                in_memory = estimated_frame_bytes(rows, channels, sample_columns) <= args.max_memory_gb * 1024 ** 3
+                if not in_memory and input_format != 'csv':
+                    print(f"건너뜀: {size} 크기의 {input_format} 파일은 메모리에 올릴 수 없고 스트리밍도 지원하지 않습니다.")
+                    continue
+                if not in_memory:
+                    print(f"{size}: 예상 크기가 {args.max_memory_gb:g} GB를 넘어 스트리밍 단계만 측정합니다.")
+                input_path = os.path.join(data_dir, f"bench_{size}.{input_format}")
+                if not os.path.exists(input_path):
+                    create_large_sample_data(input_path, rows, channels, sample_columns)
+                case = benchmark_file(input_path, args.outputs.split(','), work_dir,
+                                      trace_memory=not args.no_memory, streaming=args.streaming,
+                                      in_memory=in_memory)
+                case.update(size=size, input_format=input_format)
+                report['cases'].append(case)
+
+    print_table(report)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,12 @@
+import argparse
+import math
+import os
 import pandas as pd
 import numpy as np
+from openpyxl import Workbook
+
+# 엑셀 시트 하나에 쓸 수 있는 최대 데이터 행 수 (헤더 제외)
+XLSX_MAX_DATA_ROWS = 1_048_575
 
 def create_sample_data():
     """
@@ -44,5 +51,120 @@ def create_sample_data():
     
     return output_file
 
+def sample_data_columns(n_channels, n_sample_columns):
+    """
+    실제 웨이브폼 차트 내보내기와 같은 열 배치를 만듭니다.
+
+    맨 앞에 ' sample 수 ' 열이 오고, 채널(DOF) 열 사이사이에 중복된
+    ' sample N ' 열이 고르게 끼워집니다.
+
+    Args:
+        n_channels (int): 채널(DOF) 열 수
+        n_sample_columns (int): 중복 sample 열 수
+
+    Returns:
+        list: 열 이름 목록 (sample 열은 앞뒤 공백 포함)
+    """
+    columns = [' sample 수 ']
+    per_group = math.ceil(n_channels / n_sample_columns) if n_sample_columns else n_channels
+    sample_index = 1
+    for channel in range(1, n_channels + 1):
+        columns.append(f'DOF{channel}')
+        if n_sample_columns and (channel % per_group == 0 or channel == n_channels) \
+                and sample_index <= n_sample_columns:
+            columns.append(f' sample {sample_index} ')
+            sample_index += 1
+    # 채널 수보다 중복 sample 열이 많으면 끝에 몰아서 추가
+    while sample_index <= n_sample_columns:
+        columns.append(f' sample {sample_index} ')
+        sample_index += 1
+    return columns
+
+def iter_sample_chunks(n_rows, columns, chunk_rows, seed=42):
+    """
+    큰 샘플 데이터를 메모리에 한꺼번에 만들지 않도록 조각 단위로 생성합니다.
+
+    Args:
+        n_rows (int): 전체 행 수
+        columns (list): sample_data_columns로 만든 열 이름 목록
+        chunk_rows (int): 조각당 행 수
+        seed (int): 난수 시드
+
+    Yields:
+        pandas.DataFrame: 데이터 조각
+    """
+    rng = np.random.default_rng(seed)
+    for start in range(0, n_rows, chunk_rows):
+        stop = min(start + chunk_rows, n_rows)
+        sample_count = np.arange(start, stop)
+        data = {}
+        for column in columns:
+            if 'sample' in column:
+                data[column] = sample_count
+            else:
+                data[column] = rng.normal(0, 1, stop - start)
+        yield pd.DataFrame(data)
+
+def create_large_sample_data(output_file, n_rows=1_000_000, n_channels=8,
+                             n_sample_columns=None, chunk_rows=500_000):
+    """
+    벤치마크용 대용량 샘플 데이터를 CSV 또는 엑셀 파일로 생성합니다.
+
+    Args:
+        output_file (str): 출력 파일 경로 (.csv 또는 .xlsx)
+        n_rows (int): 행 수 (엑셀은 최대 1,048,575행)
+        n_channels (int): 채널(DOF) 열 수
+        n_sample_columns (int): 중복 sample 열 수 (없으면 채널 수와 같음)
+        chunk_rows (int): 조각당 행 수
+
+    Returns:
+        str: 생성된 파일 경로
+    """
+    if n_sample_columns is None:
+        n_sample_columns = n_channels
+    columns = sample_data_columns(n_channels, n_sample_columns)
+    file_extension = os.path.splitext(output_file)[1].lower()
+
+    if file_extension == '.csv':
+        first_chunk = True
+        for chunk in iter_sample_chunks(n_rows, columns, chunk_rows):
+            chunk.to_csv(output_file, index=False,
+                         mode='w' if first_chunk else 'a', header=first_chunk)
+            first_chunk = False
+    elif file_extension == '.xlsx':
+        if n_rows > XLSX_MAX_DATA_ROWS:
+            raise ValueError(f"엑셀 파일은 최대 {XLSX_MAX_DATA_ROWS}행까지 생성할 수 있습니다.")
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet('Sheet1')
+        worksheet.append(columns)
+        for chunk in iter_sample_chunks(n_rows, columns, chunk_rows):
+            for row in chunk.itertuples(index=False, name=None):
+                worksheet.append(row)
+        workbook.save(output_file)
+    else:
+        raise ValueError(f"지원하지 않는 파일 형식입니다: {file_extension}")
+
+    print(f"샘플 데이터가 생성되었습니다: {output_file}")
+    print(f"데이터 형태: {n_rows}행 x {len(columns)}열 (채널 {n_channels}개, 중복 sample 열 {n_sample_columns}개)")
+    return output_file
+
+def main():
+    """
+    명령줄 인자가 없으면 기존과 같은 1000행 샘플을, 있으면 대용량 샘플을 만듭니다.
+    """
+    parser = argparse.ArgumentParser(description="테스트/벤치마크용 샘플 데이터 생성")
+    parser.add_argument('-o', '--output', default=None,
+                        help="출력 파일 경로 (.csv 또는 .xlsx, 생략 시 기본 sample_data.xlsx)")
+    parser.add_argument('-n', '--rows', type=int, default=1_000_000, help="행 수")
+    parser.add_argument('-c', '--channels', type=int, default=8, help="채널(DOF) 열 수")
+    parser.add_argument('-s', '--sample-columns', type=int, default=None,
+                        help="중복 sample 열 수 (기본값: 채널 수)")
+    args = parser.parse_args()
+
+    if args.output is None:
+        create_sample_data()
+    else:
+        create_large_sample_data(args.output, args.rows, args.channels, args.sample_columns)
+
 if __name__ == "__main__":
-    create_sample_data() 
\ No newline at end of file
+    main()
@@ -0,0 +1,75 @@
+import os
+
+# GUI가 창을 띄우기 전에 필요한 설정값 모음입니다.
+# pandas, numpy, openpyxl을 불러오지 않아도 되도록 표준 라이브러리만 사용하며,
+# 처리 모듈들도 같은 값을 여기서 가져다 씁니다.
+
+# 지원하는 입력 파일 확장자
+SUPPORTED_EXTENSIONS = ('.xlsx', '.csv', '.lvm', '.tdms')
+
+# 지원하는 출력 형식과 확장자
+OUTPUT_FORMATS = {
+    'xlsx': '.xlsx',
+    'csv': '.csv',
+    # 압축 CSV: 네트워크 공유 폴더에 쓰는 양을 줄입니다 (zstd는 pyarrow 필요)
+    'csv.gz': '.csv.gz',
+    'csv.zst': '.csv.zst',
+    'parquet': '.parquet',
+    'feather': '.feather',
+}
+
+# Parquet/Feather 출력 압축 방식 ('none'은 압축 안 함, Feather는 zstd/lz4만 지원)
+OUTPUT_COMPRESSIONS = ('zstd', 'snappy', 'gzip', 'lz4', 'none')
+
+# 지원하는 차트용 축소 방식: 구간별 최소/최대, Largest-Triangle-Three-Buckets
+DECIMATION_METHODS = ('minmax', 'lttb')
+
+# 차트용 파일의 기본 목표 점 수 (채널당)
+DEFAULT_CHART_POINTS = 5000
+
+def split_output_extension(output_path):
+    """
+    출력 경로를 이름과 확장자로 나눕니다. '.csv.gz'처럼 두 단계인 확장자도 하나로 봅니다.
+
+    Args:
+        output_path (str): 출력 파일 경로
+
+    Returns:
+        tuple: (확장자를 뺀 경로, 확장자)
+    """
+    lower = output_path.lower()
+    for extension in sorted(OUTPUT_FORMATS.values(), key=len, reverse=True):
+        if lower.endswith(extension):
+            return output_path[:-len(extension)], output_path[-len(extension):]
+    return os.path.splitext(output_path)
+
+def unique_column_names(names):
+    """
+    중복된 열 이름에 pandas와 같은 방식으로 '.1', '.2'를 붙입니다.
+
+    Args:
+        names (list): 열 이름 목록
+
+    Returns:
+        list: 중복이 없는 열 이름 목록
+    """
+    seen = {}
+    unique = []
+    for name in names:
+        if name in seen:
+            seen[name] += 1
+            unique.append(f"{name}.{seen[name]}")
+        else:
+            seen[name] = 0
+            unique.append(name)
+    return unique
+
+def default_worker_count():
+    """
+    기본 작업자 프로세스 수를 반환합니다 (CPU 코어 수, 최대 61).
+    
+    Returns:
+        int: 작업자 수
+    """
+    # Windows의 ProcessPoolExecutor는 최대 61개 작업자까지만 허용합니다
+    return max(1, min(os.cpu_count() or 1, 61))
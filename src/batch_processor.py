@@ -0,0 +1,347 @@
+import os
+import sys
+import time
+import multiprocessing
+import queue
+from contextlib import redirect_stdout
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from functools import partial
+
+from excel_processor import (
+    DEFAULT_CHUNK_SIZE,
+    default_output_path,
+    list_sheets,
+    load_file,
+    process_data,
+    process_file_streaming,
+    save_chart_file,
+    save_processed_file,
+)
+from decimation import chart_output_path
+from app_defaults import default_worker_count
+from channel_stats import ChannelStats, stats_output_path
+from instrumentation import PipelineStats, merge_stage_totals
+from process_manifest import ProcessManifest, file_sha256, settings_key
+
+# 배치 처리 기본 설정 (작업자 프로세스로 그대로 전달됩니다)
+DEFAULT_OPTIONS = {
+    'output_extension': '.xlsx',
+    'output_dir': None,
+    # Parquet/Feather 압축 방식 (없으면 형식별 기본값, CSV 압축은 '.csv.gz'/'.csv.zst' 확장자로 지정)
+    'compression': None,
+    'streaming': False,
+    'chunk_size': DEFAULT_CHUNK_SIZE,
+    # CSV 파서 ('auto'는 pyarrow를 먼저 쓰고 안 되면 C 파서, 스트리밍 모드는 항상 C 파서)
+    'csv_engine': 'auto',
+    # True이면 채널 열을 float32, sample 열을 작은 정수형으로 줄여 처리/저장합니다
+    'compact': False,
+    # 지정하면 채널당 이 점 수로 줄인 차트용 '_chart' 파일을 함께 저장합니다
+    'chart_points': None,
+    # 차트용 축소 방식 ('minmax' 또는 'lttb')
+    'chart_method': 'minmax',
+    # 'json' 또는 'csv'이면 채널별 통계를 '_processed_stats' 파일로 함께 저장합니다
+    'stats_format': None,
+    # 엑셀 파일의 모든 시트를 각각 별도 작업으로 처리합니다 (시트가 하나면 기존과 같음)
+    'all_sheets': True,
+    # True이면 처리 함수들의 진행 메시지를 표준 오류로 보냅니다 (CLI JSON 출력용)
+    'log_to_stderr': False,
+    # 입력과 설정이 바뀌지 않은 파일은 처리 기록을 보고 건너뜁니다
+    'skip_unchanged': True,
+    # True이면 처리 기록과 관계없이 모두 다시 처리합니다
+    'force': False,
+    # 처리 기록에 입력 파일 내용 해시를 함께 남기고 비교합니다
+    'use_hash': False,
+    # True이면 작업자 프로세스 대신 읽기/변환/쓰기 단계 스레드를 겹쳐 실행하는 파이프라인으로 처리합니다
+    'pipeline': False,
+}
+
+# 조각 단위 진행률을 받을 때 작업 완료를 기다리며 진행률 큐를 확인하는 간격 (초)
+PROGRESS_POLL_SECONDS = 0.2
+
+# 출력 결과에 영향을 주지 않아 처리 기록 비교에서 제외하는 설정
+RUNTIME_OPTION_KEYS = {'output_dir', 'streaming', 'chunk_size', 'csv_engine', 'log_to_stderr',
+                       'skip_unchanged', 'force', 'use_hash', 'pipeline'}
+
+def output_settings(options):
+    """처리 기록 비교에 쓰는, 출력 결과에 영향을 주는 설정만 모은 사전"""
+    return {key: value for key, value in options.items() if key not in RUNTIME_OPTION_KEYS}
+
+def _empty_result(input_path, error=None, sheet_name=None):
+    """처리 결과 사전의 기본 형태"""
+    return {'input': input_path, 'sheet': sheet_name, 'output': None, 'rows': 0,
+            'bytes_read': 0, 'bytes_written': 0, 'seconds': 0.0,
+            'stages': {}, 'cached': False, 'error': error}
+
+def expand_jobs(file_paths, options):
+    """
+    입력 파일 목록을 작업 목록으로 펼칩니다.
+    
+    all_sheets 설정이 켜져 있으면 데이터가 있는 시트가 여러 개인 엑셀 파일은
+    시트마다 하나의 작업이 되어 다른 작업과 함께 병렬로 처리됩니다.
+    데이터가 있는 시트가 하나뿐이면 그 시트를 읽되(앞에 빈 표지 시트가 있어도)
+    출력 파일 이름에는 시트 이름을 붙이지 않습니다.
+    
+    Args:
+        file_paths (list): 입력 파일 경로 목록
+        options (dict): DEFAULT_OPTIONS 형식의 설정
+        
+    Returns:
+        list: (입력 파일 경로, 시트 이름 또는 None, 출력 이름에 시트 이름을 붙일지 여부) 목록
+    """
+    jobs = []
+    for path in file_paths:
+        sheets = []
+        if options['all_sheets'] and path.lower().endswith('.xlsx') and os.path.isfile(path):
+            try:
+                sheets = list_sheets(path)
+            except Exception:
+                # 열 수 없는 파일은 작업자에서 처리하며 오류로 기록됩니다
+                sheets = []
+        if len(sheets) > 1:
+            jobs.extend((path, sheet, True) for sheet in sheets)
+        elif sheets:
+            jobs.append((path, sheets[0], False))
+        else:
+            jobs.append((path, None, False))
+    return jobs
+
+def _put_progress(progress_queue, input_path, sheet_name, rows, bytes_read, total_bytes):
+    """작업자 프로세스의 조각 진행률을 주 프로세스로 보냅니다."""
+    progress_queue.put((input_path, sheet_name, rows, bytes_read, total_bytes))
+
+def process_one(input_path, options=None, sheet_name=None, progress_callback=None, sheet_suffix=True):
+    """
+    파일(또는 엑셀 시트) 하나를 로드 → 처리 → 저장합니다. 작업자 프로세스에서 실행됩니다.
+    
+    예외를 밖으로 던지지 않고 결과 사전의 'error' 항목에 담아 돌려주므로,
+    한 파일의 오류가 배치 전체를 멈추지 않습니다.
+    
+    Args:
+        input_path (str): 입력 파일 경로
+        options (dict): DEFAULT_OPTIONS 형식의 설정
+        sheet_name (str): 엑셀 파일에서 처리할 시트 이름 (없으면 첫 번째 시트)
+        progress_callback (callable): 스트리밍 모드에서 조각마다 (누적 행 수, 읽은 바이트, 전체 바이트)로 호출
+        sheet_suffix (bool): 출력 파일 이름에 시트 이름을 붙일지 여부
+        
+    Returns:
+        dict: input, sheet, output, rows, bytes_read, bytes_written, seconds,
+            stages(단계별 시간/행 수/행/초/입출력 바이트/최대 RSS), error 항목을 가진 결과
+    """
+    options = {**DEFAULT_OPTIONS, **(options or {})}
+    if options['log_to_stderr']:
+        with redirect_stdout(sys.stderr):
+            return _process_one(input_path, options, sheet_name, progress_callback, sheet_suffix)
+    return _process_one(input_path, options, sheet_name, progress_callback, sheet_suffix)
+
+def _process_one(input_path, options, sheet_name, progress_callback, sheet_suffix):
+    result = _empty_result(input_path, sheet_name=sheet_name)
+    stats = PipelineStats(input_path)
+    start = time.perf_counter()
+    
+    try:
+        streaming = options['streaming'] and input_path.lower().endswith('.csv')
+        output_path = default_output_path(input_path, options['output_extension'], options['output_dir'],
+                                          sheet_name if sheet_suffix else None)
+        # 처리 기록에는 처리 시작 시점의 입력 파일 상태를 남깁니다
+        stat = os.stat(input_path)
+        result['bytes_read'] = stat.st_size
+        result['input_mtime_ns'] = stat.st_mtime_ns
+        if options['use_hash']:
+            result['sha256'] = file_sha256(input_path)
+        
+        channel_stats = ChannelStats() if options['stats_format'] else None
+        if streaming:
+            # 스트리밍 모드는 읽기/처리/저장이 조각 단위로 섞여 있어 한 단계로 측정
+            with stats.stage('stream', bytes_read=stat.st_size) as record:
+                record['rows'] = process_file_streaming(input_path, output_path, options['chunk_size'],
+                                                        require_sample=True, progress_callback=progress_callback,
+                                                        compact=options['compact'],
+                                                        chart_points=options['chart_points'],
+                                                        chart_method=options['chart_method'],
+                                                        channel_stats=channel_stats,
+                                                        compression=options['compression'])
+                record['bytes_written'] = os.path.getsize(output_path)
+            result['rows'] = record['rows']
+        else:
+            with stats.stage('load', bytes_read=stat.st_size) as record:
+                df = load_file(input_path, compact=options['compact'], sheet_name=sheet_name,
+                               csv_engine=options['csv_engine'])
+                record['rows'] = len(df)
+            
+            with stats.stage('process', rows=len(df)):
+                df = process_data(df, require_sample=True)
+            
+            with stats.stage('save', rows=len(df)) as record:
+                save_processed_file(df, output_path, options['compression'])
+                record['bytes_written'] = os.path.getsize(output_path)
+            
+            if channel_stats is not None:
+                with stats.stage('stats', rows=len(df)):
+                    channel_stats.update(df)
+            
+            if options['chart_points']:
+                with stats.stage('chart', rows=len(df)) as record:
+                    chart_path = save_chart_file(df, output_path, options['chart_points'], options['chart_method'],
+                                                 options['compression'])
+                    record['bytes_written'] = os.path.getsize(chart_path)
+            result['rows'] = len(df)
+        
+        result['output'] = os.path.abspath(output_path)
+        if options['chart_points']:
+            result['chart_output'] = os.path.abspath(chart_output_path(output_path))
+        if channel_stats is not None:
+            stats_path = stats_output_path(output_path, options['stats_format'])
+            channel_stats.save(stats_path)
+            result['stats_output'] = os.path.abspath(stats_path)
+            result['channel_stats'] = channel_stats.to_dict()
+        result['bytes_written'] = os.path.getsize(output_path)
+        
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+    
+    result['seconds'] = time.perf_counter() - start
+    result['stages'] = stats.stages
+    return result
+
+def run_batch(file_paths, options=None, workers=None, progress_callback=None, fail_fast=False,
+              chunk_callback=None):
+    """
+    여러 파일을 프로세스 풀에 나누어 병렬로 처리합니다.
+    
+    여러 시트가 있는 엑셀 파일은 expand_jobs로 시트마다 별도 작업이 됩니다.
+    pipeline 설정이 켜져 있으면 프로세스 풀 대신 현재 프로세스에서 읽기/변환/쓰기 단계를
+    겹쳐 실행합니다 (pipeline_executor.run_pipeline 참고, workers는 무시).
+    
+    Args:
+        file_paths (list): 입력 파일 경로 목록
+        options (dict): DEFAULT_OPTIONS 형식의 설정
+        workers (int): 작업자 프로세스 수 (없으면 CPU 코어 수)
+        progress_callback (callable): 작업(파일 또는 시트) 하나가 끝날 때마다
+            progress_callback(완료 수, 전체 작업 수, 결과)로 호출됩니다
+        fail_fast (bool): True이면 첫 오류 이후 아직 시작하지 않은 파일을 건너뜁니다
+        chunk_callback (callable): 스트리밍 모드에서 조각마다 run_batch를 호출한 스레드에서
+            chunk_callback(입력 파일, 시트, 누적 행 수, 읽은 바이트, 전체 바이트)로 호출됩니다
+        
+    Returns:
+        dict: 전체 요약 (total(작업 수), succeeded, failed, skipped, cached, rows, seconds,
+            stage_totals(단계별 합계), results)
+    """
+    options = {**DEFAULT_OPTIONS, **(options or {})}
+    jobs = expand_jobs(file_paths, options)
+    results = []
+    start = time.perf_counter()
+    
+    use_manifest = options['skip_unchanged'] or options['force']
+    settings = settings_key(output_settings(options))
+    manifests = {}
+    
+    def manifest_for(path):
+        directory = options['output_dir'] or os.path.dirname(os.path.abspath(path))
+        if directory not in manifests:
+            manifests[directory] = ProcessManifest(directory)
+        return manifests[directory]
+    
+    def finish(result):
+        results.append(result)
+        if use_manifest and not result['error'] and not result['cached']:
+            manifest_for(result['input']).record(
+                result['input'], settings, result['output'], result['rows'],
+                sha256=result.get('sha256'), size=result['bytes_read'],
+                mtime_ns=result.get('input_mtime_ns'), sheet_name=result['sheet'],
+                sidecars=[result[key] for key in ('chart_output', 'stats_output') if result.get(key)])
+        if progress_callback:
+            progress_callback(len(results), len(jobs), result)
+    
+    # 처리 기록과 비교하여 바뀌지 않은 파일은 작업자에게 넘기지 않고 바로 완료 처리
+    pending = []
+    for path, sheet_name, sheet_suffix in jobs:
+        entry = None
+        if options['skip_unchanged'] and not options['force'] and os.path.isfile(path):
+            entry = manifest_for(path).lookup(path, settings, options['use_hash'], sheet_name)
+        if entry is None:
+            pending.append((path, sheet_name, sheet_suffix))
+            continue
+        result = _empty_result(path, sheet_name=sheet_name)
+        result.update(output=entry['output'], rows=entry['rows'], cached=True)
+        finish(result)
+    
+    workers = workers or default_worker_count()
+    workers = max(1, min(workers, len(pending) or 1))
+    
+    try:
+        if options['pipeline']:
+            # 파이프라인 모드에서만 필요하므로 그때 불러옵니다
+            from pipeline_executor import run_pipeline
+            if options['log_to_stderr']:
+                with redirect_stdout(sys.stderr):
+                    run_pipeline(pending, options, finish, fail_fast, chunk_callback)
+            else:
+                run_pipeline(pending, options, finish, fail_fast, chunk_callback)
+        elif workers == 1:
+            # 작업자가 하나면 프로세스 생성 비용 없이 현재 프로세스에서 처리
+            for path, sheet_name, sheet_suffix in pending:
+                callback = partial(chunk_callback, path, sheet_name) if chunk_callback else None
+                result = process_one(path, options, sheet_name, callback, sheet_suffix)
+                finish(result)
+                if fail_fast and result['error']:
+                    break
+        else:
+            # 작업자 프로세스의 조각 진행률은 관리자 큐로 받아 이 스레드에서 전달합니다
+            manager = multiprocessing.Manager() if chunk_callback else None
+            progress_queue = manager.Queue() if manager else None
+            
+            def forward_progress():
+                while progress_queue is not None:
+                    try:
+                        chunk_callback(*progress_queue.get_nowait())
+                    except queue.Empty:
+                        return
+            
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    futures = {}
+                    for path, sheet_name, sheet_suffix in pending:
+                        callback = partial(_put_progress, progress_queue, path, sheet_name) if progress_queue else None
+                        future = executor.submit(process_one, path, options, sheet_name, callback, sheet_suffix)
+                        futures[future] = (path, sheet_name)
+                    remaining = set(futures)
+                    while remaining:
+                        done, remaining = wait(remaining, return_when=FIRST_COMPLETED,
+                                               timeout=PROGRESS_POLL_SECONDS if progress_queue else None)
+                        forward_progress()
+                        for future in done:
+                            if future.cancelled():
+                                continue
+                            try:
+                                result = future.result()
+                            except Exception as e:
+                                # 작업자 프로세스 자체가 비정상 종료된 경우
+                                path, sheet_name = futures[future]
+                                result = _empty_result(path, f"{type(e).__name__}: {e}", sheet_name)
+                            finish(result)
+                            if fail_fast and result['error']:
+                                for other in futures:
+                                    other.cancel()
+            finally:
+                if manager is not None:
+                    manager.shutdown()
+    finally:
+        for manifest in manifests.values():
+            manifest.save()
+    
+    # 결과를 입력(시트) 순서대로 정렬
+    order = {(path, sheet_name): i for i, (path, sheet_name, _) in enumerate(jobs)}
+    results.sort(key=lambda r: order.get((r['input'], r['sheet']), len(order)))
+    
+    failed = [r for r in results if r['error']]
+    return {
+        'total': len(jobs),
+        'succeeded': len(results) - len(failed),
+        'failed': len(failed),
+        'skipped': len(jobs) - len(results),
+        'cached': sum(1 for r in results if r['cached']),
+        'rows': sum(r['rows'] for r in results),
+        'seconds': time.perf_counter() - start,
+        'stage_totals': merge_stage_totals(r['stages'] for r in results),
+        'results': results,
+    }
@@ -0,0 +1,148 @@
+import json
+import numpy as np
+import pandas as pd
+from app_defaults import split_output_extension
+
+# 채널 통계 사이드카 파일 형식
+STATS_FORMATS = ('json', 'csv')
+
+def stats_output_path(output_path, stats_format='json'):
+    """
+    출력 파일 옆에 둘 채널 통계 파일 경로 ('_processed.xlsx' → '_processed_stats.json').
+
+    Args:
+        output_path (str): 처리된 출력 파일 경로
+        stats_format (str): 'json' 또는 'csv'
+
+    Returns:
+        str: 통계 파일 경로
+    """
+    return f"{split_output_extension(output_path)[0]}_stats.{stats_format}"
+
+class ChannelStats:
+    """
+    채널(DOF) 열별 개수, 최솟값, 최댓값, 평균, RMS, 표준편차를 한 번의 통과로 계산합니다.
+
+    조각마다 update를 호출하면 개수/평균/편차제곱합(M2)을 병렬 분산 공식으로
+    합치므로, 전체 데이터를 다시 읽지 않고 스트리밍 중에도 같은 결과를 얻습니다.
+    'Time' 열과 'sample' 열은 제외하며, 빈 값(NaN)은 계산에서 뺍니다.
+    표준편차는 pandas와 같은 표본 표준편차(ddof=1)입니다.
+    """
+    def __init__(self):
+        self.columns = None
+        self.count = None
+        self.minimum = None
+        self.maximum = None
+        self.mean = None
+        self.m2 = None
+        self.sum_squares = None
+
+    def update(self, df):
+        """처리된 데이터(또는 조각) 하나를 통계에 더합니다."""
+        if self.columns is None:
+            self._start([col for col in df.columns
+                         if col != 'Time' and 'sample' not in str(col).lower()
+                         and pd.api.types.is_numeric_dtype(df[col])])
+        if not self.columns or len(df) == 0:
+            return
+
+        values = df[self.columns].to_numpy(dtype=np.float64)
+        valid = ~np.isnan(values)
+        count = valid.sum(axis=0)
+        filled = np.where(valid, values, 0.0)
+        total = filled.sum(axis=0)
+        mean = np.divide(total, count, out=np.zeros_like(total), where=count > 0)
+        m2 = (np.where(valid, values - mean, 0.0) ** 2).sum(axis=0)
+        self._merge(count, np.where(valid, values, np.inf).min(axis=0),
+                    np.where(valid, values, -np.inf).max(axis=0), mean, m2, (filled ** 2).sum(axis=0))
+
+    def merge(self, other):
+        """다른 ChannelStats(같은 열 구성)의 결과를 합칩니다."""
+        if other.columns is None:
+            return
+        if self.columns is None:
+            self._start(other.columns)
+        self._merge(other.count, other.minimum, other.maximum, other.mean, other.m2, other.sum_squares)
+
+    def _start(self, columns):
+        self.columns = list(columns)
+        size = len(self.columns)
+        self.count = np.zeros(size, dtype=np.int64)
+        self.minimum = np.full(size, np.inf)
+        self.maximum = np.full(size, -np.inf)
+        self.mean = np.zeros(size)
+        self.m2 = np.zeros(size)
+        self.sum_squares = np.zeros(size)
+
+    def _merge(self, count, minimum, maximum, mean, m2, sum_squares):
+        total = self.count + count
+        delta = mean - self.mean
+        safe_total = np.where(total > 0, total, 1)
+        self.mean = self.mean + delta * count / safe_total
+        self.m2 = self.m2 + m2 + delta ** 2 * self.count * count / safe_total
+        self.count = total
+        self.minimum = np.minimum(self.minimum, minimum)
+        self.maximum = np.maximum(self.maximum, maximum)
+        self.sum_squares = self.sum_squares + sum_squares
+
+    def to_dict(self):
+        """
+        채널별 통계 사전.
+
+        Returns:
+            dict: {채널 이름: {count, min, max, mean, rms, std}} (값이 없으면 None)
+        """
+        result = {}
+        for i, column in enumerate(self.columns or []):
+            count = int(self.count[i])
+            if count == 0:
+                result[column] = {'count': 0, 'min': None, 'max': None, 'mean': None, 'rms': None, 'std': None}
+                continue
+            result[column] = {
+                'count': count,
+                'min': float(self.minimum[i]),
+                'max': float(self.maximum[i]),
+                'mean': float(self.mean[i]),
+                'rms': float(np.sqrt(self.sum_squares[i] / count)),
+                'std': float(np.sqrt(self.m2[i] / (count - 1))) if count > 1 else None,
+            }
+        return result
+
+    def save(self, path):
+        """
+        통계를 확장자(.json 또는 .csv)에 맞는 형식으로 저장합니다.
+
+        Args:
+            path (str): 저장할 파일 경로
+        """
+        stats = self.to_dict()
+        if path.lower().endswith('.csv'):
+            frame = pd.DataFrame.from_dict(stats, orient='index')
+            frame.index.name = 'channel'
+            frame.to_csv(path)
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(stats, f, ensure_ascii=False, indent=2)
+
+    def format_summary(self, max_channels=4):
+        """
+        상태 표시줄에 보여 줄 짧은 요약 문자열.
+
+        Args:
+            max_channels (int): 표시할 최대 채널 수
+
+        Returns:
+            str: 채널별 min/max/mean/RMS/std 요약
+        """
+        parts = []
+        for column, stats in list(self.to_dict().items())[:max_channels]:
+            if stats['count'] == 0:
+                parts.append(f"{column}: 값 없음")
+                continue
+            std = f"{stats['std']:.4g}" if stats['std'] is not None else "-"
+            parts.append(f"{column}: min {stats['min']:.4g} / max {stats['max']:.4g} / "
+                         f"mean {stats['mean']:.4g} / RMS {stats['rms']:.4g} / std {std}")
+        remaining = len(self.columns or []) - max_channels
+        if remaining > 0:
+            parts.append(f"외 {remaining}개 채널")
+        return ", ".join(parts)
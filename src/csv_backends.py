@@ -0,0 +1,154 @@
+import codecs
+import csv
+import re
+import pandas as pd
+
+# 선택할 수 있는 CSV 파서: auto는 pyarrow(다중 스레드)를 먼저 쓰고 안 되면 C 파서로 대체
+CSV_ENGINES = ('auto', 'pyarrow', 'c')
+
+# 형식 추정에 읽는 파일 앞부분 크기
+SNIFF_BYTES = 64 * 1024
+
+# 시도할 인코딩 (한국어 Windows에서 내보낸 파일은 cp949)
+CANDIDATE_ENCODINGS = ('utf-8', 'cp949')
+
+# 구분자 후보 (동점이면 앞쪽 우선: 소수점 쉼표 파일은 세미콜론/탭 구분)
+CANDIDATE_DELIMITERS = ('\t', ';', ',')
+
+# 소수점 쉼표로 쓴 숫자 (예: -0,75 또는 1,5E-3)
+DECIMAL_COMMA_PATTERN = re.compile(r'^\s*[+-]?\d+,\d+([eE][+-]?\d+)?\s*$')
+
+def _decode_sample(raw, truncated):
+    """앞부분 바이트의 인코딩을 추정해 문자열로 바꿉니다."""
+    if raw.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig', raw[len(codecs.BOM_UTF8):].decode('utf-8', errors='replace')
+    if truncated and b'\n' in raw:
+        # 잘린 마지막 줄의 멀티바이트 문자가 판정을 망치지 않도록 제외
+        raw = raw[:raw.rindex(b'\n') + 1]
+    for encoding in CANDIDATE_ENCODINGS:
+        try:
+            return encoding, raw.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    return 'latin-1', raw.decode('latin-1')
+
+def _split_fields(line, delimiter):
+    """따옴표 안의 구분자는 나누지 않고 한 줄을 필드로 나눕니다."""
+    return next(csv.reader([line], delimiter=delimiter), [])
+
+def _consistent_tail(counts):
+    """끝에서부터 같은 필드 개수(1 초과)가 이어지는 줄 수와 그 개수"""
+    if not counts or counts[-1] <= 1:
+        return 0, 0
+    expected = counts[-1]
+    run = 0
+    for count in reversed(counts):
+        if count != expected:
+            break
+        run += 1
+    return run, expected
+
+def sniff_csv(file_path, sample_bytes=SNIFF_BYTES):
+    """
+    파일 앞부분만 읽어 구분자, 소수점 기호, 인코딩, 헤더 행 위치를 추정합니다.
+
+    데이터 행은 필드 개수가 일정하다는 점을 이용합니다. 끝에서부터 필드 개수가
+    같은 줄이 가장 길게 이어지는 후보를 구분자로, 그 구간의 첫 줄을 헤더로 봅니다.
+    헤더 앞의 LabVIEW 설명 줄 등은 건너뛰게 됩니다. 데이터 행만 줄 끝에 구분자가
+    하나 더 붙은 파일(LabVIEW 탭 구분 내보내기)은 구분자가 하나 적은 바로 위 줄을
+    헤더로 보고, 끝의 빈 열을 index_col=False로 버리도록 합니다. 필드는 csv 모듈로
+    나누므로 따옴표로 감싼 헤더나 값 안의 구분자는 세지 않습니다.
+
+    Args:
+        file_path (str): CSV 파일 경로
+        sample_bytes (int): 읽을 앞부분 바이트 수
+
+    Returns:
+        dict: pd.read_csv에 그대로 넘길 수 있는 sep, decimal, encoding, header 설정
+            (줄 끝 구분자가 있으면 index_col도 포함)
+    """
+    with open(file_path, 'rb') as f:
+        raw = f.read(sample_bytes)
+        truncated = bool(f.read(1))
+    encoding, text = _decode_sample(raw, truncated)
+    lines = text.splitlines()
+    if lines and (truncated or (len(lines) > 1 and not text.endswith(('\n', '\r')))):
+        # 잘렸거나 아직 쓰는 중일 수 있는 마지막 줄은 판정에서 뺍니다
+        lines = lines[:-1]
+    # 빈 줄은 판정에서 빼되 헤더 위치 계산을 위해 원래 줄 번호를 기억합니다
+    numbered = [(i, line) for i, line in enumerate(lines) if line.strip()]
+
+    best = (0, 0, ',')
+    for delimiter in CANDIDATE_DELIMITERS:
+        run, fields = _consistent_tail([len(_split_fields(line, delimiter)) for _, line in numbered])
+        if run > best[0]:
+            best = (run, fields, delimiter)
+    run, fields, delimiter = best
+
+    # 줄 끝 구분자는 데이터 행에만 붙고 헤더에는 없는 경우가 있습니다
+    trailing_delimiter = False
+    if 0 < run < len(numbered) and numbered[-1][1].rstrip('\r').endswith(delimiter):
+        above = numbered[len(numbered) - run - 1][1]
+        if len(_split_fields(above, delimiter)) == fields - 1 and not above.rstrip('\r').endswith(delimiter):
+            run += 1
+            trailing_delimiter = True
+
+    header = numbered[len(numbered) - run][0] if run else 0
+    # pandas는 빈 줄을 건너뛰고 헤더 위치를 세므로 빈 줄 수만큼 뺍니다
+    header -= sum(1 for i, line in enumerate(lines[:header]) if not line.strip())
+
+    decimal = '.'
+    if delimiter != ',':
+        data_lines = [line for _, line in numbered[len(numbered) - run + 1:]] if run else []
+        for line in data_lines[:20]:
+            if any(DECIMAL_COMMA_PATTERN.match(field) for field in _split_fields(line, delimiter)):
+                decimal = ','
+                break
+
+    options = {'sep': delimiter, 'decimal': decimal, 'encoding': encoding, 'header': header}
+    if trailing_delimiter:
+        options['index_col'] = False
+    return options
+
+def _pyarrow_available():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+def read_csv(file_path, engine='auto', usecols=None, nrows=None, **kwargs):
+    """
+    형식을 자동으로 추정해 CSV 파일 전체를 읽습니다.
+
+    engine이 'auto'이면 pyarrow 다중 스레드 파서를 먼저 시도하고, pyarrow가 없거나
+    그 파서가 지원하지 않는 파일/옵션이면 pandas C 파서로 다시 읽습니다.
+
+    Args:
+        file_path (str): CSV 파일 경로
+        engine (str): 'auto', 'pyarrow' 또는 'c'
+        usecols (list): 읽을 열 위치 목록 (없으면 전체)
+        nrows (int): 읽을 최대 행 수 (지정하면 C 파서 사용)
+        **kwargs: sniff_csv 결과를 덮어쓸 pd.read_csv 설정
+
+    Returns:
+        pandas.DataFrame: 읽은 데이터
+    """
+    if engine not in CSV_ENGINES:
+        raise ValueError(f"지원하지 않는 CSV 파서입니다: {engine} ({', '.join(CSV_ENGINES)} 중 선택)")
+    options = {**sniff_csv(file_path), **kwargs}
+
+    if engine != 'c' and nrows is None and (engine == 'pyarrow' or _pyarrow_available()):
+        try:
+            arrow_usecols = None
+            if usecols is not None:
+                # pyarrow 파서는 열 위치 대신 열 이름만 받습니다
+                header = pd.read_csv(file_path, nrows=0, **options).columns
+                if header.has_duplicates:
+                    raise ValueError("중복된 열 이름이 있어 pyarrow 파서로 열을 고를 수 없습니다.")
+                arrow_usecols = [header[i] for i in usecols]
+            return pd.read_csv(file_path, engine='pyarrow', usecols=arrow_usecols, **options)
+        except (ImportError, ValueError):
+            if engine == 'pyarrow':
+                raise
+    return pd.read_csv(file_path, usecols=usecols, nrows=nrows, **options)
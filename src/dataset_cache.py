@@ -0,0 +1,275 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+import numpy as np
+import pandas as pd
+
+# 캐시 폴더 기본 위치와 최대 크기
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.labview_chart_cache')
+DEFAULT_CACHE_BYTES = 2 * 1024 * 1024 * 1024
+
+# 캐시 항목 하나의 열 정보 파일 이름과 형식 버전 (형식이 바뀌면 이전 항목은 무시)
+META_FILE_NAME = 'meta.json'
+CACHE_VERSION = 1
+
+# np.save로 그대로 저장하고 메모리 맵으로 다시 열 수 있는 자료형 (bool, 정수, 실수, 복소수, 날짜/시간)
+CACHEABLE_KINDS = 'biufcmM'
+
+class DatasetCache:
+    """
+    처리된 데이터를 열마다 .npy 파일로 저장해 두고 메모리 맵으로 다시 여는 로컬 캐시.
+
+    항목은 입력 파일의 경로, 크기, 수정 시각과 시트 이름, 처리 설정으로 만든 키로
+    찾으므로 입력이 바뀌면 자동으로 새로 만듭니다. 다시 열 때는 파일을 파싱하지 않고
+    각 열을 읽기 전용 메모리 맵으로 연결하므로 크기와 관계없이 바로 열리고,
+    실제로 접근한 부분만 디스크에서 읽습니다.
+
+    전체 크기가 max_bytes를 넘으면 가장 오래전에 사용한 항목부터 지웁니다.
+    문자열 등 메모리 맵으로 열 수 없는 열이 있는 데이터는 저장하지 않습니다.
+    """
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_CACHE_BYTES):
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(input_path, sheet_name=None, settings=None):
+        """
+        입력 파일 상태와 처리 설정으로 캐시 키를 만듭니다.
+
+        Args:
+            input_path (str): 입력 파일 경로
+            sheet_name (str): 엑셀 시트 이름
+            settings (dict): 처리 결과에 영향을 주는 설정 (예: compact)
+
+        Returns:
+            str: 캐시 키 (항목 폴더 이름)
+        """
+        stat = os.stat(input_path)
+        fingerprint = {
+            'input': os.path.normcase(os.path.abspath(input_path)),
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sheet': sheet_name,
+            'settings': settings or {},
+            'version': CACHE_VERSION,
+        }
+        encoded = json.dumps(fingerprint, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()[:32]
+
+    def _entry_dir(self, key):
+        return os.path.join(self.cache_dir, key)
+
+    def load(self, input_path, sheet_name=None, settings=None):
+        """
+        캐시된 처리 결과를 메모리 맵으로 엽니다.
+
+        반환된 DataFrame의 열은 읽기 전용 메모리 맵을 그대로 가리키므로(복사 없음)
+        값을 바꾸려면 먼저 복사해야 합니다.
+
+        Args:
+            input_path (str): 입력 파일 경로
+            sheet_name (str): 엑셀 시트 이름
+            settings (dict): 처리 설정
+
+        Returns:
+            pandas.DataFrame: 캐시된 데이터 (없으면 None)
+        """
+        entry_dir = self._entry_dir(self.key(input_path, sheet_name, settings))
+        meta_path = os.path.join(entry_dir, META_FILE_NAME)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            arrays = {i: np.load(os.path.join(entry_dir, f"{i}.npy"), mmap_mode='r')
+                      for i in range(len(meta['columns']))}
+        except (OSError, ValueError, KeyError):
+            return None
+        # 최근 사용 시각은 정보 파일의 수정 시각으로 기록합니다
+        os.utime(meta_path)
+        df = pd.DataFrame(arrays, copy=False)
+        df.columns = meta['columns']
+        return df
+
+    def _meta_path(self, input_path, sheet_name=None, settings=None):
+        return os.path.join(self._entry_dir(self.key(input_path, sheet_name, settings)), META_FILE_NAME)
+
+    def record_output(self, output_path, input_path, sheet_name=None, settings=None):
+        """
+        캐시 항목의 데이터로 저장한 출력 파일을 항목 정보에 기록합니다.
+
+        Args:
+            output_path (str): 저장한 출력 파일 경로
+            input_path (str): 입력 파일 경로
+            sheet_name (str): 엑셀 시트 이름
+            settings (dict): 처리 설정
+
+        Returns:
+            bool: 기록했으면 True (캐시 항목이 없으면 False)
+        """
+        meta_path = self._meta_path(input_path, sheet_name, settings)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return False
+        stat = os.stat(output_path)
+        meta.setdefault('outputs', {})[os.path.abspath(output_path)] = [stat.st_size, stat.st_mtime_ns]
+        temp_path = f"{meta_path}.tmp-{os.getpid()}"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, meta_path)
+        return True
+
+    def has_output(self, output_path, input_path, sheet_name=None, settings=None):
+        """
+        출력 파일이 record_output으로 기록한 뒤 바뀌지 않았는지 확인합니다.
+
+        Args:
+            output_path (str): 출력 파일 경로
+            input_path (str): 입력 파일 경로
+            sheet_name (str): 엑셀 시트 이름
+            settings (dict): 처리 설정
+
+        Returns:
+            bool: 이 캐시 항목으로 저장한 출력이 그대로 있으면 True
+        """
+        try:
+            with open(self._meta_path(input_path, sheet_name, settings), 'r', encoding='utf-8') as f:
+                recorded = json.load(f).get('outputs', {}).get(os.path.abspath(output_path))
+            stat = os.stat(output_path)
+        except (OSError, ValueError):
+            return False
+        return recorded == [stat.st_size, stat.st_mtime_ns]
+
+    def store(self, df, input_path, sheet_name=None, settings=None):
+        """
+        처리 결과를 캐시에 저장하고 크기 제한에 맞춰 오래된 항목을 정리합니다.
+
+        Args:
+            df (pandas.DataFrame): 처리된 데이터
+            input_path (str): 입력 파일 경로
+            sheet_name (str): 엑셀 시트 이름
+            settings (dict): 처리 설정
+
+        Returns:
+            bool: 저장했으면 True (캐시할 수 없는 열이 있거나 제한보다 크면 False)
+        """
+        arrays = []
+        for i in range(df.shape[1]):
+            dtype = df.dtypes.iloc[i]
+            if not isinstance(dtype, np.dtype) or dtype.kind not in CACHEABLE_KINDS:
+                return False
+            arrays.append(np.ascontiguousarray(df.iloc[:, i].to_numpy()))
+        total_bytes = sum(array.nbytes for array in arrays)
+        if total_bytes > self.max_bytes:
+            return False
+
+        key = self.key(input_path, sheet_name, settings)
+        entry_dir = self._entry_dir(key)
+        # 임시 폴더에 모두 쓴 뒤 이름을 바꿔, 쓰다 만 항목이 읽히지 않도록 합니다
+        temp_dir = f"{entry_dir}.tmp-{os.getpid()}"
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        os.makedirs(temp_dir)
+        try:
+            for i, array in enumerate(arrays):
+                np.save(os.path.join(temp_dir, f"{i}.npy"), array, allow_pickle=False)
+            meta = {
+                'columns': [str(col) for col in df.columns],
+                'rows': len(df),
+                'bytes': total_bytes,
+                'input': os.path.abspath(input_path),
+                'sheet': sheet_name,
+                'created': time.time(),
+            }
+            with open(os.path.join(temp_dir, META_FILE_NAME), 'w', encoding='utf-8') as f:
+                json.dump(meta, f, ensure_ascii=False, indent=2)
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            os.replace(temp_dir, entry_dir)
+        except OSError:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            raise
+        self.evict(keep=key)
+        return True
+
+    def entries(self):
+        """
+        캐시 항목 목록.
+
+        Returns:
+            list: (최근 사용 시각, 바이트 수, 항목 폴더) 목록 (오래된 순)
+        """
+        result = []
+        if not os.path.isdir(self.cache_dir):
+            return result
+        for name in os.listdir(self.cache_dir):
+            if '.' in name:
+                # 쓰는 중(.tmp-)이거나 지우다 남은(.evict-) 폴더는 항목이 아닙니다
+                continue
+            entry_dir = os.path.join(self.cache_dir, name)
+            meta_path = os.path.join(entry_dir, META_FILE_NAME)
+            try:
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    size = json.load(f)['bytes']
+                result.append((os.path.getmtime(meta_path), size, entry_dir))
+            except (OSError, ValueError, KeyError):
+                continue
+        result.sort()
+        return result
+
+    def evict(self, keep=None):
+        """
+        전체 크기가 max_bytes 이하가 될 때까지 가장 오래전에 사용한 항목을 지웁니다.
+
+        다른 곳에서 메모리 맵으로 열고 있어 지울 수 없는 항목은 건너뛰고 다음 항목을 지웁니다.
+
+        Args:
+            keep (str): 지우지 않을 항목 키 (방금 저장한 항목)
+
+        Returns:
+            int: 지운 항목 수
+        """
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, entry_dir in entries:
+            if total <= self.max_bytes:
+                break
+            if os.path.basename(entry_dir) == keep:
+                continue
+            if not self._remove_entry(entry_dir):
+                continue
+            total -= size
+            removed += 1
+        return removed
+
+    def _remove_entry(self, entry_dir):
+        """
+        항목 폴더 하나를 지웁니다.
+
+        먼저 폴더 이름을 바꿔 봅니다. Windows에서는 메모리 맵으로 열린 파일이 있으면
+        이름을 바꿀 수 없으므로, 사용 중인 항목으로 보고 그대로 둡니다. 이름을 바꾼 뒤
+        지우다 실패하면 경고를 출력합니다 (남은 폴더는 항목 목록에서 제외됩니다).
+
+        Returns:
+            bool: 지웠으면 True
+        """
+        trash_dir = f"{entry_dir}.evict-{os.getpid()}-{time.time_ns()}"
+        try:
+            os.replace(entry_dir, trash_dir)
+        except OSError:
+            return False
+        try:
+            shutil.rmtree(trash_dir)
+        except OSError as e:
+            print(f"경고: 캐시 항목을 모두 지우지 못했습니다: {trash_dir} ({e})")
+        return True
+
+    def clear(self):
+        """
+        캐시 폴더의 모든 항목을 지웁니다.
+
+        Returns:
+            int: 사용 중이라 지우지 못한 항목 수
+        """
+        return sum(1 for _, _, entry_dir in self.entries() if not self._remove_entry(entry_dir))
@@ -0,0 +1,183 @@
+import math
+import mmap
+import os
+import numpy as np
+import pandas as pd
+from app_defaults import DECIMATION_METHODS, DEFAULT_CHART_POINTS, split_output_extension
+
+def chart_output_path(output_path):
+    """
+    전체 출력 파일 옆에 둘 차트용 축소 파일 경로 ('_processed.csv' → '_processed_chart.csv').
+
+    Args:
+        output_path (str): 전체 출력 파일 경로
+
+    Returns:
+        str: 차트용 파일 경로
+    """
+    base, extension = split_output_extension(output_path)
+    return f"{base}_chart{extension}"
+
+def count_csv_rows(file_path, block_size=64 * 1024 * 1024):
+    """
+    CSV 파일의 데이터 행 수(헤더 제외)를 파싱 없이 줄바꿈 개수로 셉니다.
+
+    Args:
+        file_path (str): CSV 파일 경로
+        block_size (int): 한 번에 검사하는 바이트 수
+
+    Returns:
+        int: 데이터 행 수
+    """
+    size = os.path.getsize(file_path)
+    if size == 0:
+        return 0
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        lines = 0
+        for offset in range(0, size, block_size):
+            block = np.frombuffer(mm, dtype=np.uint8, count=min(block_size, size - offset), offset=offset)
+            lines += int(np.count_nonzero(block == ord('\n')))
+            # 메모리 맵을 닫기 전에 버퍼 참조를 놓아야 합니다
+            del block
+        # 마지막 줄이 줄바꿈으로 끝나지 않아도 한 줄로 셉니다
+        if mm[size - 1:size] != b'\n':
+            lines += 1
+    return max(lines - 1, 0)
+
+class ChartDecimator:
+    """
+    처리된 데이터를 조각 단위로 받아 차트용으로 점 수를 줄입니다.
+
+    전체 행을 목표 점 수에 맞춘 같은 크기의 구간으로 나누고, 구간이 다 채워지는
+    대로 대표 행을 골라 두므로 메모리에는 선택된 행과 구간 한두 개만 남습니다.
+
+    - minmax: 구간마다 각 채널의 최솟값/최댓값 행 (피크 보존, 채널당 목표 점 수)
+    - lttb: 구간마다 이전 선택 점, 다음 구간 평균과 이루는 삼각형 면적이 가장
+      큰 행 (Largest-Triangle-Three-Buckets, 파형 모양 보존)
+
+    채널마다 고른 행을 모두 합쳐 원래 순서대로 쓰므로, 채널이 많으면 결과 행 수가
+    목표보다 많아질 수 있습니다. x축은 'Time' 열(없으면 행 번호)을 사용합니다.
+    """
+    def __init__(self, total_rows, target_points=DEFAULT_CHART_POINTS, method='minmax'):
+        if method not in DECIMATION_METHODS:
+            raise ValueError(f"지원하지 않는 축소 방식입니다: {method} ({', '.join(DECIMATION_METHODS)} 중 선택)")
+        if target_points < 3:
+            raise ValueError("차트용 목표 점 수는 3 이상이어야 합니다.")
+        self.method = method
+        bucket_count = target_points // 2 if method == 'minmax' else target_points
+        self.bucket_size = max(1, math.ceil(total_rows / bucket_count))
+        self.pending = None
+        self.pending_start = 0
+        self.selected = []
+        self.value_columns = None
+        # LTTB에서 채널별로 직전에 선택한 점 (x, y)
+        self.previous_x = None
+        self.previous_y = None
+
+    def update(self, chunk):
+        """처리된 데이터 조각 하나를 추가합니다."""
+        if self.value_columns is None:
+            self.value_columns = [
+                i for i, col in enumerate(chunk.columns)
+                if col != 'Time' and 'sample' not in str(col).lower()
+                and pd.api.types.is_numeric_dtype(chunk.iloc[:, i])
+            ]
+        pending = chunk if self.pending is None else pd.concat([self.pending, chunk], ignore_index=True)
+        ready_buckets = len(pending) // self.bucket_size
+        if self.method == 'lttb':
+            # 마지막 완성 구간은 다음 구간 평균이 필요하므로 남겨 둡니다
+            ready_buckets -= 1
+        if ready_buckets > 0:
+            ready_rows = ready_buckets * self.bucket_size
+            self._select(pending, ready_rows)
+            pending = pending.iloc[ready_rows:].reset_index(drop=True)
+            self.pending_start += ready_rows
+        self.pending = pending
+
+    def finish(self):
+        """
+        남은 행을 마저 처리하고 차트용 DataFrame을 반환합니다.
+
+        Returns:
+            pandas.DataFrame: 선택된 행 (원래 순서)
+        """
+        if self.pending is not None and len(self.pending):
+            self._select(self.pending, len(self.pending), final=True)
+            self.pending_start += len(self.pending)
+        self.pending = None
+        if not self.selected:
+            return pd.DataFrame()
+        return pd.concat(self.selected, ignore_index=True)
+
+    def _x_values(self, frame):
+        if 'Time' in frame.columns:
+            return frame['Time'].to_numpy(dtype=np.float64)
+        return np.arange(self.pending_start, self.pending_start + len(frame), dtype=np.float64)
+
+    def _select(self, frame, rows, final=False):
+        """frame 앞쪽 rows 행을 구간별로 처리해 선택된 행을 모읍니다."""
+        if not self.value_columns:
+            # 채널 열이 없으면 구간마다 첫 행만 남깁니다
+            positions = np.arange(0, rows, self.bucket_size)
+        elif self.method == 'minmax':
+            positions = self._minmax_positions(frame, rows)
+        else:
+            positions = self._lttb_positions(frame, rows, final)
+        self.selected.append(frame.iloc[positions])
+
+    def _minmax_positions(self, frame, rows):
+        size = self.bucket_size
+        starts = np.arange(0, rows, size)
+        values = frame.iloc[:rows, self.value_columns].to_numpy(dtype=np.float64)
+        # 마지막 구간이 덜 찼으면 선택되지 않을 값으로 채워 같은 모양으로 만듭니다
+        padding = len(starts) * size - rows
+        missing = np.isnan(values)
+        low = np.pad(np.where(missing, np.inf, values), ((0, padding), (0, 0)), constant_values=np.inf)
+        high = np.pad(np.where(missing, -np.inf, values), ((0, padding), (0, 0)), constant_values=-np.inf)
+        shape = (len(starts), size, values.shape[1])
+        lows = low.reshape(shape).argmin(axis=1) + starts[:, None]
+        highs = high.reshape(shape).argmax(axis=1) + starts[:, None]
+        return np.unique(np.concatenate([lows.ravel(), highs.ravel()]))
+
+    def _lttb_positions(self, frame, rows, final):
+        size = self.bucket_size
+        x = self._x_values(frame)
+        values = frame.iloc[:, self.value_columns].to_numpy(dtype=np.float64)
+        channels = np.arange(values.shape[1])
+        positions = []
+        for start in range(0, rows, size):
+            stop = min(start + size, rows)
+            if self.previous_x is None:
+                # 첫 구간은 첫 행을 그대로 사용
+                choice = np.zeros(len(channels), dtype=np.int64)
+            elif final and stop == rows:
+                # 마지막 구간은 마지막 행을 그대로 사용
+                choice = np.full(len(channels), stop - start - 1, dtype=np.int64)
+            else:
+                # 다음 구간 평균점과 직전 선택 점으로 만든 삼각형 면적이 가장 큰 행 (채널별 동시 계산)
+                next_stop = min(stop + size, len(frame))
+                next_x = x[stop:next_stop].mean()
+                next_y = values[stop:next_stop].mean(axis=0)
+                area = np.abs((self.previous_x - next_x) * (values[start:stop] - self.previous_y)
+                              - (self.previous_x - x[start:stop, None]) * (next_y - self.previous_y))
+                choice = np.where(np.isnan(area), -1.0, area).argmax(axis=0)
+            self.previous_x = x[start + choice]
+            self.previous_y = values[start + choice, channels]
+            positions.append(start + choice)
+        return np.unique(np.concatenate(positions)) if positions else np.zeros(0, dtype=np.int64)
+
+def decimate_dataframe(df, target_points=DEFAULT_CHART_POINTS, method='minmax'):
+    """
+    메모리에 있는 처리 결과를 차트용으로 줄입니다.
+
+    Args:
+        df (pandas.DataFrame): 처리된 DataFrame ('Time' 열 포함)
+        target_points (int): 채널당 목표 점 수
+        method (str): 'minmax' 또는 'lttb'
+
+    Returns:
+        pandas.DataFrame: 차트용으로 줄인 DataFrame
+    """
+    decimator = ChartDecimator(len(df), target_points, method)
+    decimator.update(df)
+    return decimator.finish()
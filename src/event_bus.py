@@ -0,0 +1,82 @@
+import queue
+import traceback
+
+# 메인 스레드가 이벤트 큐를 확인하는 간격 (밀리초)
+POLL_INTERVAL_MS = 50
+
+class EventBus:
+    """
+    작업 스레드에서 Tk 메인 스레드로 화면 갱신을 전달하는 이벤트 통로.
+
+    Tk 위젯은 메인 스레드에서만 다뤄야 하므로, 작업 스레드는 call/progress로
+    큐에 넣기만 하고 바로 돌아갑니다 (화면 그리기를 기다리지 않음). 메인 스레드는
+    root.after로 일정 간격마다 큐를 비우며 받은 순서대로 실행합니다.
+
+    progress로 보낸 이벤트는 같은 채널이면 한 번의 확인 사이에 마지막 값만 실행하므로,
+    조각마다 진행률을 보내도 화면은 확인 간격마다 한 번만 갱신됩니다.
+    """
+    def __init__(self, root, interval_ms=POLL_INTERVAL_MS):
+        self.root = root
+        self.interval_ms = interval_ms
+        self.queue = queue.SimpleQueue()
+        self.after_id = None
+
+    def start(self):
+        """메인 스레드에서 주기적인 큐 확인을 시작합니다."""
+        if self.after_id is None:
+            self.after_id = self.root.after(self.interval_ms, self._poll)
+
+    def stop(self):
+        """큐 확인을 멈춥니다."""
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+
+    def call(self, callback, *args):
+        """callback(*args)를 메인 스레드에서 실행하도록 예약합니다 (어느 스레드에서나 호출 가능)."""
+        self.queue.put((None, callback, args))
+
+    def progress(self, callback, *args, channel='progress'):
+        """
+        진행률 갱신을 예약합니다. 같은 채널의 이벤트가 쌓여 있으면 마지막 것만 실행됩니다.
+
+        Args:
+            callback (callable): 메인 스레드에서 실행할 함수
+            *args: callback 인자
+            channel (str): 합칠 이벤트를 구분하는 이름
+        """
+        self.queue.put((channel, callback, args))
+
+    def drain(self):
+        """
+        쌓인 이벤트를 모두 실행합니다 (메인 스레드).
+
+        Returns:
+            int: 실행한 이벤트 수
+        """
+        events = []
+        while True:
+            try:
+                events.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        # 채널마다 마지막 진행률 이벤트의 위치만 남깁니다
+        last_index = {channel: i for i, (channel, _, _) in enumerate(events) if channel is not None}
+        executed = 0
+        for i, (channel, callback, args) in enumerate(events):
+            if channel is not None and last_index[channel] != i:
+                continue
+            try:
+                callback(*args)
+            except Exception:
+                # 화면 갱신 하나의 오류로 이벤트 전달이 멈추지 않도록 기록만 합니다
+                traceback.print_exc()
+            executed += 1
+        return executed
+
+    def _poll(self):
+        self.after_id = None
+        try:
+            self.drain()
+        finally:
+            self.start()
@@ -1,13 +1,49 @@
+import numpy as np
 import pandas as pd
 import os
+import re
 import sys
+from operator import itemgetter
+from openpyxl import load_workbook
+from output_writers import OUTPUT_FORMATS, open_writer, write_dataframe
+from labview_readers import read_lvm, read_tdms
+from instrumentation import PipelineStats
+from decimation import ChartDecimator, chart_output_path, count_csv_rows, decimate_dataframe
+from csv_backends import read_csv, sniff_csv
+from app_defaults import SUPPORTED_EXTENSIONS, unique_column_names
 
-def load_file(file_path):
+# 스트리밍 모드에서 한 번에 읽어 들이는 행 수
+DEFAULT_CHUNK_SIZE = 100_000
+
+# sample 값을 Time(초)으로 변환하는 계수
+TIME_FACTOR = 0.01
+
+# 이 크기 이상의 CSV 파일은 main()에서 자동으로 스트리밍 모드로 처리합니다
+STREAMING_THRESHOLD_BYTES = 200 * 1024 * 1024
+
+# 이 프로그램이 만든 출력 파일 이름의 끝부분 (전체 출력, 차트용 축소 파일, 채널 통계)
+OUTPUT_NAME_SUFFIXES = ('_processed', '_processed_chart', '_processed_stats')
+
+# 입력 파일 형식으로 출력할 수 없을 때(.lvm, .tdms) 쓰는 출력 확장자
+DEFAULT_OUTPUT_EXTENSION = '.xlsx'
+
+# 빠른 미리보기에 읽어 들이는 행 수
+PREVIEW_ROWS = 200
+
+class ProcessingCancelled(Exception):
+    """사용자가 진행 중인 처리를 취소했을 때 발생합니다."""
+
+def load_file(file_path, compact=False, sheet_name=None, csv_engine='auto'):
     """
-    엑셀 또는 CSV 파일을 pandas DataFrame으로 로드합니다.
+    엑셀, CSV 또는 LabVIEW 측정 파일(.lvm, .tdms)을 pandas DataFrame으로 로드합니다.
+    
+    CSV는 구분자, 소수점 기호, 인코딩, 헤더 행 위치를 파일 앞부분에서 추정합니다.
     
     Args:
         file_path (str): 파일 경로
+        compact (bool): True이면 compact_dtypes로 숫자 열의 자료형을 줄입니다
+        sheet_name (str): 엑셀 파일에서 읽을 시트 이름 (없으면 첫 번째 시트)
+        csv_engine (str): CSV 파서 ('auto', 'pyarrow', 'c')
         
     Returns:
         pandas.DataFrame: 로드된 데이터
@@ -18,21 +54,114 @@ def load_file(file_path):
     file_extension = os.path.splitext(file_path)[1].lower()
     
     try:
+        saved_bytes = 0
         if file_extension == '.xlsx':
-            df = pd.read_excel(file_path)
+            df = load_xlsx_projected(file_path, sheet_name)
+        elif file_extension == '.csv' and compact:
+            # 조각마다 자료형을 줄여 float64 전체 사본이 한꺼번에 생기지 않도록 합니다
+            # (조각 단위 읽기는 C 파서만 지원합니다)
+            csv_options = sniff_csv(file_path)
+            chunks = []
+            for chunk in pd.read_csv(file_path, chunksize=DEFAULT_CHUNK_SIZE, **csv_options):
+                chunk, saved = compact_dtypes(chunk)
+                chunks.append(chunk)
+                saved_bytes += saved
+            df = pd.concat(chunks, ignore_index=True) if chunks else pd.read_csv(file_path, **csv_options)
         elif file_extension == '.csv':
-            df = pd.read_csv(file_path)
+            df = read_csv(file_path, engine=csv_engine)
+        elif file_extension == '.lvm':
+            df = read_lvm(file_path)
+        elif file_extension == '.tdms':
+            df = read_tdms(file_path)
         else:
             raise ValueError(f"지원하지 않는 파일 형식입니다: {file_extension}")
         
         print(f"파일이 성공적으로 로드되었습니다: {file_path}")
         print(f"데이터 형태: {df.shape[0]}행 x {df.shape[1]}열")
+        if compact:
+            df, saved = compact_dtypes(df)
+            saved_bytes += saved
+            used_mb = df.memory_usage(index=False).sum() / (1024 * 1024)
+            print(f"메모리 절약 모드: {used_mb:,.1f} MB 사용 ({saved_bytes / (1024 * 1024):,.1f} MB 절약)")
         return df
         
     except Exception as e:
         print(f"파일 로드 중 오류가 발생했습니다: {e}")
         raise
 
+def list_sheets(file_path):
+    """
+    엑셀 파일에서 데이터가 있는 워크시트 이름을 순서대로 반환합니다.
+    
+    첫 행(헤더)이 비어 있는 시트와 차트 시트는 제외합니다.
+    
+    Args:
+        file_path (str): 엑셀 파일 경로
+        
+    Returns:
+        list: 시트 이름 목록
+    """
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        sheets = []
+        for worksheet in workbook.worksheets:
+            header = next(worksheet.iter_rows(max_row=1, values_only=True), None)
+            if header and any(value is not None for value in header):
+                sheets.append(worksheet.title)
+        return sheets
+    finally:
+        workbook.close()
+
+def load_xlsx_projected(file_path, sheet_name=None, max_rows=None):
+    """
+    엑셀 파일에서 처리 후 남게 될 열만 읽어 DataFrame으로 로드합니다.
+    
+    헤더 행을 먼저 읽어 select_columns로 유지할 열(첫 번째 'sample' 열과
+    데이터 채널)을 정한 뒤, 읽기 전용 모드로 행을 스트리밍하면서 해당 열의
+    값만 모읍니다. 중복 'sample' 열은 DataFrame으로 만들어지지 않습니다.
+    열 이름은 pd.read_excel처럼 빈 셀에 'Unnamed: i'를, 중복된 이름에 '.1', '.2'를
+    붙이는 것 외에는 원본 그대로 두므로 이후 처리 단계의 결과는 pd.read_excel과 같습니다.
+    
+    Args:
+        file_path (str): 엑셀 파일 경로
+        sheet_name (str): 시트 이름 (없으면 첫 번째 시트)
+        max_rows (int): 읽을 최대 데이터 행 수 (없으면 전체)
+        
+    Returns:
+        pandas.DataFrame: 유지할 열만 담긴 데이터
+
+    Raises:
+        ValueError: 시트의 첫 행(헤더)이 비어 있는 경우
+    """
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        worksheet = workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+        header = next(worksheet.iter_rows(max_row=1, values_only=True), None)
+        if not header or all(name is None for name in header):
+            raise ValueError(f"시트의 첫 행에 열 이름이 없습니다: {worksheet.title}")
+        
+        # 빈 헤더 셀과 중복된 이름은 pandas와 같은 방식으로 이름을 붙입니다
+        header = unique_column_names([f"Unnamed: {i}" if name is None else name
+                                      for i, name in enumerate(header)])
+        keep_positions, _, _ = select_columns(header)
+        
+        # 마지막으로 필요한 열 뒤쪽의 셀은 읽지 않습니다
+        rows = worksheet.iter_rows(min_row=2, max_row=max_rows + 1 if max_rows else None,
+                                   max_col=max(keep_positions) + 1, values_only=True)
+        if len(keep_positions) == 1:
+            position = keep_positions[0]
+            records = [(row[position],) for row in rows]
+        else:
+            records = list(map(itemgetter(*keep_positions), rows))
+        
+        # 뒤쪽의 완전히 빈 행 제거 (pd.read_excel과 동일)
+        while records and all(value is None for value in records[-1]):
+            records.pop()
+        
+        return pd.DataFrame.from_records(records, columns=[header[i] for i in keep_positions])
+    finally:
+        workbook.close()
+
 def clean_headers(df):
     """
     DataFrame의 헤더(열 이름)에서 앞뒤 공백을 제거합니다.
@@ -93,7 +222,7 @@ def add_time_column(df, sample_column_name):
         return df
     
     # Time 열 계산 (sample 값 * 0.01)
-    time_values = df[sample_column_name] * 0.01
+    time_values = df[sample_column_name] * TIME_FACTOR
     
     # 첫 번째 위치에 Time 열 삽입
     df.insert(0, 'Time', time_values)
@@ -101,23 +230,134 @@ def add_time_column(df, sample_column_name):
     print("'Time' 열이 성공적으로 추가되었습니다.")
     return df
 
-def save_processed_file(df, output_path):
+def compact_dtypes(df, int_floor=None):
+    """
+    숫자 열의 자료형을 측정 정밀도에 맞게 줄여 메모리와 출력 크기를 절약합니다.
+    
+    실수 채널 열은 float32로, 정수 열(sample 카운터)은 값 범위에 맞는 가장 작은
+    정수형으로 바꿉니다. 결측값 때문에 실수로 읽힌 'sample' 열은 정확한 값을
+    유지하도록 그대로 둡니다. 'Time' 열은 sample 열에서 float64로 계산되므로
+    이 함수는 'Time' 열을 추가하기 전(로드 직후)에 호출합니다.
+    
+    Args:
+        df (pandas.DataFrame): 처리할 DataFrame
+        int_floor (numpy.dtype): 정수 열의 최소 자료형 (조각마다 스키마가 같아야 하는
+            스트리밍 출력에서 np.int32 등으로 지정)
+        
+    Returns:
+        tuple: (자료형을 줄인 DataFrame, 절약한 바이트 수)
+    """
+    before = int(df.memory_usage(index=False).sum())
+    # 열 이름이 중복될 수 있으므로 위치로 바꿉니다
+    for position in range(df.shape[1]):
+        column = df.iloc[:, position]
+        if pd.api.types.is_float_dtype(column) and column.dtype != np.float32:
+            if 'sample' in str(df.columns[position]).lower():
+                continue
+            df.isetitem(position, column.astype(np.float32))
+        elif pd.api.types.is_integer_dtype(column) and not pd.api.types.is_bool_dtype(column):
+            compacted = pd.to_numeric(column, downcast='integer')
+            if int_floor is not None:
+                compacted = compacted.astype(np.promote_types(compacted.dtype, int_floor))
+            df.isetitem(position, compacted)
+    return df, before - int(df.memory_usage(index=False).sum())
+
+def process_data(df, require_sample=False):
+    """
+    헤더 정리, 'sample' 열 처리, 'Time' 열 추가를 차례로 수행합니다.
+    
+    Args:
+        df (pandas.DataFrame): 처리할 DataFrame
+        require_sample (bool): True이면 sample 열이 없을 때 오류를 발생시킵니다
+        
+    Returns:
+        pandas.DataFrame: 처리된 DataFrame
+    """
+    df = clean_headers(df)
+    df, sample_column_name = process_sample_columns(df)
+    if sample_column_name is None and require_sample:
+        raise ValueError("'sample'을 포함하는 열을 찾을 수 없습니다.")
+    return add_time_column(df, sample_column_name)
+
+def load_preview(file_path, nrows=PREVIEW_ROWS):
+    """
+    파일 앞부분 nrows 행만 읽어 처리한 미리보기 데이터를 만듭니다.
+    
+    CSV와 엑셀은 파일 크기와 관계없이 앞부분만 읽으므로 바로 반환됩니다.
+    앞부분만 읽을 수 없는 형식(.lvm, .tdms)은 None을 반환합니다.
+    
+    Args:
+        file_path (str): 파일 경로
+        nrows (int): 읽을 행 수
+        
+    Returns:
+        pandas.DataFrame: 처리된 앞부분 데이터 또는 None
+    """
+    file_extension = os.path.splitext(file_path)[1].lower()
+    if file_extension == '.csv':
+        chunks = iter_processed_csv_chunks(file_path, chunksize=nrows)
+        try:
+            return next(chunks, None)
+        finally:
+            chunks.close()
+    if file_extension == '.xlsx':
+        return process_data(load_xlsx_projected(file_path, max_rows=nrows))
+    return None
+
+def default_output_path(input_path, extension='.xlsx', output_dir=None, sheet_name=None):
+    """
+    입력 파일명 뒤에 '_processed'를 붙인 기본 출력 경로를 만듭니다.
+    
+    Args:
+        input_path (str): 입력 파일 경로
+        extension (str): 출력 파일 확장자
+        output_dir (str): 출력 폴더 (없으면 입력 파일과 같은 폴더)
+        sheet_name (str): 여러 시트 중 하나를 처리할 때의 시트 이름 ('{파일명}_{시트}_processed')
+        
+    Returns:
+        str: 출력 파일 경로
+    """
+    base_name = os.path.splitext(os.path.basename(input_path))[0]
+    if sheet_name:
+        # 파일 이름에 쓸 수 없는 문자는 '_'로 바꿉니다
+        safe_sheet = re.sub(r'[<>:"/\\|?*\s]+', '_', str(sheet_name)).strip('_') or 'sheet'
+        base_name = f"{base_name}_{safe_sheet}"
+    if output_dir is None:
+        output_dir = os.path.dirname(input_path)
+    return os.path.join(output_dir, f"{base_name}_processed{extension}")
+
+def output_extension_for(input_path, format_choice=None):
+    """
+    출력 형식 선택에 맞는 확장자를 정합니다.
+    
+    선택이 없으면 입력 파일과 같은 확장자를 쓰되, 출력할 수 없는 형식(.lvm, .tdms)이면
+    DEFAULT_OUTPUT_EXTENSION을 씁니다.
+    
+    Args:
+        input_path (str): 입력 파일 경로
+        format_choice (str): OUTPUT_FORMATS의 형식 이름 (없거나 알 수 없으면 입력과 같은 형식)
+        
+    Returns:
+        str: 출력 파일 확장자
+    """
+    if format_choice in OUTPUT_FORMATS:
+        return OUTPUT_FORMATS[format_choice]
+    extension = os.path.splitext(input_path)[1].lower()
+    return extension if extension in OUTPUT_FORMATS.values() else DEFAULT_OUTPUT_EXTENSION
+
+def save_processed_file(df, output_path, compression=None):
     """
     처리된 DataFrame을 파일로 저장합니다.
     
+    출력 형식(xlsx, csv, csv.gz, csv.zst, parquet, feather)은 확장자로 결정됩니다.
+    
     Args:
         df (pandas.DataFrame): 저장할 DataFrame
         output_path (str): 출력 파일 경로
+        compression (str): Parquet/Feather 압축 방식 (없으면 형식별 기본값)
     """
     try:
-        file_extension = os.path.splitext(output_path)[1].lower()
-        
-        if file_extension == '.xlsx':
-            df.to_excel(output_path, index=False)
-        elif file_extension == '.csv':
-            df.to_csv(output_path, index=False)
-        else:
-            raise ValueError(f"지원하지 않는 출력 파일 형식입니다: {file_extension}")
+        write_dataframe(df, output_path, compression=compression)
         
         print(f"처리된 파일이 성공적으로 저장되었습니다: {output_path}")
         
@@ -125,6 +365,180 @@ def save_processed_file(df, output_path):
         print(f"파일 저장 중 오류가 발생했습니다: {e}")
         raise
 
+def save_chart_file(df, output_path, target_points, method='minmax', compression=None):
+    """
+    처리된 DataFrame을 차트용으로 줄여 전체 출력 파일 옆에 '_chart' 파일로 저장합니다.
+    
+    Args:
+        df (pandas.DataFrame): 처리된 DataFrame
+        output_path (str): 전체 출력 파일 경로
+        target_points (int): 채널당 목표 점 수
+        method (str): 'minmax' 또는 'lttb'
+        compression (str): Parquet/Feather 압축 방식 (없으면 형식별 기본값)
+        
+    Returns:
+        str: 차트용 파일 경로
+    """
+    chart_path = chart_output_path(output_path)
+    chart_df = decimate_dataframe(df, target_points, method)
+    write_dataframe(chart_df, chart_path, compression=compression)
+    print(f"차트용 파일이 저장되었습니다: {chart_path} ({len(df)}행 → {len(chart_df)}행, {method})")
+    return chart_path
+
+def select_columns(columns):
+    """
+    원본 헤더 목록만으로 유지할 열을 결정합니다.
+    
+    clean_headers와 process_sample_columns가 DataFrame 전체에 하는 일을
+    헤더 단계에서 미리 계산하므로, 삭제될 열은 아예 읽지 않을 수 있습니다.
+    
+    Args:
+        columns (list): 원본 헤더(열 이름) 목록
+        
+    Returns:
+        tuple: (유지할 열 위치 목록, 정리된 열 이름 목록, sample 열 이름)
+    """
+    cleaned = [str(col).strip() for col in columns]
+    sample_positions = [i for i, col in enumerate(cleaned) if 'sample' in col.lower()]
+    dropped = set(sample_positions[1:])
+    
+    keep_positions = [i for i in range(len(cleaned)) if i not in dropped]
+    keep_names = [cleaned[i] for i in keep_positions]
+    sample_column_name = cleaned[sample_positions[0]] if sample_positions else None
+    return keep_positions, keep_names, sample_column_name
+
+def transform_chunk(chunk, column_names, sample_column_name):
+    """
+    열이 이미 선택된 데이터 조각에 정리된 헤더와 'Time' 열을 적용합니다.
+    
+    Args:
+        chunk (pandas.DataFrame): select_columns 결과대로 읽은 데이터 조각
+        column_names (list): 정리된 열 이름 목록
+        sample_column_name (str): sample 열 이름 (없으면 None)
+        
+    Returns:
+        pandas.DataFrame: 처리된 데이터 조각
+    """
+    chunk.columns = column_names
+    if sample_column_name is not None:
+        chunk.insert(0, 'Time', chunk[sample_column_name] * TIME_FACTOR)
+    return chunk
+
+def iter_processed_csv_chunks(file_path, chunksize=DEFAULT_CHUNK_SIZE, require_sample=False,
+                              progress_callback=None, compact=False):
+    """
+    CSV 파일을 일정 크기의 조각으로 읽으면서 처리된 조각을 차례로 반환합니다.
+    
+    헤더만 먼저 읽어 남길 열을 정한 뒤, 삭제될 sample 열은 파싱하지 않습니다.
+    구분자, 소수점 기호, 인코딩, 헤더 행 위치는 sniff_csv로 추정합니다.
+    정수로 읽힌 채널 열은 조각마다 float64(compact이면 float32)로 바꾸므로, 앞 조각에
+    정수만 있다가 뒤 조각에 소수가 나와도 Parquet/Feather 출력의 스키마가 어긋나지
+    않습니다. 문자열 열은 그대로 둡니다.
+    
+    Args:
+        file_path (str): CSV 파일 경로
+        chunksize (int): 조각당 행 수
+        require_sample (bool): True이면 sample 열이 없을 때 오류를 발생시킵니다
+        progress_callback (callable): 조각마다 (누적 행 수, 읽은 바이트, 전체 바이트)로 호출
+        compact (bool): True이면 조각마다 compact_dtypes를 적용합니다 (정수 열은 최소 int32)
+        
+    Yields:
+        pandas.DataFrame: 헤더 정리, sample 열 처리, Time 열 추가가 끝난 조각
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
+    if os.path.splitext(file_path)[1].lower() != '.csv':
+        raise ValueError(f"스트리밍 모드는 CSV 파일만 지원합니다: {file_path}")
+    
+    csv_options = sniff_csv(file_path)
+    header = pd.read_csv(file_path, nrows=0, **csv_options).columns
+    keep_positions, keep_names, sample_column_name = select_columns(header)
+    if sample_column_name is None:
+        if require_sample:
+            raise ValueError("'sample'을 포함하는 열을 찾을 수 없습니다.")
+        print("경고: 'sample'을 포함하는 열을 찾을 수 없습니다.")
+    channel_dtype = np.float32 if compact else np.float64
+    # 읽은 조각의 열 순서는 keep_positions(오름차순)와 같습니다
+    channel_positions = [i for i, name in enumerate(keep_names) if name != sample_column_name]
+    
+    total_bytes = os.path.getsize(file_path)
+    rows_read = 0
+    with open(file_path, 'rb') as f:
+        reader = pd.read_csv(f, usecols=keep_positions, chunksize=chunksize, **csv_options)
+        with reader:
+            for chunk in reader:
+                rows_read += len(chunk)
+                if progress_callback is not None:
+                    # 파서가 버퍼 단위로 읽으므로 바이트 위치는 근사값입니다
+                    progress_callback(rows_read, min(f.tell(), total_bytes), total_bytes)
+                for position in channel_positions:
+                    column = chunk.iloc[:, position]
+                    if pd.api.types.is_integer_dtype(column) and not pd.api.types.is_bool_dtype(column):
+                        chunk.isetitem(position, column.astype(channel_dtype))
+                if compact:
+                    # 조각마다 정수 자료형이 달라지면 Parquet 등의 스키마가 어긋나므로 int32 이상으로 고정
+                    chunk, _ = compact_dtypes(chunk, int_floor=np.int32)
+                yield transform_chunk(chunk, keep_names, sample_column_name)
+
+def process_file_streaming(input_path, output_path, chunksize=DEFAULT_CHUNK_SIZE, require_sample=False,
+                           progress_callback=None, cancel_event=None, compact=False,
+                           chart_points=None, chart_method='minmax', channel_stats=None, compression=None):
+    """
+    CSV 파일을 조각 단위로 처리하여 곧바로 출력 파일에 이어 씁니다.
+    
+    파일 길이와 관계없이 최대 메모리 사용량은 조각 크기에만 비례합니다.
+    출력 형식은 확장자로 결정됩니다 (output_writers.OUTPUT_FORMATS 참고).
+    
+    Args:
+        input_path (str): 입력 CSV 파일 경로
+        output_path (str): 출력 파일 경로
+        chunksize (int): 조각당 행 수
+        require_sample (bool): True이면 sample 열이 없을 때 오류를 발생시킵니다
+        progress_callback (callable): 조각마다 (누적 행 수, 읽은 바이트, 전체 바이트)로 호출
+        cancel_event (threading.Event): 설정되면 다음 조각 전에 중단하고 출력 파일을 지웁니다
+        compact (bool): True이면 채널 열을 float32, 정수 열을 int32로 줄여 저장합니다
+        chart_points (int): 지정하면 같은 흐름에서 차트용 '_chart' 파일도 만듭니다 (채널당 점 수)
+        chart_method (str): 차트용 축소 방식 ('minmax' 또는 'lttb')
+        channel_stats (ChannelStats): 지정하면 조각마다 채널 통계를 함께 계산합니다
+        compression (str): Parquet/Feather 압축 방식 (없으면 형식별 기본값)
+        
+    Returns:
+        int: 처리된 전체 행 수
+    """
+    try:
+        # 구간 크기를 정하기 위해 행 수만 먼저 셉니다 (파싱 없이 줄바꿈 개수만 확인)
+        decimator = ChartDecimator(count_csv_rows(input_path), chart_points, chart_method) if chart_points else None
+        with open_writer(output_path, compression=compression) as writer:
+            for chunk in iter_processed_csv_chunks(input_path, chunksize, require_sample, progress_callback,
+                                                   compact):
+                if cancel_event is not None and cancel_event.is_set():
+                    raise ProcessingCancelled("처리가 취소되었습니다.")
+                writer.write(chunk)
+                if decimator is not None:
+                    decimator.update(chunk)
+                if channel_stats is not None:
+                    channel_stats.update(chunk)
+        total_rows = writer.rows_written
+        
+        print(f"스트리밍 처리가 완료되었습니다: {output_path} ({total_rows}행)")
+        if decimator is not None:
+            chart_path = chart_output_path(output_path)
+            chart_df = decimator.finish()
+            write_dataframe(chart_df, chart_path, compression=compression)
+            print(f"차트용 파일이 저장되었습니다: {chart_path} ({total_rows}행 → {len(chart_df)}행, {chart_method})")
+        return total_rows
+        
+    except ProcessingCancelled:
+        # 중간까지 쓴 출력 파일은 남기지 않습니다
+        if os.path.exists(output_path):
+            os.remove(output_path)
+        print(f"스트리밍 처리가 취소되었습니다: {input_path}")
+        raise
+        
+    except Exception as e:
+        print(f"스트리밍 처리 중 오류가 발생했습니다: {e}")
+        raise
+
 def main():
     """
     메인 함수: 전체 프로세스를 실행합니다.
@@ -136,16 +550,34 @@ def main():
     try:
         # 1. 파일 로드
         input_file_path = input("처리할 파일 경로를 입력하세요: ").strip()
-        df = load_file(input_file_path)
+        
+        # 대용량 CSV는 전체를 메모리에 올리지 않고 스트리밍으로 바로 저장
+        if (input_file_path.lower().endswith('.csv') and os.path.exists(input_file_path)
+                and os.path.getsize(input_file_path) >= STREAMING_THRESHOLD_BYTES):
+            print("대용량 CSV 파일이므로 스트리밍 모드로 처리합니다.")
+            base_name = os.path.splitext(os.path.basename(input_file_path))[0]
+            output_file_path = os.path.join(os.path.dirname(input_file_path), f"{base_name}_processed.csv")
+            process_file_streaming(input_file_path, output_file_path)
+            print("\n프로그램이 성공적으로 완료되었습니다!")
+            return
+        
+        stats = PipelineStats(input_file_path)
+        with stats.stage('load') as record:
+            df = load_file(input_file_path)
+            record['rows'] = len(df)
+            record['bytes_read'] = os.path.getsize(input_file_path)
         
         # 2. 헤더 정리
-        df = clean_headers(df)
+        with stats.stage('clean', rows=len(df)):
+            df = clean_headers(df)
         
         # 3. 'sample' 열 처리
-        df, sample_column_name = process_sample_columns(df)
+        with stats.stage('sample', rows=len(df)):
+            df, sample_column_name = process_sample_columns(df)
         
         # 4. 'Time' 열 삽입 및 계산
-        df = add_time_column(df, sample_column_name)
+        with stats.stage('time', rows=len(df)):
+            df = add_time_column(df, sample_column_name)
         
         # 5. 결과 출력
         print("\n" + "=" * 50)
@@ -159,10 +591,15 @@ def main():
             if save_choice in ['y', 'yes', '예']:
                 output_file_path = input("저장할 파일 경로를 입력하세요 (엔터 시 자동 저장): ").strip()
                 if not output_file_path:
-                    # 기존 파일명 뒤에 _processed 붙이기
-                    base_name, ext = os.path.splitext(os.path.basename(input_file_path))
+                    # 기존 파일명 뒤에 _processed 붙이기 (출력 형식 선택 가능)
+                    base_name = os.path.splitext(os.path.basename(input_file_path))[0]
+                    format_choice = input(f"출력 형식을 선택하세요 ({'/'.join(OUTPUT_FORMATS)}, "
+                                          f"엔터 시 원본과 동일, .lvm/.tdms는 xlsx): ").strip().lower()
+                    ext = output_extension_for(input_file_path, format_choice)
                     output_file_path = f"{base_name}_processed{ext}"
-                save_processed_file(df, output_file_path)
+                with stats.stage('save', rows=len(df)) as record:
+                    save_processed_file(df, output_file_path)
+                    record['bytes_written'] = os.path.getsize(output_file_path)
                 break
             elif save_choice in ['n', 'no', '아니오']:
                 print("파일 저장을 건너뜁니다.")
@@ -170,6 +607,11 @@ def main():
             else:
                 print("y(예) 또는 n(아니오)로 입력해 주세요.")
         
+        print("\n" + "=" * 50)
+        print("단계별 처리 통계")
+        print("=" * 50)
+        print(stats.format_table())
+        
         print("\n프로그램이 성공적으로 완료되었습니다!")
         
     except KeyboardInterrupt:
@@ -0,0 +1,226 @@
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+import multiprocessing
+from contextlib import redirect_stdout
+
+from excel_processor import DEFAULT_CHUNK_SIZE, OUTPUT_NAME_SUFFIXES, SUPPORTED_EXTENSIONS
+from batch_processor import default_worker_count, run_batch
+from output_writers import OUTPUT_FORMATS
+from app_defaults import OUTPUT_COMPRESSIONS
+from decimation import DECIMATION_METHODS
+from channel_stats import STATS_FORMATS
+from merge_exports import merge_files
+from csv_backends import CSV_ENGINES
+
+def is_processed_output(file_path):
+    """이 프로그램이 만든 '_processed' 출력 파일(차트용 파일, 채널 통계 포함)인지 확인합니다."""
+    return os.path.splitext(os.path.basename(file_path))[0].endswith(OUTPUT_NAME_SUFFIXES)
+
+def natural_sort_key(path):
+    """'run_2.csv'가 'run_10.csv'보다 앞에 오도록 숫자 부분은 크기로 비교하는 정렬 키"""
+    return [int(part) if part.isdigit() else part.lower() for part in re.split(r'(\d+)', path)]
+
+def collect_input_files(patterns, recursive=False):
+    """
+    파일, glob 패턴, 폴더 목록을 실제 입력 파일 목록으로 펼칩니다.
+
+    폴더와 glob 패턴에서는 지원하는 확장자의 파일만 고르고 '_processed' 출력 파일은
+    제외합니다. 같은 파일이 여러 번 지정되면 한 번만 처리합니다.
+
+    Args:
+        patterns (list): 파일 경로, glob 패턴 또는 폴더 경로 목록
+        recursive (bool): 폴더를 하위 폴더까지 검색할지 여부 (glob의 '**'도 허용)
+
+    Returns:
+        list: 입력 파일 경로 목록 (지정 순서, 폴더/패턴 안은 이름 순이며 숫자는 크기 순)
+    """
+    files = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            if recursive:
+                found = [os.path.join(root, name)
+                         for root, _, names in os.walk(pattern) for name in names]
+            else:
+                found = [os.path.join(pattern, name) for name in os.listdir(pattern)]
+        elif glob.has_magic(pattern):
+            found = glob.glob(pattern, recursive=recursive)
+        else:
+            # 존재하지 않는 파일도 그대로 넘겨 결과에 오류로 기록되게 합니다
+            files.append(pattern)
+            continue
+        files.extend(sorted((path for path in found
+                             if os.path.isfile(path)
+                             and path.lower().endswith(SUPPORTED_EXTENSIONS)
+                             and not is_processed_output(path)), key=natural_sort_key))
+
+    unique = []
+    seen = set()
+    for path in files:
+        key = os.path.normcase(os.path.abspath(path))
+        if key not in seen:
+            seen.add(key)
+            unique.append(path)
+    return unique
+
+def build_parser():
+    """명령줄 인자 정의"""
+    parser = argparse.ArgumentParser(
+        description="Labview waveform chart data processor - 비대화형 일괄 처리",
+    )
+    parser.add_argument('inputs', nargs='+',
+                        help="입력 파일, glob 패턴(예: 'data/*.csv') 또는 폴더")
+    parser.add_argument('-r', '--recursive', action='store_true',
+                        help="폴더를 하위 폴더까지 검색하고 glob의 '**'를 허용합니다")
+    parser.add_argument('-o', '--output-dir', default=None,
+                        help="출력 폴더 (기본값: 입력 파일과 같은 폴더)")
+    parser.add_argument('-f', '--format', choices=list(OUTPUT_FORMATS), default='xlsx',
+                        help="출력 형식 (기본값: xlsx, csv.gz/csv.zst는 압축 CSV)")
+    parser.add_argument('--compression', choices=list(OUTPUT_COMPRESSIONS), default=None,
+                        help="Parquet/Feather 압축 방식 (기본값: Parquet은 snappy, Feather는 압축 안 함)")
+    parser.add_argument('-j', '--workers', type=int, default=default_worker_count(),
+                        help="작업자 프로세스 수 (기본값: CPU 코어 수)")
+    parser.add_argument('--stream', action='store_true',
+                        help="CSV 입력을 조각 단위로 스트리밍 처리합니다")
+    parser.add_argument('--pipeline', action='store_true',
+                        help="작업자 프로세스 대신 읽기/변환/쓰기를 겹쳐 실행하는 파이프라인으로 처리합니다 "
+                             "(-j 무시, 느린 네트워크 공유 폴더에 쓸 때 유리)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"스트리밍 조각당 행 수 (기본값: {DEFAULT_CHUNK_SIZE})")
+    parser.add_argument('--csv-engine', choices=list(CSV_ENGINES), default='auto',
+                        help="CSV 파서: auto(pyarrow 다중 스레드, 실패 시 C 파서), pyarrow, c (기본값: auto)")
+    parser.add_argument('--compact', action='store_true',
+                        help="채널 열을 float32, sample 열을 작은 정수형으로 줄여 메모리와 출력 크기를 절약합니다")
+    parser.add_argument('--chart-points', type=int, default=None,
+                        help="채널당 이 점 수로 줄인 차트용 '_chart' 파일도 함께 저장합니다")
+    parser.add_argument('--chart-method', choices=list(DECIMATION_METHODS), default='minmax',
+                        help="차트용 축소 방식: minmax(피크 보존) 또는 lttb(파형 모양 보존)")
+    policy = parser.add_mutually_exclusive_group()
+    policy.add_argument('--fail-fast', dest='fail_fast', action='store_true',
+                        help="첫 오류가 나면 남은 파일을 건너뜁니다")
+    policy.add_argument('--continue', dest='fail_fast', action='store_false',
+                        help="오류가 나도 남은 파일을 계속 처리합니다 (기본값)")
+    parser.add_argument('--force', action='store_true',
+                        help="처리 기록과 관계없이 모든 파일을 다시 처리합니다")
+    parser.add_argument('--no-skip', dest='skip_unchanged', action='store_false',
+                        help="처리 기록을 사용하지 않습니다 (기록도 남기지 않음)")
+    parser.add_argument('--hash', dest='use_hash', action='store_true',
+                        help="처리 기록에 입력 파일 내용 해시를 남기고 비교합니다")
+    parser.add_argument('--first-sheet', dest='all_sheets', action='store_false',
+                        help="엑셀 파일의 첫 번째 시트만 처리합니다 (기본값: 데이터가 있는 모든 시트를 각각 처리)")
+    parser.add_argument('--channel-stats', choices=list(STATS_FORMATS), default=None,
+                        help="채널별 min/max/mean/RMS/std를 '_processed_stats' 파일(json 또는 csv)로 함께 저장합니다")
+    parser.add_argument('--merge', metavar='OUTPUT', default=None,
+                        help="입력 파일들을 주어진 순서대로 Time이 이어지는 하나의 파일로 합쳐 OUTPUT에 저장합니다 "
+                             "(예: merged.parquet)")
+    parser.add_argument('--stats-log', default=None,
+                        help="파일별 단계 통계를 JSON Lines 형식으로 이 파일에 기록합니다 ('-'이면 표준 오류)")
+    parser.add_argument('--summary', default=None,
+                        help="JSON 요약을 표준 출력 대신 이 파일에 씁니다")
+    return parser
+
+def run_merge(files, args):
+    """--merge 모드: 여러 파일을 하나로 합치고 JSON 요약을 출력합니다."""
+    output_path = args.merge
+    if args.output_dir and not os.path.isabs(output_path):
+        os.makedirs(args.output_dir, exist_ok=True)
+        output_path = os.path.join(args.output_dir, output_path)
+
+    def on_file_done(done, total, rows):
+        print(f"[{done}/{total}] 합침: {files[done - 1]} (누적 {rows}행)", file=sys.stderr)
+
+    try:
+        with redirect_stdout(sys.stderr):
+            summary = merge_files(files, output_path, args.chunk_size, compact=args.compact,
+                                  progress_callback=on_file_done, compression=args.compression)
+        summary['inputs'] = files
+        summary['error'] = None
+    except Exception as e:
+        summary = {'output': None, 'files': len(files), 'rows': 0, 'inputs': files,
+                   'error': f"{type(e).__name__}: {e}"}
+
+    report = json.dumps(summary, ensure_ascii=False, indent=2)
+    if args.summary:
+        with open(args.summary, 'w', encoding='utf-8') as f:
+            f.write(report)
+    else:
+        print(report)
+    return 1 if summary['error'] else 0
+
+def main(argv=None):
+    """
+    비대화형 일괄 처리 진입점.
+
+    처리 결과 요약을 JSON으로 출력하며, 실패한 파일이 있으면 종료 코드 1,
+    입력 파일이 없으면 2를 반환합니다. 처리 중 메시지는 표준 오류로 보냅니다.
+    """
+    args = build_parser().parse_args(argv)
+
+    files = collect_input_files(args.inputs, args.recursive)
+    if not files:
+        print("처리할 파일을 찾을 수 없습니다.", file=sys.stderr)
+        return 2
+
+    if args.merge:
+        return run_merge(files, args)
+
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    options = {
+        'output_extension': OUTPUT_FORMATS[args.format],
+        'output_dir': args.output_dir,
+        'compression': args.compression,
+        'streaming': args.stream,
+        'chunk_size': args.chunk_size,
+        'csv_engine': args.csv_engine,
+        'compact': args.compact,
+        'chart_points': args.chart_points,
+        'chart_method': args.chart_method,
+        'stats_format': args.channel_stats,
+        'all_sheets': args.all_sheets,
+        'log_to_stderr': True,
+        'skip_unchanged': args.skip_unchanged,
+        'force': args.force,
+        'use_hash': args.use_hash,
+        'pipeline': args.pipeline,
+    }
+
+    stats_log = None
+    if args.stats_log == '-':
+        stats_log = sys.stderr
+    elif args.stats_log:
+        stats_log = open(args.stats_log, 'a', encoding='utf-8')
+
+    def on_file_done(done, total, result):
+        status = "실패" if result['error'] else "건너뜀(변경 없음)" if result['cached'] else "완료"
+        sheet = f" [{result['sheet']}]" if result['sheet'] else ""
+        print(f"[{done}/{total}] {status}: {result['input']}{sheet}", file=sys.stderr)
+        if stats_log:
+            record = {key: result[key] for key in ('input', 'sheet', 'output', 'rows', 'bytes_read', 'bytes_written',
+                                                   'seconds', 'stages', 'cached', 'error')}
+            stats_log.write(json.dumps(record, ensure_ascii=False) + '\n')
+            stats_log.flush()
+
+    try:
+        summary = run_batch(files, options, workers=args.workers,
+                            progress_callback=on_file_done, fail_fast=args.fail_fast)
+    finally:
+        if stats_log and stats_log is not sys.stderr:
+            stats_log.close()
+
+    report = json.dumps(summary, ensure_ascii=False, indent=2)
+    if args.summary:
+        with open(args.summary, 'w', encoding='utf-8') as f:
+            f.write(report)
+    else:
+        print(report)
+
+    return 1 if summary['failed'] else 0
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -1,13 +1,24 @@
+# 시작 시간 측정 기준점이 되도록 가장 먼저 불러옵니다
+from startup_profile import StartupProfile
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import pandas as pd
 import os
-import sys
-import json
 import threading
+import multiprocessing
 import time
-from typing import Optional, List
-from tkinterdnd2 import DND_FILES, TkinterDnD
+# 창을 띄우는 데 필요한 모듈만 여기서 불러오고, pandas/numpy/openpyxl을 쓰는 처리 모듈은
+# 첫 화면이 그려진 뒤 백그라운드에서 미리 불러오거나 처음 필요할 때 각 메서드에서 불러옵니다
+from app_defaults import (DECIMATION_METHODS, DEFAULT_CHART_POINTS, OUTPUT_FORMATS, SUPPORTED_EXTENSIONS,
+                          default_worker_count)
+from instrumentation import PipelineStats, estimate_remaining_seconds, format_duration
+from event_bus import EventBus
+from virtual_preview import CsvFileSource, DataFrameSource, VirtualTable
+
+# 첫 화면 표시 후 백그라운드에서 미리 불러올 처리 모듈 (의존성 순서대로)
+BACKEND_MODULES = ('numpy', 'pandas', 'openpyxl', 'excel_processor', 'batch_processor', 'channel_stats',
+                   'dataset_cache')
+
+STARTUP = StartupProfile()
 
 # 스타일 및 폰트 개선
 MODERN_FONT = ('Inter', 13)
@@ -29,6 +40,31 @@ class ModernExcelProcessorGUI:
         self.df = None
         self.processed_df = None
         self.selected_file_path = ""
+        # 대용량 CSV를 조각 단위로 처리할지 여부
+        self.streaming_mode = tk.BooleanVar(value=False)
+        # 다중 파일 일괄 처리에 사용할 작업자 프로세스 수
+        self.worker_count = tk.IntVar(value=default_worker_count())
+        # 처리 기록과 관계없이 일괄 처리 대상을 모두 다시 처리할지 여부
+        self.force_reprocess = tk.BooleanVar(value=False)
+        # 채널 열을 float32로 줄여 메모리를 절약할지 여부
+        self.compact_mode = tk.BooleanVar(value=False)
+        # 차트용 축소 파일('_chart')을 함께 저장할지 여부, 축소 방식, 채널당 점 수
+        self.chart_enabled = tk.BooleanVar(value=False)
+        self.chart_method = tk.StringVar(value='minmax')
+        self.chart_points = tk.IntVar(value=DEFAULT_CHART_POINTS)
+        # 채널별 min/max/mean/RMS/std를 '_stats.json'으로 함께 저장할지 여부
+        self.channel_stats_enabled = tk.BooleanVar(value=False)
+        # 처리 결과를 열별 메모리 맵 캐시에 남겨 같은 파일을 다시 열 때 바로 보여 줄지 여부
+        self.cache_enabled = tk.BooleanVar(value=True)
+        self.dataset_cache = None
+        # 빠른 저장/일괄 처리 출력 형식
+        self.output_format = tk.StringVar(value='xlsx')
+        # 단일 파일 백그라운드 처리 스레드와 취소 신호
+        self.single_job = None
+        self.cancel_event = None
+        # 작업 스레드 → 화면 갱신 이벤트 통로 (작업 스레드는 위젯을 직접 다루지 않음)
+        self.events = EventBus(root)
+        self.events.start()
         self.setup_gui()
 
     def setup_modern_theme(self):
@@ -83,6 +119,22 @@ class ModernExcelProcessorGUI:
         self.file_label.grid(row=1, column=1, sticky='w')
         drag_label = ttk.Label(card, text="💡 파일을 여기에 드래그 앤 드롭하거나 버튼을 클릭하세요", style='Subtitle.TLabel')
         drag_label.grid(row=2, column=0, columnspan=2, pady=(10, 0))
+        mode_frame = ttk.Frame(card, style='Card.TFrame')
+        mode_frame.grid(row=3, column=0, columnspan=2, sticky='w', pady=(10, 0))
+        ttk.Checkbutton(mode_frame, text="대용량 CSV 스트리밍 모드", variable=self.streaming_mode).pack(side='left')
+        ttk.Checkbutton(mode_frame, text="메모리 절약 모드 (채널 float32)", variable=self.compact_mode).pack(side='left', padx=(20, 0))
+        ttk.Checkbutton(mode_frame, text="차트용 축소 파일", variable=self.chart_enabled).pack(side='left', padx=(20, 10))
+        ttk.Combobox(mode_frame, values=list(DECIMATION_METHODS), width=7, state='readonly', textvariable=self.chart_method).pack(side='left')
+        ttk.Spinbox(mode_frame, from_=100, to=1_000_000, increment=1000, width=8, textvariable=self.chart_points).pack(side='left', padx=(10, 0))
+        ttk.Checkbutton(mode_frame, text="채널 통계 저장", variable=self.channel_stats_enabled).pack(side='left', padx=(20, 0))
+        worker_frame = ttk.Frame(card, style='Card.TFrame')
+        worker_frame.grid(row=4, column=0, columnspan=2, sticky='w', pady=(10, 0))
+        ttk.Label(worker_frame, text="일괄 처리 작업자 수", style='Subtitle.TLabel').pack(side='left', padx=(0, 10))
+        ttk.Spinbox(worker_frame, from_=1, to=default_worker_count(), width=5, textvariable=self.worker_count).pack(side='left')
+        ttk.Label(worker_frame, text="출력 형식", style='Subtitle.TLabel').pack(side='left', padx=(20, 10))
+        ttk.Combobox(worker_frame, values=list(OUTPUT_FORMATS), width=8, state='readonly', textvariable=self.output_format).pack(side='left')
+        ttk.Checkbutton(worker_frame, text="강제 재처리 (변경 없는 파일도 다시 처리)", variable=self.force_reprocess).pack(side='left', padx=(20, 0))
+        ttk.Checkbutton(worker_frame, text="다시 열기 캐시", variable=self.cache_enabled).pack(side='left', padx=(20, 0))
         self.file_select_card = card
 
     def create_progress_card(self, parent):
@@ -93,8 +145,17 @@ class ModernExcelProcessorGUI:
         title.grid(row=0, column=0, sticky='w', pady=(0, 10))
         self.progress_bar = ttk.Progressbar(card, style='Modern.Horizontal.TProgressbar', mode='determinate', length=400)
         self.progress_bar.grid(row=1, column=0, sticky='ew', pady=(0, 10))
+        self.cancel_btn = ttk.Button(card, text="취소", command=self.cancel_processing, state='disabled')
+        self.cancel_btn.grid(row=1, column=1, padx=(15, 0), pady=(0, 10))
         self.progress_label = ttk.Label(card, text="대기 중...", style='Status.TLabel')
         self.progress_label.grid(row=2, column=0, sticky='w')
+        # 단계별 처리 통계 (시간, 처리 속도, 최대 메모리, 입출력 크기)
+        stats_columns = ("stage", "seconds", "rows_per_second", "peak_rss", "bytes")
+        self.stats_tree = ttk.Treeview(card, style='Modern.Treeview', columns=stats_columns, show="headings", height=4)
+        for col, text, width in zip(stats_columns, ("단계", "시간(초)", "행/초", "최대 RSS(MB)", "입출력(MB)"), (100, 90, 120, 110, 110)):
+            self.stats_tree.heading(col, text=text)
+            self.stats_tree.column(col, width=width, minwidth=60, anchor='e' if col != "stage" else 'w')
+        self.stats_tree.grid(row=3, column=0, sticky='ew', pady=(10, 0))
 
     def create_preview_card(self, parent):
         card = ttk.Frame(parent, style='Card.TFrame', padding=24)
@@ -103,19 +164,11 @@ class ModernExcelProcessorGUI:
         card.rowconfigure(0, weight=1)
         title = ttk.Label(card, text="👁️ 데이터 미리보기", style='Title.TLabel')
         title.grid(row=0, column=0, sticky='w', pady=(0, 10))
-        # 미리보기 테이블에만 스크롤 적용
-        tree_frame = ttk.Frame(card, style='Card.TFrame')
-        tree_frame.grid(row=1, column=0, sticky='nsew')
-        tree_frame.columnconfigure(0, weight=1)
-        tree_frame.rowconfigure(0, weight=1)
-        self.tree = ttk.Treeview(tree_frame, style='Modern.Treeview', show="headings", height=12)
-        vsb = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
-        hsb = ttk.Scrollbar(tree_frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
-        self.tree.grid(row=0, column=0, sticky='nsew')
-        vsb.grid(row=0, column=1, sticky='ns')
-        hsb.grid(row=1, column=0, sticky='ew')
-        self.tree.insert("", "end", values=["파일을 선택하거나 드래그 앤 드롭해주세요."])
+        # 미리보기 테이블에만 스크롤 적용 (보이는 행만 가져오는 가상 스크롤)
+        self.preview_table = VirtualTable(card, style='Modern.Treeview', height=12)
+        self.preview_table.grid(row=1, column=0, sticky='nsew')
+        self.tree = self.preview_table.tree
+        self.preview_table.show_message("파일을 선택하거나 드래그 앤 드롭해주세요.")
 
     def create_status_bar(self, parent):
         status = ttk.Frame(parent, style='Card.TFrame', padding=(0, 8))
@@ -130,8 +183,18 @@ class ModernExcelProcessorGUI:
         """진행 상황 업데이트"""
         self.progress_bar['value'] = value
         self.progress_label.config(text=message)
-        self.root.update()
         
+    def update_stats_panel(self, stages):
+        """단계별 처리 통계 표시"""
+        for item in self.stats_tree.get_children():
+            self.stats_tree.delete(item)
+        for name, stage in stages.items():
+            rate = f"{stage['rows_per_second']:,.0f}" if stage['rows_per_second'] else "-"
+            peak = f"{stage['peak_rss_mb']:,.0f}" if stage['peak_rss_mb'] is not None else "-"
+            io_bytes = (stage['bytes_read'] or 0) + (stage['bytes_written'] or 0)
+            io_text = f"{io_bytes / (1024 * 1024):,.1f}" if io_bytes else "-"
+            self.stats_tree.insert("", "end", values=(name, f"{stage['seconds']:.3f}", rate, peak, io_text))
+
     def refresh_interface(self):
         """인터페이스 새로고침"""
         self.update_status("인터페이스가 새로고침되었습니다.")
@@ -142,6 +205,7 @@ class ModernExcelProcessorGUI:
             filetypes=[
                 ("Excel files", "*.xlsx"),
                 ("CSV files", "*.csv"),
+                ("LabVIEW files", "*.lvm *.tdms"),
                 ("All files", "*.*")
             ]
         )
@@ -157,51 +221,103 @@ class ModernExcelProcessorGUI:
         if not hasattr(self, 'file_queue') or not self.file_queue:
             self.update_status("대기열이 비어 있습니다.")
             return
-        self.current_file_index = 0
         self.total_files = len(self.file_queue)
-        self.process_next_file()
-
-    def process_next_file(self):
-        if self.current_file_index >= self.total_files:
-            self.update_status("모든 파일 처리가 완료되었습니다.")
-            self.progress_bar['value'] = 100
-            return
-        file_path = self.file_queue[self.current_file_index]
-        self.selected_file_path = file_path
-        self.file_label.config(text=f"처리 중: {os.path.basename(file_path)} ({self.current_file_index+1}/{self.total_files})")
-        self.progress_bar['value'] = (self.current_file_index / self.total_files) * 100
-        thread = threading.Thread(target=self._process_and_quick_save_current_file)
+        workers = self.worker_count.get()
+        self.file_label.config(text=f"일괄 처리 중: {self.total_files}개 파일 (작업자 {workers}개, 여러 시트는 시트별 처리)")
+        self.progress_bar['value'] = 0
+        self.progress_label.config(text=f"0/{self.total_files} 완료")
+        options = self.processing_options()
+        options['force'] = self.force_reprocess.get()
+        thread = threading.Thread(target=self._process_file_queue_in_background, args=(list(self.file_queue), options, workers))
         thread.daemon = True
         thread.start()
 
-    def _process_and_quick_save_current_file(self):
+    def _process_file_queue_in_background(self, file_paths, options, workers):
+        """대기열 전체를 프로세스 풀에서 병렬 처리 (백그라운드 스레드)"""
+        start = time.perf_counter()
+        # 두 콜백 모두 run_batch를 호출한 이 스레드에서 실행됩니다
+        state = {'done': 0, 'cached': 0, 'total': len(file_paths)}
+        # 처리 중인 작업(입력 파일, 시트)별 읽은 비율 (스트리밍 모드)
+        in_progress = {}
+
+        def fraction_done():
+            # 처리 기록으로 건너뛴 작업은 시간이 들지 않으므로 남은 시간 추정에서 뺍니다
+            work = state['total'] - state['cached']
+            if work <= 0:
+                return 1.0
+            return min((state['done'] - state['cached'] + sum(in_progress.values())) / work, 1.0)
+
+        def remaining_text():
+            remaining = estimate_remaining_seconds(time.perf_counter() - start, fraction_done())
+            return f"남은 시간 약 {format_duration(remaining)}"
+
+        def on_chunk(path, sheet_name, rows, bytes_read, total_bytes):
+            in_progress[(path, sheet_name)] = bytes_read / total_bytes if total_bytes else 0.0
+            name = os.path.basename(path) + (f" [{sheet_name}]" if sheet_name else "")
+            percent = (state['done'] + sum(in_progress.values())) / state['total'] * 100
+            message = f"{state['done']}/{state['total']} 완료 - {name} {rows:,}행 처리 중 ({remaining_text()})"
+            self.events.progress(self.update_progress, percent, message)
+
+        def on_file_done(done, total, result):
+            in_progress.pop((result['input'], result['sheet']), None)
+            state['done'], state['total'] = done, total
+            if result['cached']:
+                state['cached'] += 1
+            eta = remaining_text() if done < total else None
+            self.events.call(self._on_batch_file_done, done, total, result, eta)
+
         try:
-            self.update_progress((self.current_file_index / self.total_files) * 100, f"{os.path.basename(self.selected_file_path)} 처리 중...")
-            self.df = self.load_file(self.selected_file_path)
-            self.processed_df = self.process_data(self.df)
-            base_name = os.path.splitext(os.path.basename(self.selected_file_path))[0]
-            dir_name = os.path.dirname(self.selected_file_path)
-            output_file = os.path.join(dir_name, f"{base_name}_processed.xlsx")
-            self.processed_df.to_excel(output_file, index=False)
-            full_path = os.path.abspath(output_file)
-            self.update_progress(((self.current_file_index+1) / self.total_files) * 100, f"{os.path.basename(self.selected_file_path)} 저장 완료!")
+            from batch_processor import run_batch
+            summary = run_batch(file_paths, options, workers=workers, progress_callback=on_file_done,
+                                chunk_callback=on_chunk)
+            self.events.call(self._on_batch_finished, summary)
         except Exception as e:
-            self.update_status(f"오류: {os.path.basename(self.selected_file_path)} - {str(e)}")
-        finally:
-            self.current_file_index += 1
-            self.root.after(500, self.process_next_file)
-        
+            self.events.call(self.update_status, f"일괄 처리 중 오류: {str(e)}")
+
+    def _on_batch_file_done(self, done, total, result, eta=None):
+        """파일 하나 완료 시 진행 상황 반영 (메인 스레드)"""
+        name = os.path.basename(result['input'])
+        if result['sheet']:
+            name = f"{name} [{result['sheet']}]"
+        if result['error']:
+            self.update_status(f"오류: {name} - {result['error']}")
+            message = f"{done}/{total} 완료 - {name} 실패"
+        elif result['cached']:
+            message = f"{done}/{total} 완료 - {name} 변경 없음, 건너뜀"
+        else:
+            message = f"{done}/{total} 완료 - {name} 저장 완료!"
+            self.update_stats_panel(result['stages'])
+        if eta:
+            message = f"{message} ({eta})"
+        self.update_progress((done / total) * 100, message)
+
+    def _on_batch_finished(self, summary):
+        """일괄 처리 완료 시 요약 표시 (메인 스레드)"""
+        self.progress_bar['value'] = 100
+        self.file_label.config(text=f"일괄 처리 완료: {summary['total']}개 작업")
+        # 배치 전체의 단계별 합계 표시
+        self.update_stats_panel(summary['stage_totals'])
+        message = f"모든 파일 처리가 완료되었습니다. (성공 {summary['succeeded']}, 건너뜀 {summary['cached']}, 실패 {summary['failed']}, {summary['seconds']:.1f}초)"
+        self.update_status(message)
+
     def load_file(self, file_path):
         """파일 로드"""
+        from excel_processor import load_xlsx_projected
+        from csv_backends import read_csv
+        from labview_readers import read_lvm, read_tdms
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
         
         file_extension = os.path.splitext(file_path)[1].lower()
         
         if file_extension == '.xlsx':
-            df = pd.read_excel(file_path)
+            df = load_xlsx_projected(file_path)
         elif file_extension == '.csv':
-            df = pd.read_csv(file_path)
+            df = read_csv(file_path)
+        elif file_extension == '.lvm':
+            df = read_lvm(file_path)
+        elif file_extension == '.tdms':
+            df = read_tdms(file_path)
         else:
             raise ValueError(f"지원하지 않는 파일 형식입니다: {file_extension}")
         
@@ -254,41 +370,14 @@ class ModernExcelProcessorGUI:
         
         return df
         
-    def update_preview(self):
-        """미리보기 업데이트"""
-        # 기존 데이터 삭제
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        if self.processed_df is None:
-            return
-            
-        # 열 설정
-        columns = list(self.processed_df.columns)
-        self.tree["columns"] = columns
-        
-        # 열 헤더 설정
-        for col in columns:
-            self.tree.heading(col, text=col)
-            self.tree.column(col, width=100, minwidth=50)
-        
-        # 데이터 추가 (처음 5행)
-        for i, row in self.processed_df.head().iterrows():
-            self.tree.insert("", "end", values=list(row))
-            
-    def quick_save(self):
-        if self.processed_df is None:
-            self.update_status("저장할 데이터가 없습니다.")
-            return
-        try:
-            base_name = os.path.splitext(os.path.basename(self.selected_file_path))[0]
-            dir_name = os.path.dirname(self.selected_file_path)
-            output_file = os.path.join(dir_name, f"{base_name}_processed.xlsx")
-            self.processed_df.to_excel(output_file, index=False)
-            full_path = os.path.abspath(output_file)
-            self.update_status(f"빠른 저장 완료: {full_path}")
-        except Exception as e:
-            self.update_status(f"빠른 저장 중 오류: {str(e)}")
+    def update_preview(self, source=None):
+        """미리보기 업데이트 (전체 데이터를 스크롤로 탐색 가능)"""
+        if source is None:
+            if self.processed_df is None:
+                self.preview_table.set_source(None)
+                return
+            source = DataFrameSource(self.processed_df)
+        self.preview_table.set_source(source)
             
     def save_file(self):
         """파일 저장 (사용자가 위치 선택)"""
@@ -299,59 +388,302 @@ class ModernExcelProcessorGUI:
         try:
             # 기본 파일명 생성
             base_name = os.path.splitext(os.path.basename(self.selected_file_path))[0]
-            default_filename = f"{base_name}_processed.xlsx"
+            default_filename = f"{base_name}_processed{self.output_extension()}"
             
             # 파일 저장 다이얼로그
             file_path = filedialog.asksaveasfilename(
                 title="파일 저장",
-                defaultextension=".xlsx",
+                defaultextension=self.output_extension(),
                 initialfile=default_filename,
                 filetypes=[
                     ("Excel files", "*.xlsx"),
-                    ("CSV files", "*.csv")
+                    ("CSV files", "*.csv"),
+                    ("Compressed CSV files", "*.csv.gz *.csv.zst"),
+                    ("Parquet files", "*.parquet"),
+                    ("Feather files", "*.feather")
                 ]
             )
             
             if file_path:  # 사용자가 파일명을 입력하고 저장을 클릭한 경우
                 self.update_status("파일 저장 중...")
-                self.root.update()
-                
-                file_extension = os.path.splitext(file_path)[1].lower()
-                
-                if file_extension == '.xlsx':
-                    self.processed_df.to_excel(file_path, index=False)
-                elif file_extension == '.csv':
-                    self.processed_df.to_csv(file_path, index=False)
-                
-                self.update_status("파일이 성공적으로 저장되었습니다.")
-                messagebox.showinfo("완료", f"파일이 저장되었습니다:\n{file_path}")
+                # 저장은 백그라운드에서 실행하고 완료/오류는 이벤트로 받습니다
+                thread = threading.Thread(target=self._save_file_in_background, args=(self.processed_df, file_path))
+                thread.daemon = True
+                thread.start()
             else:
                 # 사용자가 취소한 경우
                 self.update_status("파일 저장이 취소되었습니다.")
                 
         except Exception as e:
-            error_msg = f"파일 저장 중 오류가 발생했습니다:\n{str(e)}"
-            messagebox.showerror("오류", error_msg)
-            self.update_status("파일 저장 중 오류가 발생했습니다.")
+            self._on_file_save_failed(str(e))
+
+    def _save_file_in_background(self, df, file_path):
+        """사용자가 고른 위치에 저장 (백그라운드 스레드)"""
+        try:
+            from output_writers import write_dataframe
+            write_dataframe(df, file_path)
+            self.events.call(self._on_file_saved, file_path)
+        except Exception as e:
+            self.events.call(self._on_file_save_failed, str(e))
+
+    def _on_file_saved(self, file_path):
+        """파일 저장 완료 (메인 스레드)"""
+        self.update_status("파일이 성공적으로 저장되었습니다.")
+        messagebox.showinfo("완료", f"파일이 저장되었습니다:\n{file_path}")
+
+    def _on_file_save_failed(self, message):
+        """파일 저장 오류 (메인 스레드)"""
+        messagebox.showerror("오류", f"파일 저장 중 오류가 발생했습니다:\n{message}")
+        self.update_status("파일 저장 중 오류가 발생했습니다.")
                 
     def update_status(self, message):
         """상태 메시지 업데이트"""
         self.status_label.config(text=message)
-        self.root.update()
+
+    def output_extension(self):
+        """선택된 출력 형식의 확장자"""
+        return OUTPUT_FORMATS[self.output_format.get()]
+
+    def processing_options(self):
+        """화면의 처리 설정 (batch_processor.DEFAULT_OPTIONS 형식, 메인 스레드에서 읽음)"""
+        return {
+            'streaming': self.streaming_mode.get(),
+            'output_extension': self.output_extension(),
+            'compact': self.compact_mode.get(),
+            'chart_points': self.selected_chart_points(),
+            'chart_method': self.chart_method.get(),
+            'stats_format': 'json' if self.channel_stats_enabled.get() else None,
+        }
+
+    def selected_chart_points(self):
+        """차트용 축소 파일의 채널당 점 수 (사용하지 않으면 None)"""
+        if not self.chart_enabled.get():
+            return None
+        try:
+            return max(self.chart_points.get(), 3)
+        except tk.TclError:
+            return DEFAULT_CHART_POINTS
+
+    def has_multiple_sheets(self, file_path):
+        """데이터가 있는 시트가 둘 이상인 엑셀 파일인지 확인"""
+        if not file_path.lower().endswith('.xlsx'):
+            return False
+        try:
+            from excel_processor import list_sheets
+            return len(list_sheets(file_path)) > 1
+        except Exception:
+            return False
+
+    def get_dataset_cache(self):
+        """다시 열기 캐시 (처음 사용할 때 만듭니다)"""
+        if self.dataset_cache is None:
+            from dataset_cache import DatasetCache
+            self.dataset_cache = DatasetCache()
+        return self.dataset_cache
+
+    def cache_settings(self, options):
+        """캐시 키에 포함할, 처리 결과에 영향을 주는 설정"""
+        return {'compact': options['compact']}
+
+    def use_streaming(self, file_path):
+        """스트리밍 모드 적용 여부"""
+        return self.streaming_mode.get() and file_path.lower().endswith('.csv')
 
     def show_preview_and_save_options(self):
-        self.df = self.load_file(self.selected_file_path)
-        self.processed_df = self.process_data(self.df)
+        """앞부분 미리보기를 먼저 보여 주고, 전체 처리와 저장은 백그라운드에서 실행"""
+        if self.single_job is not None and self.single_job.is_alive():
+            messagebox.showwarning("처리 중", "이전 파일을 처리하는 중입니다. 완료되거나 취소한 뒤 다시 시도하세요.")
+            return
+        if self.has_multiple_sheets(self.selected_file_path):
+            # 시트가 여러 개인 엑셀 파일은 시트마다 별도 작업으로 병렬 처리
+            self.file_queue = [self.selected_file_path]
+            self.process_file_queue()
+            return
+        self.df = None
+        self.processed_df = None
+        self.preview_table.show_message("미리보기를 불러오는 중...")
+        self.file_label.config(text=os.path.basename(self.selected_file_path))
+        self.progress_bar['value'] = 0
+        self.progress_label.config(text="처리 시작...")
+        self.cancel_event = threading.Event()
+        self.cancel_btn.config(state='normal')
+        # Tk 변수는 메인 스레드에서 미리 읽어 전달
+        options = self.processing_options()
+        options['streaming'] = self.use_streaming(self.selected_file_path)
+        options['use_cache'] = self.cache_enabled.get() and not options['streaming']
+        args = (self.selected_file_path, options, self.cancel_event)
+        self.single_job = threading.Thread(target=self._process_single_file_in_background, args=args)
+        self.single_job.daemon = True
+        self.single_job.start()
+
+    def _process_single_file_in_background(self, file_path, options, cancel_event):
+        """단일 파일 미리보기, 처리, 저장 (백그라운드 스레드, 화면 갱신은 이벤트 통로로 전달)"""
+        from excel_processor import (ProcessingCancelled, default_output_path, load_preview, process_file_streaming,
+                                     save_chart_file)
+        from channel_stats import ChannelStats, stats_output_path
+        stats = PipelineStats(file_path)
+        output_file = default_output_path(file_path, options['output_extension'])
+        chart_points, chart_method = options['chart_points'], options['chart_method']
+        channel_stats = ChannelStats() if options['stats_format'] else None
+        notes = []
+
+        def report(value, message):
+            # 조각마다 보내도 화면은 이벤트 확인 간격마다 마지막 값으로 한 번만 갱신됩니다
+            self.events.progress(self.update_progress, value, message)
+
+        def check_cancelled():
+            if cancel_event.is_set():
+                raise ProcessingCancelled("처리가 취소되었습니다.")
+
+        try:
+            input_bytes = os.path.getsize(file_path)
+            cached_df = None
+            if options['use_cache']:
+                # 같은 파일을 같은 설정으로 처리한 적이 있으면 파싱 없이 메모리 맵으로 바로 엽니다
+                with stats.stage('cache') as record:
+                    cached_df = self.get_dataset_cache().load(file_path, settings=self.cache_settings(options))
+                    record['rows'] = len(cached_df) if cached_df is not None else None
+            if cached_df is not None:
+                self.events.call(self._on_single_file_processed, None, cached_df)
+                notes.append("캐시에서 열었습니다 (파일 다시 읽지 않음)")
+            else:
+                with stats.stage('preview') as record:
+                    preview = load_preview(file_path)
+                    record['rows'] = len(preview) if preview is not None else None
+                if preview is not None:
+                    self.events.call(self.update_preview, DataFrameSource(preview))
+            check_cancelled()
+
+            if options['streaming']:
+                def on_chunk(rows, bytes_read, total_bytes):
+                    percent = bytes_read / total_bytes * 100 if total_bytes else 0
+                    report(percent, f"스트리밍 처리 중... {rows:,}행")
+                with stats.stage('stream', bytes_read=input_bytes) as record:
+                    record['rows'] = process_file_streaming(file_path, output_file, progress_callback=on_chunk,
+                                                            cancel_event=cancel_event, compact=options['compact'],
+                                                            chart_points=chart_points, chart_method=chart_method,
+                                                            channel_stats=channel_stats)
+                    record['bytes_written'] = os.path.getsize(output_file)
+            else:
+                processed_df = self._process_and_save_in_background(file_path, output_file, options, stats,
+                                                                    channel_stats, notes, report, check_cancelled,
+                                                                    cached_df)
+                if chart_points:
+                    report(90, "차트용 파일 저장 중...")
+                    with stats.stage('chart', rows=len(processed_df)) as record:
+                        chart_path = save_chart_file(processed_df, output_file, chart_points, chart_method)
+                        record['bytes_written'] = os.path.getsize(chart_path)
+            if channel_stats is not None:
+                channel_stats.save(stats_output_path(output_file, options['stats_format']))
+                notes.append(f"채널 통계: {channel_stats.format_summary()}")
+            self.events.call(self._on_single_file_done, os.path.abspath(output_file), stats.stages,
+                             options['streaming'], notes)
+        except ProcessingCancelled:
+            self.events.call(self._on_single_file_cancelled)
+        except Exception as e:
+            self.events.call(self._on_single_file_failed, str(e))
+
+    def _process_and_save_in_background(self, file_path, output_file, options, stats, channel_stats, notes,
+                                        report, check_cancelled, cached_df=None):
+        """메모리에 전체를 올려 로드 → 처리 → 저장 (백그라운드 스레드, 캐시된 결과가 있으면 필요할 때만 저장)"""
+        from output_writers import write_dataframe
+        if cached_df is not None:
+            processed_df = cached_df
+        else:
+            processed_df = self._load_and_process_in_background(file_path, options, stats, notes, report,
+                                                                check_cancelled)
+        if channel_stats is not None:
+            with stats.stage('stats', rows=len(processed_df)):
+                channel_stats.update(processed_df)
+        cache_settings = self.cache_settings(options)
+        if cached_df is not None and self.get_dataset_cache().has_output(output_file, file_path,
+                                                                         settings=cache_settings):
+            # 이 캐시 항목으로 저장한 출력이 그대로 있으면 다시 쓰지 않습니다
+            notes.append("같은 결과로 저장한 출력 파일이 있어 다시 저장하지 않았습니다")
+            return processed_df
+        report(70, "저장 중...")
+        with stats.stage('save', rows=len(processed_df)) as record:
+            write_dataframe(processed_df, output_file)
+            record['bytes_written'] = os.path.getsize(output_file)
+        if options['use_cache']:
+            try:
+                self.get_dataset_cache().record_output(output_file, file_path, settings=cache_settings)
+            except OSError as e:
+                notes.append(f"캐시에 출력 기록 실패: {e}")
+        return processed_df
+
+    def _load_and_process_in_background(self, file_path, options, stats, notes, report, check_cancelled):
+        """파일 로드 → 처리 후 결과를 캐시에 저장 (백그라운드 스레드)"""
+        from excel_processor import compact_dtypes
+        report(5, "파일 로드 중...")
+        with stats.stage('load', bytes_read=os.path.getsize(file_path)) as record:
+            df = self.load_file(file_path)
+            record['rows'] = len(df)
+        if options['compact']:
+            with stats.stage('compact', rows=len(df)):
+                df, saved_bytes = compact_dtypes(df)
+            notes.append(f"메모리 절약 {saved_bytes / (1024 * 1024):,.1f} MB")
+            report(55, f"메모리 절약 모드: {saved_bytes / (1024 * 1024):,.1f} MB 절약")
+        check_cancelled()
+        report(60, "데이터 처리 중...")
+        with stats.stage('process', rows=len(df)):
+            processed_df = self.process_data(df)
+        check_cancelled()
+        self.events.call(self._on_single_file_processed, df, processed_df)
+        if options['use_cache']:
+            try:
+                with stats.stage('cache_store', rows=len(processed_df)):
+                    if not self.get_dataset_cache().store(processed_df, file_path, settings=self.cache_settings(options)):
+                        notes.append("문자열 열이 있거나 너무 커서 캐시에 저장하지 않았습니다")
+            except OSError as e:
+                # 캐시 저장 실패는 처리 결과에 영향을 주지 않습니다
+                notes.append(f"캐시 저장 실패: {e}")
+        return processed_df
+
+    def _on_single_file_processed(self, df, processed_df):
+        """전체 처리 결과를 미리보기에 반영 (메인 스레드)"""
+        self.df = df
+        self.processed_df = processed_df
         self.update_preview()
-        # 저장 방식 선택 다이얼로그 없이 바로 빠른 저장
-        self.quick_save()
+
+    def _on_single_file_done(self, full_path, stages, streamed, notes):
+        """단일 파일 저장 완료 (메인 스레드)"""
+        self.cancel_btn.config(state='disabled')
+        if streamed and full_path.lower().endswith('.csv'):
+            # 저장된 CSV를 디스크에서 필요한 구간만 읽어 전체 미리보기
+            self.update_preview(CsvFileSource(full_path))
+        self.update_stats_panel(stages)
+        self.update_progress(100, "저장 완료!")
+        message = f"스트리밍 저장 완료: {full_path}" if streamed else f"빠른 저장 완료: {full_path}"
+        # 메모리 절약량, 채널 통계 요약 등은 다음 줄에 표시
+        self.update_status("\n".join([message] + notes))
+
+    def _on_single_file_cancelled(self):
+        """단일 파일 처리 취소 완료 (메인 스레드)"""
+        self.cancel_btn.config(state='disabled')
+        self.update_progress(0, "취소됨")
+        self.update_status("처리가 취소되었습니다.")
+
+    def _on_single_file_failed(self, message):
+        """단일 파일 처리 오류 (메인 스레드)"""
+        self.cancel_btn.config(state='disabled')
+        self.update_progress(0, "오류")
+        self.update_status(f"처리 중 오류: {message}")
+        messagebox.showerror("오류", f"파일 처리 중 오류가 발생했습니다:\n{message}")
+
+    def cancel_processing(self):
+        """진행 중인 단일 파일 처리 취소 요청"""
+        if self.cancel_event is not None and not self.cancel_event.is_set():
+            self.cancel_event.set()
+            self.cancel_btn.config(state='disabled')
+            self.progress_label.config(text="취소하는 중...")
 
     def on_drop_files(self, event):
         try:
             files = self.root.tk.splitlist(event.data)
-            file_paths = [f for f in files if f.lower().endswith(('.xlsx', '.csv'))]
+            file_paths = [f for f in files if f.lower().endswith(SUPPORTED_EXTENSIONS)]
             if not file_paths:
-                messagebox.showwarning("드래그 앤 드롭", "엑셀/CSV 파일만 지원합니다.")
+                messagebox.showwarning("드래그 앤 드롭", "엑셀/CSV/LVM/TDMS 파일만 지원합니다.")
                 return
             if len(file_paths) == 1:
                 self.selected_file_path = file_paths[0]
@@ -362,10 +694,49 @@ class ModernExcelProcessorGUI:
         except Exception as e:
             messagebox.showerror("드래그 앤 드롭 오류", f"드롭 이벤트 처리 중 오류 발생: {e}")
 
+    def on_first_paint(self):
+        """첫 화면이 그려진 뒤 처리 모듈을 백그라운드에서 미리 불러옵니다 (메인 스레드)"""
+        STARTUP.mark('first_paint')
+        self.status_label.config(text="상태: 처리 모듈을 불러오는 중...")
+        thread = threading.Thread(target=self._warm_up_backend)
+        thread.daemon = True
+        thread.start()
+
+    def _warm_up_backend(self):
+        """처리 모듈 미리 불러오기 (백그라운드 스레드)"""
+        try:
+            for name in BACKEND_MODULES:
+                STARTUP.import_module(name)
+        except Exception as e:
+            # 실제 오류는 해당 기능을 처음 사용할 때 다시 보고됩니다
+            self.events.call(self.update_status, f"처리 모듈을 불러오지 못했습니다: {e}")
+            return
+        self.events.call(self._on_backend_ready)
+
+    def _on_backend_ready(self):
+        """처리 모듈 준비 완료 (메인 스레드)"""
+        STARTUP.mark('backend_ready')
+        if self.status_label.cget('text') == "상태: 처리 모듈을 불러오는 중...":
+            self.status_label.config(text="상태: 준비됨")
+        STARTUP.write_report()
+
 def main():
     """메인 함수"""
+    # PyInstaller 실행 파일에서 작업자 프로세스를 생성하기 위해 필요
+    multiprocessing.freeze_support()
+    STARTUP.mark('module_loaded')
+    TkinterDnD = STARTUP.import_module('tkinterdnd2').TkinterDnD
     root = TkinterDnD.Tk()
+    STARTUP.mark('root_created')
     app = ModernExcelProcessorGUI(root)
+    STARTUP.mark('window_built')
+
+    def on_map(event):
+        # 창이 화면에 나타난 뒤 대기 중인 그리기가 끝나면 첫 화면 표시로 기록
+        if event.widget is root:
+            root.unbind('<Map>')
+            root.after_idle(app.on_first_paint)
+    root.bind('<Map>', on_map)
     root.mainloop()
 
 if __name__ == "__main__":
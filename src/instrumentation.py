@@ -0,0 +1,184 @@
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+def peak_rss_bytes():
+    """
+    현재 프로세스가 지금까지 사용한 최대 상주 메모리(RSS)를 바이트로 반환합니다.
+
+    Windows는 PeakWorkingSetSize, 그 밖의 운영체제는 getrusage를 사용하며,
+    측정할 수 없으면 None을 반환합니다.
+
+    Returns:
+        int: 최대 RSS (바이트) 또는 None
+    """
+    if sys.platform == 'win32':
+        try:
+            import ctypes
+            from ctypes import wintypes
+
+            class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+                _fields_ = [
+                    ('cb', wintypes.DWORD),
+                    ('PageFaultCount', wintypes.DWORD),
+                    ('PeakWorkingSetSize', ctypes.c_size_t),
+                    ('WorkingSetSize', ctypes.c_size_t),
+                    ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+                    ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                    ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+                    ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                    ('PagefileUsage', ctypes.c_size_t),
+                    ('PeakPagefileUsage', ctypes.c_size_t),
+                ]
+
+            counters = PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(counters)
+            process = ctypes.windll.kernel32.GetCurrentProcess()
+            if ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+                return counters.PeakWorkingSetSize
+        except (AttributeError, OSError):
+            pass
+        return None
+
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, Linux는 KB 단위
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+def _add_optional(a, b):
+    """둘 다 None이면 None, 아니면 None을 0으로 보고 더합니다."""
+    if a is None and b is None:
+        return None
+    return (a or 0) + (b or 0)
+
+class PipelineStats:
+    """
+    파이프라인 단계별 실행 시간, 처리 속도, 메모리, 입출력 바이트 기록.
+
+    with stats.stage('load') as record: 형태로 각 단계를 감싸고, 단계 안에서
+    record['rows'], record['bytes_read'], record['bytes_written']을 채우면
+    끝날 때 행/초와 최대 RSS가 함께 기록됩니다.
+    """
+    def __init__(self, label=None):
+        self.label = label
+        self.stages = {}
+
+    @contextmanager
+    def stage(self, name, rows=None, bytes_read=None, bytes_written=None):
+        record = {'rows': rows, 'bytes_read': bytes_read, 'bytes_written': bytes_written}
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record['seconds'] = time.perf_counter() - start
+            self.add(name, **record)
+
+    def add(self, name, seconds, rows=None, bytes_read=None, bytes_written=None):
+        """이미 측정한 단계를 기록합니다 (같은 이름이면 누적)."""
+        previous = self.stages.get(name)
+        if previous is not None:
+            seconds += previous['seconds']
+            rows = _add_optional(rows, previous['rows'])
+            bytes_read = _add_optional(bytes_read, previous['bytes_read'])
+            bytes_written = _add_optional(bytes_written, previous['bytes_written'])
+        peak = peak_rss_bytes()
+        self.stages[name] = {
+            'seconds': seconds,
+            'rows': rows,
+            'rows_per_second': rows / seconds if rows and seconds else None,
+            'bytes_read': bytes_read,
+            'bytes_written': bytes_written,
+            'peak_rss_mb': peak / (1024 * 1024) if peak is not None else None,
+        }
+
+    def total_seconds(self):
+        """모든 단계의 시간 합계"""
+        return sum(stage['seconds'] for stage in self.stages.values())
+
+    def to_dict(self):
+        """JSON으로 내보낼 수 있는 사전"""
+        return {'label': self.label, 'total_seconds': self.total_seconds(), 'stages': self.stages}
+
+    def to_json(self):
+        """한 줄짜리 JSON 문자열 (구조화 로그용)"""
+        return json.dumps(self.to_dict(), ensure_ascii=False)
+
+    def format_table(self):
+        """
+        사람이 읽기 쉬운 표 형태의 문자열.
+
+        Returns:
+            str: 단계별 시간/속도/메모리 표
+        """
+        lines = [f"{'단계':<12}{'초':>10}{'행/초':>14}{'최대 RSS(MB)':>14}"]
+        for name, stage in self.stages.items():
+            rate = f"{stage['rows_per_second']:,.0f}" if stage['rows_per_second'] else '-'
+            peak = f"{stage['peak_rss_mb']:,.0f}" if stage['peak_rss_mb'] is not None else '-'
+            lines.append(f"{name:<12}{stage['seconds']:>10.3f}{rate:>14}{peak:>14}")
+        return os.linesep.join(lines)
+
+def estimate_remaining_seconds(elapsed_seconds, fraction_done):
+    """
+    지금까지 걸린 시간과 완료 비율로 남은 시간을 추정합니다 (같은 속도가 유지된다고 가정).
+
+    Args:
+        elapsed_seconds (float): 시작부터 지금까지 걸린 시간
+        fraction_done (float): 완료 비율 (0~1)
+
+    Returns:
+        float: 남은 시간 (초), 아직 추정할 수 없으면 None
+    """
+    if fraction_done <= 0:
+        return None
+    return elapsed_seconds * max(1.0 - fraction_done, 0.0) / fraction_done
+
+def format_duration(seconds):
+    """
+    초를 '1시간 2분', '3분 20초', '12초' 형태의 문자열로 바꿉니다.
+
+    Args:
+        seconds (float): 시간 (초), None이면 '계산 중'
+
+    Returns:
+        str: 사람이 읽기 쉬운 시간 문자열
+    """
+    if seconds is None:
+        return "계산 중"
+    seconds = int(round(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    if hours:
+        return f"{hours}시간 {minutes}분"
+    if minutes:
+        return f"{minutes}분 {seconds}초"
+    return f"{seconds}초"
+
+def merge_stage_totals(stage_dicts):
+    """
+    여러 파일의 단계별 기록을 단계 이름별로 합칩니다 (배치 요약용).
+
+    Args:
+        stage_dicts (list): PipelineStats.stages 형식의 사전 목록
+
+    Returns:
+        dict: 단계별 합계 (seconds, rows, rows_per_second, bytes_read, bytes_written, peak_rss_mb)
+    """
+    totals = {}
+    for stages in stage_dicts:
+        for name, stage in stages.items():
+            total = totals.setdefault(name, {'seconds': 0.0, 'rows': 0, 'bytes_read': 0,
+                                             'bytes_written': 0, 'peak_rss_mb': None})
+            total['seconds'] += stage['seconds']
+            total['rows'] += stage['rows'] or 0
+            total['bytes_read'] += stage['bytes_read'] or 0
+            total['bytes_written'] += stage['bytes_written'] or 0
+            if stage['peak_rss_mb'] is not None:
+                total['peak_rss_mb'] = max(total['peak_rss_mb'] or 0, stage['peak_rss_mb'])
+    for total in totals.values():
+        total['rows_per_second'] = total['rows'] / total['seconds'] if total['rows'] and total['seconds'] else None
+    return totals
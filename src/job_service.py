@@ -0,0 +1,536 @@
+import argparse
+import json
+import os
+import re
+import shutil
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, urlparse
+
+from app_defaults import OUTPUT_COMPRESSIONS, OUTPUT_FORMATS, SUPPORTED_EXTENSIONS, default_worker_count
+
+# 기본 접속 주소와 포트
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+# 업로드 파일을 받아 쓰는 단위와 기본 최대 크기
+UPLOAD_BLOCK_BYTES = 1024 * 1024
+DEFAULT_MAX_UPLOAD_MB = 2048
+
+# 작업자 수 대비 대기할 수 있는 최대 작업 수 (넘으면 503으로 거절)
+DEFAULT_QUEUE_FACTOR = 4
+
+# 끝난 작업의 상태와 결과 파일을 보관하는 기본 시간 (시간)
+DEFAULT_RESULT_TTL_HOURS = 24
+
+class QueueFull(RuntimeError):
+    """대기 중인 작업이 queue_limit개에 도달해 새 작업을 받을 수 없을 때 발생합니다."""
+
+def _run_job(input_path, options):
+    """작업자 프로세스에서 파일 하나(여러 시트면 시트마다)를 기존 일괄 처리 경로로 처리합니다."""
+    from batch_processor import run_batch
+    return run_batch([input_path], options, workers=1)
+
+class JobService:
+    """
+    HTTP로 받은 파일 처리 작업을 제한된 크기의 프로세스 풀에서 실행하고 상태를 관리합니다.
+
+    업로드된 파일은 작업 폴더의 uploads/<작업 ID>에 저장했다가 작업이 끝나면 지우고,
+    서버에 이미 있는 파일은 허용된 폴더(allowed_roots) 아래 경로만 받습니다. 결과는 모두
+    results/<작업 ID>에 저장되어 입력 폴더(측정 PC 공유 폴더 등)에는 쓰지 않습니다.
+
+    대기 중이거나 실행 중인 작업이 queue_limit개에 도달하면 새 작업을 거절하므로 동시에
+    남아 있는 업로드 파일 수가 제한됩니다. 끝난 작업의 상태와 결과 폴더는 result_ttl초가
+    지나면 새 작업을 받을 때 정리합니다 (이전 실행에서 남은 폴더 포함).
+    """
+    def __init__(self, work_dir, workers=None, queue_limit=None, options=None, allowed_roots=(),
+                 result_ttl=DEFAULT_RESULT_TTL_HOURS * 3600):
+        self.work_dir = os.path.abspath(work_dir)
+        self.workers = workers or default_worker_count()
+        self.queue_limit = queue_limit or self.workers * DEFAULT_QUEUE_FACTOR
+        self.options = dict(options or {})
+        self.allowed_roots = [self._real_path(root) for root in allowed_roots]
+        self.result_ttl = result_ttl
+        self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        self.lock = threading.Lock()
+        self.jobs = {}
+        self.futures = {}
+        self.started = time.time()
+        self.totals = {'rows': 0, 'bytes_read': 0, 'bytes_written': 0, 'seconds': 0.0}
+
+    def upload_dir(self, job_id):
+        return os.path.join(self.work_dir, 'uploads', job_id)
+
+    def result_dir(self, job_id):
+        return os.path.join(self.work_dir, 'results', job_id)
+
+    def _pending_count(self):
+        return sum(1 for job in self.jobs.values() if job['finished'] is None)
+
+    def pending_count(self):
+        """대기 중이거나 실행 중인 작업 수"""
+        with self.lock:
+            return self._pending_count()
+
+    @staticmethod
+    def _real_path(path):
+        # 심볼릭 링크와 '..'를 풀어 실제 위치로 비교합니다
+        return os.path.normcase(os.path.realpath(path))
+
+    def is_allowed_path(self, path):
+        """서버 로컬 경로가 (링크를 따라간 실제 위치 기준으로) 허용된 폴더 아래에 있는지 확인"""
+        path = self._real_path(path)
+        for root in self.allowed_roots:
+            try:
+                if os.path.commonpath([path, root]) == root:
+                    return True
+            except ValueError:
+                # Windows에서 드라이브가 다르면 비교할 수 없습니다
+                continue
+        return False
+
+    def new_job_id(self):
+        return uuid.uuid4().hex[:12]
+
+    def submit(self, job_id, input_path, source, output_format=None):
+        """
+        작업을 프로세스 풀에 넣습니다.
+
+        Args:
+            job_id (str): 작업 ID
+            input_path (str): 처리할 입력 파일 경로
+            source (str): 'upload' 또는 'path'
+            output_format (str): OUTPUT_FORMATS의 형식 이름 (없으면 서버 기본값)
+
+        Returns:
+            dict: 작업 상태
+
+        Raises:
+            QueueFull: 대기 중인 작업이 queue_limit개에 도달한 경우
+        """
+        self.sweep()
+        options = dict(self.options)
+        if output_format:
+            options['output_extension'] = OUTPUT_FORMATS[output_format]
+        options.update(output_dir=self.result_dir(job_id), log_to_stderr=True, skip_unchanged=False)
+        job = {
+            'id': job_id,
+            'input': input_path,
+            'source': source,
+            'submitted': time.time(),
+            'finished': None,
+            'seconds': None,
+            'rows': 0,
+            'outputs': [],
+            'error': None,
+        }
+        # 여러 요청이 동시에 확인을 통과하지 않도록 개수 확인과 등록을 한 잠금 안에서 합니다
+        with self.lock:
+            if self._pending_count() >= self.queue_limit:
+                raise QueueFull("대기 중인 작업이 너무 많습니다.")
+            os.makedirs(options['output_dir'], exist_ok=True)
+            future = self.executor.submit(_run_job, input_path, options)
+            self.jobs[job_id] = job
+            self.futures[job_id] = future
+        # 이미 끝난 작업이면 완료 콜백이 바로 실행되며 같은 잠금을 쓰므로 잠금 밖에서 등록합니다
+        future.add_done_callback(lambda f: self._finish(job_id, f))
+        return self.status(job_id)
+
+    def _finish(self, job_id, future):
+        """작업 완료 시 결과를 기록하고 업로드 파일을 지웁니다 (풀 관리 스레드에서 호출)."""
+        try:
+            self._record_result(job_id, future)
+        finally:
+            shutil.rmtree(self.upload_dir(job_id), ignore_errors=True)
+
+    def _record_result(self, job_id, future):
+        with self.lock:
+            job = self.jobs[job_id]
+            job['finished'] = time.time()
+            job['seconds'] = job['finished'] - job['submitted']
+            try:
+                summary = future.result()
+            except Exception as e:
+                job['error'] = f"{type(e).__name__}: {e}"
+                return
+            outputs = []
+            for result in summary['results']:
+                for key in ('output', 'chart_output', 'stats_output'):
+                    if result.get(key):
+                        outputs.append(result[key])
+                self.totals['bytes_read'] += result['bytes_read']
+                self.totals['bytes_written'] += result['bytes_written']
+            job['rows'] = summary['rows']
+            job['outputs'] = outputs
+            errors = [r['error'] for r in summary['results'] if r['error']]
+            if errors:
+                job['error'] = "; ".join(errors)
+            self.totals['rows'] += summary['rows']
+            self.totals['seconds'] += summary['seconds']
+
+    def sweep(self, now=None):
+        """
+        result_ttl초보다 오래전에 끝난 작업의 상태와 결과 폴더를 지웁니다.
+
+        이 서비스가 모르는 작업 폴더(이전 실행에서 남은 폴더)는 수정 시각으로 판단합니다.
+
+        Args:
+            now (float): 기준 시각 (없으면 현재 시각)
+
+        Returns:
+            int: 정리한 작업 수
+        """
+        now = time.time() if now is None else now
+        cutoff = now - self.result_ttl
+        with self.lock:
+            expired = [job_id for job_id, job in self.jobs.items()
+                       if job['finished'] is not None and job['finished'] < cutoff]
+            for job_id in expired:
+                del self.jobs[job_id]
+                self.futures.pop(job_id, None)
+            known = set(self.jobs)
+        for job_id in expired:
+            shutil.rmtree(self.result_dir(job_id), ignore_errors=True)
+        for folder in ('results', 'uploads'):
+            parent = os.path.join(self.work_dir, folder)
+            if not os.path.isdir(parent):
+                continue
+            for name in os.listdir(parent):
+                path = os.path.join(parent, name)
+                try:
+                    stale = name not in known and os.path.getmtime(path) < cutoff
+                except OSError:
+                    continue
+                if stale:
+                    shutil.rmtree(path, ignore_errors=True)
+        return len(expired)
+
+    def status(self, job_id):
+        """
+        작업 상태 사전 (queued, running, succeeded, failed).
+
+        Returns:
+            dict: 작업 상태 (없는 작업이면 None)
+        """
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if job is None:
+                return None
+            future = self.futures.get(job_id)
+            if job['finished'] is None:
+                state = 'running' if future is not None and future.running() else 'queued'
+            else:
+                state = 'failed' if job['error'] else 'succeeded'
+            status = {key: value for key, value in job.items() if key != 'outputs'}
+            status['state'] = state
+            status['outputs'] = [os.path.basename(path) for path in job['outputs']]
+            return status
+
+    def list_jobs(self):
+        """모든 작업 상태 (제출 순서)"""
+        with self.lock:
+            job_ids = sorted(self.jobs, key=lambda job_id: self.jobs[job_id]['submitted'])
+        return [self.status(job_id) for job_id in job_ids]
+
+    def output_path(self, job_id, name=None):
+        """
+        작업 결과 파일 경로.
+
+        Args:
+            job_id (str): 작업 ID
+            name (str): 결과 파일 이름 (없으면 첫 번째 결과)
+
+        Returns:
+            str: 결과 파일 경로 (없으면 None)
+        """
+        with self.lock:
+            job = self.jobs.get(job_id)
+            outputs = list(job['outputs']) if job else []
+        if name is None:
+            return outputs[0] if outputs else None
+        for path in outputs:
+            if os.path.basename(path) == name:
+                return path
+        return None
+
+    def metrics(self):
+        """
+        처리량 지표.
+
+        Returns:
+            dict: uptime_seconds, workers, queue_limit, jobs(상태별 수), rows, bytes_read,
+                bytes_written, rows_per_second(가동 시간 기준), average_job_seconds
+        """
+        states = {'queued': 0, 'running': 0, 'succeeded': 0, 'failed': 0}
+        for status in self.list_jobs():
+            states[status['state']] += 1
+        uptime = time.time() - self.started
+        with self.lock:
+            totals = dict(self.totals)
+            finished = [job['seconds'] for job in self.jobs.values() if job['seconds'] is not None]
+        return {
+            'uptime_seconds': uptime,
+            'workers': self.workers,
+            'queue_limit': self.queue_limit,
+            'jobs': states,
+            'rows': totals['rows'],
+            'bytes_read': totals['bytes_read'],
+            'bytes_written': totals['bytes_written'],
+            'rows_per_second': totals['rows'] / uptime if uptime > 0 else 0.0,
+            'average_job_seconds': sum(finished) / len(finished) if finished else None,
+        }
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+class JobRequestHandler(BaseHTTPRequestHandler):
+    """
+    작업 서비스 HTTP 요청 처리.
+
+    - POST /jobs?filename=이름.csv : 요청 본문(파일 내용)을 업로드해 작업 등록
+    - POST /jobs (JSON {"path": "..."}) : 서버에 있는 파일로 작업 등록
+      (두 방식 모두 format=csv 등으로 출력 형식 지정 가능)
+    - GET /jobs, GET /jobs/<ID> : 작업 상태
+    - GET /jobs/<ID>/result[?name=파일 이름] : 결과 파일 내려받기
+    - GET /metrics : 처리량 지표, GET /health : 상태 확인
+    """
+    server_version = 'LabviewChartJobService/1.0'
+
+    @property
+    def service(self):
+        return self.server.service
+
+    def log_message(self, format, *args):
+        # 접속 기록은 표준 오류로 보냅니다 (기본 동작과 같지만 명시)
+        sys.stderr.write(f"{self.address_string()} - {format % args}\n")
+
+    def send_json(self, status, payload, headers=None):
+        body = json.dumps(payload, ensure_ascii=False, indent=2).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_error_json(self, status, message, headers=None):
+        self.send_json(status, {'error': message}, headers)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        parts = [part for part in url.path.split('/') if part]
+        if parts == ['health']:
+            self.send_json(200, {'status': 'ok'})
+        elif parts == ['metrics']:
+            self.send_json(200, self.service.metrics())
+        elif parts == ['jobs']:
+            self.send_json(200, self.service.list_jobs())
+        elif len(parts) == 2 and parts[0] == 'jobs':
+            status = self.service.status(parts[1])
+            if status is None:
+                self.send_error_json(404, "작업을 찾을 수 없습니다.")
+            else:
+                self.send_json(200, status)
+        elif len(parts) == 3 and parts[0] == 'jobs' and parts[2] == 'result':
+            self.send_result(parts[1], query.get('name', [None])[0])
+        else:
+            self.send_error_json(404, "알 수 없는 경로입니다.")
+
+    def send_result(self, job_id, name):
+        status = self.service.status(job_id)
+        if status is None:
+            self.send_error_json(404, "작업을 찾을 수 없습니다.")
+            return
+        if status['state'] in ('queued', 'running'):
+            self.send_error_json(409, "아직 처리 중입니다.", {'Retry-After': '2'})
+            return
+        path = self.service.output_path(job_id, name)
+        if path is None or not os.path.isfile(path):
+            self.send_error_json(404, "결과 파일이 없습니다.")
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/octet-stream')
+        self.send_header('Content-Length', str(os.path.getsize(path)))
+        # 한글 파일 이름은 RFC 5987 형식으로 보냅니다 (헤더는 latin-1만 허용)
+        name = os.path.basename(path)
+        fallback = name.encode('ascii', 'replace').decode('ascii').replace('?', '_')
+        self.send_header('Content-Disposition', f"attachment; filename=\"{fallback}\"; filename*=UTF-8''{quote(name)}")
+        self.end_headers()
+        with open(path, 'rb') as f:
+            shutil.copyfileobj(f, self.wfile, UPLOAD_BLOCK_BYTES)
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        if [part for part in url.path.split('/') if part] != ['jobs']:
+            self.send_error_json(404, "알 수 없는 경로입니다.")
+            return
+        length = int(self.headers.get('Content-Length') or 0)
+        content_type = self.headers.get('Content-Type', '')
+        output_format = query.get('format', [None])[0]
+
+        if self.service.pending_count() >= self.service.queue_limit:
+            # 본문을 읽지 않고 거절하므로 연결을 닫습니다 (최종 확인은 submit에서 다시 함)
+            self.close_connection = True
+            self.send_queue_full()
+            return
+
+        if content_type.startswith('application/json'):
+            try:
+                request = json.loads(self.rfile.read(length) or b'{}')
+            except ValueError:
+                self.send_error_json(400, "JSON 형식이 올바르지 않습니다.")
+                return
+            if not isinstance(request, dict):
+                self.send_error_json(400, 'JSON 본문은 {"path": "..."} 형태의 객체여야 합니다.')
+                return
+            output_format = request.get('format', output_format)
+            path = request.get('path')
+            if not isinstance(path, (str, type(None))) or not isinstance(output_format, (str, type(None))):
+                self.send_error_json(400, "'path'와 'format'은 문자열이어야 합니다.")
+                return
+            self.submit_path(path, output_format)
+        else:
+            self.submit_upload(query.get('filename', [None])[0], length, output_format)
+
+    def validate(self, file_name, output_format):
+        """입력 파일 이름과 출력 형식 확인 (문제가 있으면 오류 메시지)"""
+        if not file_name or not file_name.lower().endswith(SUPPORTED_EXTENSIONS):
+            return f"지원하는 입력 형식({', '.join(SUPPORTED_EXTENSIONS)})의 파일 이름이 필요합니다."
+        if output_format and output_format not in OUTPUT_FORMATS:
+            return f"지원하지 않는 출력 형식입니다: {output_format} ({', '.join(OUTPUT_FORMATS)} 중 선택)"
+        return None
+
+    def send_queue_full(self):
+        self.send_error_json(503, "대기 중인 작업이 너무 많습니다. 잠시 후 다시 시도하세요.", {'Retry-After': '5'})
+
+    def submit_path(self, path, output_format):
+        if not path:
+            self.send_error_json(400, "'path' 항목이 필요합니다.")
+            return
+        error = self.validate(path, output_format)
+        if error:
+            self.send_error_json(400, error)
+            return
+        if not self.service.is_allowed_path(path):
+            self.send_error_json(403, "허용되지 않은 경로입니다 (서버의 --allow-root 폴더 아래만 가능).")
+            return
+        if not os.path.isfile(path):
+            self.send_error_json(404, f"파일을 찾을 수 없습니다: {path}")
+            return
+        try:
+            status = self.service.submit(self.service.new_job_id(), os.path.abspath(path), 'path', output_format)
+        except QueueFull:
+            self.send_queue_full()
+            return
+        self.send_json(202, status, {'Location': f"/jobs/{status['id']}"})
+
+    def submit_upload(self, file_name, length, output_format):
+        # 경로 구분자나 특수 문자는 버리고 파일 이름만 사용합니다
+        file_name = re.sub(r'[<>:"/\\|?*]+', '_', os.path.basename(file_name or ''))
+        error = self.validate(file_name, output_format)
+        if error:
+            self.close_connection = True
+            self.send_error_json(400, error)
+            return
+        if length <= 0:
+            self.send_error_json(400, "업로드할 파일 내용이 없습니다 (Content-Length 필요).")
+            return
+        if length > self.server.max_upload_bytes:
+            self.close_connection = True
+            self.send_error_json(413, "업로드 파일이 너무 큽니다.")
+            return
+
+        job_id = self.service.new_job_id()
+        upload_dir = self.service.upload_dir(job_id)
+        os.makedirs(upload_dir, exist_ok=True)
+        path = os.path.join(upload_dir, file_name)
+        # 메모리에 모두 올리지 않고 블록 단위로 디스크에 씁니다
+        remaining = length
+        with open(path, 'wb') as f:
+            while remaining > 0:
+                block = self.rfile.read(min(UPLOAD_BLOCK_BYTES, remaining))
+                if not block:
+                    break
+                f.write(block)
+                remaining -= len(block)
+        if remaining:
+            shutil.rmtree(upload_dir, ignore_errors=True)
+            self.send_error_json(400, "업로드가 중간에 끊겼습니다.")
+            return
+        try:
+            status = self.service.submit(job_id, path, 'upload', output_format)
+        except QueueFull:
+            shutil.rmtree(upload_dir, ignore_errors=True)
+            self.send_queue_full()
+            return
+        self.send_json(202, status, {'Location': f"/jobs/{job_id}"})
+
+def build_parser():
+    """명령줄 인자 정의"""
+    parser = argparse.ArgumentParser(
+        description="여러 측정 PC의 파일을 HTTP로 받아 처리하는 작업 서비스",
+    )
+    parser.add_argument('--host', default=DEFAULT_HOST,
+                        help=f"접속 주소 (기본값: {DEFAULT_HOST}, 다른 PC에서 접속하려면 0.0.0.0)")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT,
+                        help=f"포트 (기본값: {DEFAULT_PORT})")
+    parser.add_argument('-d', '--work-dir', default='job_service_data',
+                        help="업로드와 결과를 저장할 폴더 (기본값: job_service_data)")
+    parser.add_argument('-j', '--workers', type=int, default=default_worker_count(),
+                        help="작업자 프로세스 수 (기본값: CPU 코어 수)")
+    parser.add_argument('--queue-limit', type=int, default=None,
+                        help=f"대기할 수 있는 최대 작업 수 (기본값: 작업자 수 x {DEFAULT_QUEUE_FACTOR})")
+    parser.add_argument('-f', '--format', choices=list(OUTPUT_FORMATS), default='csv',
+                        help="기본 출력 형식 (기본값: csv, 작업마다 format으로 바꿀 수 있음)")
+    parser.add_argument('--compression', choices=list(OUTPUT_COMPRESSIONS), default=None,
+                        help="Parquet/Feather 압축 방식 (기본값: 형식별 기본값)")
+    parser.add_argument('--stream', action='store_true',
+                        help="CSV 입력을 조각 단위로 스트리밍 처리합니다")
+    parser.add_argument('--compact', action='store_true',
+                        help="채널 열을 float32로 줄여 저장합니다")
+    parser.add_argument('--allow-root', action='append', default=[],
+                        help="경로로 작업을 받을 서버 폴더 (여러 번 지정 가능, 없으면 업로드만 허용)")
+    parser.add_argument('--result-ttl-hours', type=float, default=DEFAULT_RESULT_TTL_HOURS,
+                        help=f"끝난 작업의 결과를 보관하는 시간 (기본값: {DEFAULT_RESULT_TTL_HOURS}시간)")
+    parser.add_argument('--max-upload-mb', type=int, default=DEFAULT_MAX_UPLOAD_MB,
+                        help=f"업로드 최대 크기(MB) (기본값: {DEFAULT_MAX_UPLOAD_MB})")
+    return parser
+
+def main(argv=None):
+    """작업 서비스 진입점"""
+    args = build_parser().parse_args(argv)
+    options = {
+        'output_extension': OUTPUT_FORMATS[args.format],
+        'compression': args.compression,
+        'streaming': args.stream,
+        'compact': args.compact,
+    }
+    os.makedirs(args.work_dir, exist_ok=True)
+    service = JobService(args.work_dir, args.workers, args.queue_limit, options, args.allow_root,
+                         result_ttl=args.result_ttl_hours * 3600)
+    server = ThreadingHTTPServer((args.host, args.port), JobRequestHandler)
+    server.service = service
+    server.max_upload_bytes = args.max_upload_mb * 1024 * 1024
+    print(f"작업 서비스를 시작합니다: http://{args.host}:{server.server_port} "
+          f"(작업자 {service.workers}개, 대기 최대 {service.queue_limit}개, 작업 폴더 {service.work_dir})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n작업 서비스를 종료합니다.")
+    finally:
+        server.server_close()
+        service.shutdown()
+    return 0
+
+if __name__ == "__main__":
+    import multiprocessing
+    # PyInstaller 실행 파일에서 작업자 프로세스를 생성하기 위해 필요
+    multiprocessing.freeze_support()
+    sys.exit(main())
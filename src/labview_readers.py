@@ -0,0 +1,265 @@
+import io
+import mmap
+import os
+import numpy as np
+import pandas as pd
+from app_defaults import unique_column_names
+
+# LVM 헤더 블록의 끝을 표시하는 줄
+LVM_END_OF_HEADER = b'***End_of_Header***'
+
+# LVM 헤더의 Separator 값과 실제 구분자
+LVM_SEPARATORS = {'Tab': '\t', 'Comma': ','}
+
+def _decode(raw):
+    """LabVIEW가 시스템 코드 페이지로 쓴 헤더 텍스트를 해석합니다."""
+    for encoding in ('utf-8', 'cp949'):
+        try:
+            return raw.decode(encoding), encoding
+        except UnicodeDecodeError:
+            continue
+    return raw.decode('latin-1'), 'latin-1'
+
+def _parse_lvm_header(text):
+    """헤더 블록의 '키<탭>값' 줄을 사전으로 만듭니다."""
+    fields = {}
+    for line in text.splitlines():
+        key, _, value = line.partition('\t')
+        if key and key not in fields:
+            fields[key] = value.strip('\t\r ')
+    return fields
+
+def _line_end(mm, start):
+    """start 위치가 속한 줄의 끝(줄바꿈 문자 위치 또는 파일 끝)"""
+    end = mm.find(b'\n', start)
+    return len(mm) if end == -1 else end
+
+def _lvm_layout(mm):
+    """
+    메모리 맵으로 연 LVM 파일에서 헤더 표시 줄 위치와 세그먼트 시작 위치,
+    구분자, 소수점 기호, 인코딩을 구합니다.
+    """
+    # 헤더 표시 줄의 위치 목록 (첫 번째는 파일 헤더, 나머지는 세그먼트 헤더)
+    markers = []
+    position = mm.find(LVM_END_OF_HEADER)
+    while position != -1:
+        markers.append(position)
+        position = mm.find(LVM_END_OF_HEADER, position + len(LVM_END_OF_HEADER))
+
+    header_text, encoding = _decode(mm[:markers[0]] if markers else b'')
+    header = _parse_lvm_header(header_text)
+    separator = LVM_SEPARATORS.get(header.get('Separator', 'Tab'), '\t')
+    decimal = header.get('Decimal_Separator', '.') or '.'
+
+    # 각 세그먼트 데이터가 시작하는 위치 (헤더 표시 줄 다음 줄)
+    if not markers:
+        segment_starts = [0]
+    elif len(markers) == 1:
+        segment_starts = [_line_end(mm, markers[0]) + 1]
+    else:
+        segment_starts = [_line_end(mm, marker) + 1 for marker in markers[1:]]
+    return markers, segment_starts, separator, decimal, encoding
+
+def _lvm_names(first_line, separator, decimal):
+    """세그먼트 첫 줄이 숫자가 아니면 열 이름 줄로 보고 이름 목록을, 숫자면 None을 반환합니다."""
+    first_line = first_line.rstrip('\r')
+    first_field = first_line.split(separator)[0].strip()
+    try:
+        float(first_field.replace(decimal, '.'))
+        return None
+    except ValueError:
+        return unique_column_names([name.strip() for name in first_line.split(separator)])
+
+def _default_lvm_names(width):
+    """열 이름 줄이 없는 세그먼트에 LabVIEW 기본 이름(X_Value, Untitled 1, ...)을 붙입니다."""
+    return [f"Untitled {i}" if i else "X_Value" for i in range(width)]
+
+def add_sample_counter(df):
+    """
+    'sample' 열이 없는 LabVIEW 데이터에 0부터 시작하는 sample 열을 추가합니다.
+
+    웨이브폼 차트 내보내기의 sample 열과 같은 역할을 하므로 이후
+    process_data 단계가 그대로 동작합니다.
+
+    Args:
+        df (pandas.DataFrame): 채널 데이터
+
+    Returns:
+        pandas.DataFrame: sample 열이 맨 앞에 있는 DataFrame
+    """
+    if not any('sample' in str(col).lower() for col in df.columns):
+        df.insert(0, 'sample', np.arange(len(df), dtype=np.int64))
+    return df
+
+def read_lvm(file_path):
+    """
+    LabVIEW 텍스트 측정 파일(.lvm)을 DataFrame으로 읽습니다.
+
+    파일을 메모리 맵으로 열어 헤더 표시 줄의 위치만 찾은 뒤, 각 세그먼트의
+    숫자 블록은 pandas C 파서로 한 번에 변환합니다. 여러 세그먼트는 이어
+    붙이고, 비어 있는 'Comment' 열은 제거합니다. 열 이름 줄이 없는 세그먼트는
+    열 수가 같으면 앞 세그먼트의 열 이름을 따르며, 세그먼트마다 열 구성이
+    다르면 ValueError를 발생시킵니다.
+
+    Args:
+        file_path (str): .lvm 파일 경로
+
+    Returns:
+        pandas.DataFrame: 채널 데이터 (sample 열 포함)
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
+    if os.path.getsize(file_path) == 0:
+        raise ValueError(f"빈 LVM 파일입니다: {file_path}")
+
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        size = len(mm)
+        markers, segment_starts, separator, decimal, encoding = _lvm_layout(mm)
+
+        frames = []
+        previous_names = None
+        for i, start in enumerate(segment_starts):
+            if start >= size:
+                continue
+            # 다음 세그먼트 헤더('Channels' 줄) 직전까지가 이 세그먼트의 데이터
+            if i + 1 < len(segment_starts):
+                next_header = mm.rfind(b'\nChannels', start, markers[i + 2])
+                end = next_header + 1 if next_header != -1 else markers[i + 2]
+            else:
+                end = size
+
+            names_end = _line_end(mm, start)
+            names = _lvm_names(_decode(mm[start:names_end])[0], separator, decimal)
+            if names is not None:
+                start = names_end + 1
+            if start >= end:
+                continue
+
+            frame = pd.read_csv(io.BytesIO(mm[start:end]), sep=separator, header=None,
+                                names=names, decimal=decimal, encoding=encoding,
+                                engine='c', skip_blank_lines=True)
+            if names is None:
+                if previous_names is not None and len(previous_names) == frame.shape[1]:
+                    frame.columns = previous_names
+                else:
+                    frame.columns = _default_lvm_names(frame.shape[1])
+            previous_names = list(frame.columns)
+            frames.append(frame)
+
+    if not frames:
+        raise ValueError(f"LVM 파일에 데이터가 없습니다: {file_path}")
+
+    for number, frame in enumerate(frames[1:], start=2):
+        if list(frame.columns) != list(frames[0].columns):
+            raise ValueError(f"LVM 세그먼트 {number}의 열 구성이 첫 세그먼트와 다릅니다: "
+                             f"{list(frame.columns)} / {list(frames[0].columns)}")
+    df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+
+    # LabVIEW가 각 줄 끝에 붙이는 빈 Comment 열 제거
+    empty_columns = [col for col in df.columns
+                     if str(col).startswith('Comment') and df[col].isna().all()]
+    if empty_columns:
+        df = df.drop(columns=empty_columns)
+
+    return add_sample_counter(df)
+
+def read_tdms(file_path, group_name=None):
+    """
+    LabVIEW 이진 측정 파일(.tdms)의 한 그룹을 DataFrame으로 읽습니다.
+
+    npTDMS로 채널 데이터를 numpy 배열 단위로 읽으며, 그룹을 지정하지 않으면
+    채널이 있는 첫 번째 그룹을 사용합니다. 길이가 다른 채널은 NaN으로 채웁니다.
+
+    Args:
+        file_path (str): .tdms 파일 경로
+        group_name (str): 읽을 그룹 이름
+
+    Returns:
+        pandas.DataFrame: 채널 데이터 (sample 열 포함)
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
+    try:
+        from nptdms import TdmsFile
+    except ImportError:
+        raise ImportError("TDMS 파일을 읽으려면 npTDMS 패키지가 필요합니다: pip install npTDMS")
+
+    with TdmsFile.open(file_path) as tdms_file:
+        if group_name is not None:
+            group = tdms_file[group_name]
+        else:
+            group = next((g for g in tdms_file.groups() if g.channels()), None)
+            if group is None:
+                raise ValueError(f"TDMS 파일에 채널 데이터가 없습니다: {file_path}")
+
+        columns = {}
+        for channel in group.channels():
+            columns[channel.name] = pd.Series(channel.read_data())
+
+    return add_sample_counter(pd.DataFrame(columns))
+
+def _with_sample_name(names):
+    """add_sample_counter가 추가할 'sample' 열을 열 이름 목록에도 반영합니다."""
+    if not any('sample' in str(name).lower() for name in names):
+        names = ['sample'] + list(names)
+    return list(names)
+
+def read_lvm_columns(file_path):
+    """
+    .lvm 파일의 데이터를 읽지 않고 read_lvm이 만들 열 이름만 구합니다.
+
+    첫 세그먼트의 열 이름 줄(없으면 첫 데이터 줄의 열 수)로 이름을 정합니다.
+    LabVIEW가 줄 끝에 붙이는 'Comment' 열은 read_lvm처럼 빈 열로 보고 제외합니다.
+
+    Args:
+        file_path (str): .lvm 파일 경로
+
+    Returns:
+        list: 열 이름 목록 (sample 열 포함)
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
+    if os.path.getsize(file_path) == 0:
+        raise ValueError(f"빈 LVM 파일입니다: {file_path}")
+
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        _, segment_starts, separator, decimal, encoding = _lvm_layout(mm)
+        for start in segment_starts:
+            if start >= len(mm):
+                continue
+            first_line = mm[start:_line_end(mm, start)].decode(encoding).rstrip('\r')
+            if not first_line.strip():
+                continue
+            names = _lvm_names(first_line, separator, decimal)
+            if names is None:
+                names = _default_lvm_names(len(first_line.split(separator)))
+            names = [name for name in names if not str(name).startswith('Comment')]
+            return _with_sample_name(names)
+    raise ValueError(f"LVM 파일에 데이터가 없습니다: {file_path}")
+
+def read_tdms_columns(file_path, group_name=None):
+    """
+    .tdms 파일의 메타데이터만 읽어 read_tdms가 만들 열 이름을 구합니다.
+
+    Args:
+        file_path (str): .tdms 파일 경로
+        group_name (str): 읽을 그룹 이름
+
+    Returns:
+        list: 열 이름 목록 (sample 열 포함)
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
+    try:
+        from nptdms import TdmsFile
+    except ImportError:
+        raise ImportError("TDMS 파일을 읽으려면 npTDMS 패키지가 필요합니다: pip install npTDMS")
+
+    tdms_file = TdmsFile.read_metadata(file_path)
+    if group_name is not None:
+        group = tdms_file[group_name]
+    else:
+        group = next((g for g in tdms_file.groups() if g.channels()), None)
+        if group is None:
+            raise ValueError(f"TDMS 파일에 채널 데이터가 없습니다: {file_path}")
+    return _with_sample_name([channel.name for channel in group.channels()])
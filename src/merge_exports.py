@@ -0,0 +1,130 @@
+import os
+import numpy as np
+import pandas as pd
+
+from excel_processor import (
+    DEFAULT_CHUNK_SIZE,
+    TIME_FACTOR,
+    iter_processed_csv_chunks,
+    load_file,
+    load_xlsx_projected,
+    process_data,
+    select_columns,
+)
+from labview_readers import read_lvm_columns, read_tdms_columns
+from output_writers import open_writer
+from csv_backends import sniff_csv
+
+def processed_columns(file_path):
+    """
+    파일 전체를 읽지 않고 처리 후의 열 이름과 sample 열 이름을 구합니다.
+
+    CSV는 헤더 행만, 엑셀은 첫 데이터 행까지만 읽고, LabVIEW 파일은 .lvm의 첫
+    세그먼트 헤더와 .tdms의 메타데이터만 읽습니다.
+
+    Args:
+        file_path (str): 입력 파일 경로
+
+    Returns:
+        tuple: (정리된 열 이름 목록('Time' 제외), sample 열 이름)
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
+    file_extension = os.path.splitext(file_path)[1].lower()
+    if file_extension == '.csv':
+        columns = pd.read_csv(file_path, nrows=0, **sniff_csv(file_path)).columns
+    elif file_extension == '.xlsx':
+        columns = load_xlsx_projected(file_path, max_rows=1).columns
+    elif file_extension == '.lvm':
+        columns = read_lvm_columns(file_path)
+    elif file_extension == '.tdms':
+        columns = read_tdms_columns(file_path)
+    else:
+        columns = load_file(file_path).columns
+    _, keep_names, sample_column_name = select_columns(columns)
+    return keep_names, sample_column_name
+
+def _iter_processed_chunks(file_path, chunksize):
+    """CSV는 조각 단위로, 그 밖의 형식은 파일 하나씩 처리된 데이터를 반환합니다."""
+    if file_path.lower().endswith('.csv'):
+        yield from iter_processed_csv_chunks(file_path, chunksize, require_sample=True)
+    else:
+        yield process_data(load_file(file_path), require_sample=True)
+
+def merge_files(input_paths, output_path, chunksize=DEFAULT_CHUNK_SIZE, compact=False, progress_callback=None,
+                compression=None):
+    """
+    순서대로 나뉘어 내보내진 여러 파일을 Time이 이어지는 하나의 파일로 합칩니다.
+
+    먼저 모든 파일의 헤더만 읽어 정리된 열 이름 기준으로 전체 채널 목록을 만든 뒤,
+    파일을 하나씩(CSV는 조각 단위로) 처리해 곧바로 출력 파일에 이어 씁니다.
+    각 파일의 sample 값은 앞 파일의 마지막 sample 다음 값부터 이어지도록 옮기고
+    Time은 이어진 sample 값으로 다시 계산합니다. 어떤 파일에 없는 채널은 빈 값(NaN)으로
+    채우고, sample 열은 빈 값이 있어도 정수로 남도록 nullable Int64로 저장합니다.
+    숫자가 아닌 열은 자료형을 바꾸지 않고 그대로 씁니다. 출력 형식은 확장자로 결정되며,
+    열 구성이 고정되므로 Parquet/Feather가 적합합니다.
+
+    Args:
+        input_paths (list): 시간 순서대로 정렬된 입력 파일 경로 목록
+        output_path (str): 합친 결과를 저장할 파일 경로
+        chunksize (int): CSV 조각당 행 수
+        compact (bool): True이면 채널 열을 float32로 저장합니다
+        progress_callback (callable): 파일 하나가 끝날 때마다 (완료 수, 전체 수, 누적 행 수)로 호출
+        compression (str): Parquet/Feather 압축 방식 (없으면 형식별 기본값)
+
+    Returns:
+        dict: output, files, rows, columns 항목을 가진 요약
+    """
+    input_paths = list(input_paths)
+    if not input_paths:
+        raise ValueError("합칠 입력 파일이 없습니다.")
+
+    # 1단계: 헤더만 읽어 채널 목록과 각 파일의 sample 열 이름을 정합니다
+    sample_names = []
+    channels = []
+    for file_path in input_paths:
+        keep_names, sample_column_name = processed_columns(file_path)
+        if sample_column_name is None:
+            raise ValueError(f"'sample'을 포함하는 열을 찾을 수 없습니다: {file_path}")
+        sample_names.append(sample_column_name)
+        for name in keep_names:
+            if name != sample_column_name and name not in channels:
+                channels.append(name)
+
+    # 출력의 sample 열 이름은 첫 번째 파일을 따릅니다
+    sample_column = sample_names[0]
+    columns = ['Time', sample_column] + channels
+    channel_dtype = np.float32 if compact else np.float64
+    dtypes = {'Time': np.float64, sample_column: 'Int64', **{name: channel_dtype for name in channels}}
+
+    # 2단계: 파일을 하나씩 처리하며 sample/Time을 이어 붙여 씁니다
+    next_sample = None
+    with open_writer(output_path, compression=compression) as writer:
+        for index, (file_path, file_sample_column) in enumerate(zip(input_paths, sample_names), start=1):
+            offset = None
+            for chunk in _iter_processed_chunks(file_path, chunksize):
+                if len(chunk) == 0:
+                    continue
+                if file_sample_column != sample_column:
+                    chunk = chunk.rename(columns={file_sample_column: sample_column})
+                samples = pd.to_numeric(chunk[sample_column], errors='coerce')
+                valid = samples.dropna()
+                if offset is None and not valid.empty:
+                    # 첫 파일은 원래 값을 유지하고, 이후 파일은 앞 파일의 다음 sample부터 시작
+                    offset = 0 if next_sample is None else next_sample - valid.iloc[0]
+                chunk[sample_column] = samples + (offset or 0)
+                chunk['Time'] = chunk[sample_column] * TIME_FACTOR
+                chunk = chunk.reindex(columns=columns)
+                # 숫자 열만 출력 자료형으로 맞춥니다 (문자열 열을 float로 바꾸다 실패하지 않도록)
+                chunk = chunk.astype({name: dtype for name, dtype in dtypes.items()
+                                      if pd.api.types.is_numeric_dtype(chunk[name])})
+                writer.write(chunk)
+                if not valid.empty:
+                    next_sample = int(valid.iloc[-1] + offset) + 1
+            if progress_callback is not None:
+                progress_callback(index, len(input_paths), writer.rows_written)
+    total_rows = writer.rows_written
+
+    print(f"{len(input_paths)}개 파일을 합쳤습니다: {output_path} ({total_rows}행, 채널 {len(channels)}개)")
+    return {'output': os.path.abspath(output_path), 'files': len(input_paths),
+            'rows': total_rows, 'columns': columns}
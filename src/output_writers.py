@@ -0,0 +1,246 @@
+import gzip
+import io
+from functools import partial
+from openpyxl import Workbook
+from app_defaults import OUTPUT_COMPRESSIONS, OUTPUT_FORMATS, split_output_extension
+
+# 엑셀 시트 하나에 들어갈 수 있는 최대 행 수 (헤더 포함)
+XLSX_MAX_ROWS = 1_048_576
+
+def format_from_path(output_path):
+    """
+    출력 파일 확장자로 출력 형식을 결정합니다.
+
+    Args:
+        output_path (str): 출력 파일 경로
+
+    Returns:
+        str: OUTPUT_FORMATS의 형식 이름
+    """
+    file_extension = split_output_extension(output_path)[1].lower()
+    for name, extension in OUTPUT_FORMATS.items():
+        if extension == file_extension:
+            return name
+    if file_extension == '.arrow':
+        return 'feather'
+    raise ValueError(f"지원하지 않는 출력 파일 형식입니다: {file_extension}")
+
+def _import_pyarrow():
+    """pyarrow를 필요할 때만 불러옵니다 (Parquet/Feather 출력 전용)."""
+    try:
+        import pyarrow
+        return pyarrow
+    except ImportError:
+        raise ImportError("Parquet/Feather/zstd 압축 CSV 출력에는 pyarrow 패키지가 필요합니다: pip install pyarrow")
+
+def _codec(compression):
+    """압축 방식 이름을 pyarrow에 넘길 값으로 바꿉니다 ('none'이면 None)."""
+    if compression not in OUTPUT_COMPRESSIONS:
+        raise ValueError(f"지원하지 않는 압축 방식입니다: {compression} ({', '.join(OUTPUT_COMPRESSIONS)} 중 선택)")
+    return None if compression == 'none' else compression
+
+class ChunkWriter:
+    """
+    처리된 데이터 조각을 차례로 받아 파일에 이어 쓰는 출력기의 기본 클래스.
+
+    with 문으로 사용하며, 조각 하나만 쓰면 일반 저장과 같습니다.
+    """
+    def __init__(self, output_path):
+        self.output_path = output_path
+        self.rows_written = 0
+
+    def write(self, chunk):
+        """데이터 조각을 씁니다."""
+        self._write(chunk)
+        self.rows_written += len(chunk)
+
+    def _write(self, chunk):
+        raise NotImplementedError
+
+    def close(self):
+        """파일을 마무리합니다."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+class CsvChunkWriter(ChunkWriter):
+    """
+    CSV 출력기: 첫 조각에만 헤더를 씁니다.
+
+    append=True이면 이미 헤더가 있는 기존 파일 뒤에 행만 이어 씁니다.
+    """
+    def __init__(self, output_path, append=False):
+        super().__init__(output_path)
+        self.header_written = append
+
+    def _write(self, chunk):
+        chunk.to_csv(self.output_path, index=False,
+                     mode='a' if self.header_written else 'w',
+                     header=not self.header_written)
+        self.header_written = True
+
+class CompressedCsvChunkWriter(ChunkWriter):
+    """
+    압축 CSV 출력기 (gzip 또는 zstd).
+
+    압축 스트림 하나를 열어 둔 채 조각을 이어 쓰므로 파일 전체가 하나의 압축
+    프레임이 되고, 일반 CSV와 같은 헤더/행 구성으로 pd.read_csv에서 바로 읽힙니다.
+    gzip은 표준 라이브러리로, zstd는 pyarrow의 압축 스트림으로 씁니다.
+    """
+    def __init__(self, output_path, method):
+        super().__init__(output_path)
+        if method == 'gzip':
+            self.stream = gzip.open(output_path, 'wt', encoding='utf-8', newline='')
+        else:
+            raw = _import_pyarrow().output_stream(output_path, compression=method)
+            self.stream = io.TextIOWrapper(raw, encoding='utf-8', newline='')
+        self.header_written = False
+
+    def _write(self, chunk):
+        chunk.to_csv(self.stream, index=False, header=not self.header_written)
+        self.header_written = True
+
+    def close(self):
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
+
+class XlsxStreamWriter(ChunkWriter):
+    """
+    쓰기 전용(write-only) 엑셀 출력기.
+
+    행을 만들어지는 즉시 시트에 내보내므로 통합 문서 전체를 메모리에 만들지
+    않습니다. 시트 최대 행 수를 넘으면 헤더를 반복한 새 시트로 이어 씁니다.
+    """
+    def __init__(self, output_path):
+        super().__init__(output_path)
+        self.workbook = Workbook(write_only=True)
+        self.worksheet = None
+        self.sheet_rows = 0
+        self.columns = None
+
+    def _new_sheet(self):
+        self.worksheet = self.workbook.create_sheet(f"Sheet{len(self.workbook.worksheets) + 1}")
+        self.worksheet.append(self.columns)
+        self.sheet_rows = 1
+
+    def _write(self, chunk):
+        if self.columns is None:
+            self.columns = [str(col) for col in chunk.columns]
+            self._new_sheet()
+        # NaN은 엑셀에 쓸 수 없으므로 빈 셀(None)로 바꿉니다
+        values = chunk.astype(object).where(chunk.notna(), None)
+        for row in values.itertuples(index=False, name=None):
+            if self.sheet_rows >= XLSX_MAX_ROWS:
+                self._new_sheet()
+            self.worksheet.append(row)
+            self.sheet_rows += 1
+
+    def close(self):
+        if self.workbook is None:
+            return
+        if self.worksheet is None:
+            # 데이터가 하나도 없으면 빈 시트 하나를 만듭니다
+            self.workbook.create_sheet("Sheet1")
+        self.workbook.save(self.output_path)
+        self.workbook = None
+
+class ArrowChunkWriter(ChunkWriter):
+    """
+    Parquet/Feather(Arrow IPC) 출력기의 공통 부분.
+
+    첫 조각의 스키마를 기준으로 이후 조각을 같은 형식으로 맞춥니다.
+    compression이 없으면 각 형식의 기본값(Parquet은 snappy, Feather는 압축 안 함)을 씁니다.
+    """
+    def __init__(self, output_path, compression=None):
+        super().__init__(output_path)
+        self.pa = _import_pyarrow()
+        self.compression = compression
+        self.schema = None
+        self.writer = None
+
+    def _to_table(self, chunk):
+        if chunk.columns.has_duplicates:
+            duplicates = sorted({str(col) for col in chunk.columns[chunk.columns.duplicated()]})
+            raise ValueError(f"열 이름이 중복되어 Parquet/Feather로 저장할 수 없습니다: {duplicates}")
+        try:
+            return self.pa.Table.from_pandas(chunk, schema=self.schema, preserve_index=False)
+        except (self.pa.ArrowInvalid, self.pa.ArrowTypeError, ValueError) as e:
+            raise ValueError(f"데이터 조각의 열 형식이 첫 조각과 다릅니다: {e}")
+
+    def _write(self, chunk):
+        table = self._to_table(chunk)
+        if self.writer is None:
+            self.schema = table.schema
+            self.writer = self._open(self.schema)
+        self.writer.write_table(table)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+class ParquetChunkWriter(ArrowChunkWriter):
+    """Parquet 출력기: 조각마다 행 그룹(row group) 하나를 씁니다."""
+    def _open(self, schema):
+        import pyarrow.parquet as pq
+        if self.compression is None:
+            return pq.ParquetWriter(self.output_path, schema)
+        return pq.ParquetWriter(self.output_path, schema, compression=_codec(self.compression))
+
+class FeatherChunkWriter(ArrowChunkWriter):
+    """Feather(Arrow IPC 파일) 출력기: 조각마다 레코드 배치를 씁니다."""
+    def _open(self, schema):
+        codec = _codec(self.compression) if self.compression else None
+        if codec not in (None, 'zstd', 'lz4'):
+            raise ValueError(f"Feather 출력은 zstd/lz4 압축만 지원합니다: {codec}")
+        options = self.pa.ipc.IpcWriteOptions(compression=codec)
+        return self.pa.ipc.new_file(self.output_path, schema, options=options)
+
+WRITERS = {
+    'xlsx': XlsxStreamWriter,
+    'csv': CsvChunkWriter,
+    'csv.gz': partial(CompressedCsvChunkWriter, method='gzip'),
+    'csv.zst': partial(CompressedCsvChunkWriter, method='zstd'),
+    'parquet': ParquetChunkWriter,
+    'feather': FeatherChunkWriter,
+}
+
+# 압축 방식을 따로 지정할 수 있는 형식 (CSV는 확장자로 압축을 정합니다)
+COMPRESSIBLE_FORMATS = ('parquet', 'feather')
+
+def open_writer(output_path, output_format=None, compression=None):
+    """
+    출력 경로(또는 지정한 형식)에 맞는 조각 출력기를 엽니다.
+
+    Args:
+        output_path (str): 출력 파일 경로
+        output_format (str): 출력 형식 이름 (없으면 확장자로 결정)
+        compression (str): Parquet/Feather 압축 방식 (OUTPUT_COMPRESSIONS, 다른 형식에서는 무시)
+
+    Returns:
+        ChunkWriter: 출력기
+    """
+    output_format = output_format or format_from_path(output_path)
+    if output_format not in WRITERS:
+        raise ValueError(f"지원하지 않는 출력 형식입니다: {output_format}")
+    if compression and output_format in COMPRESSIBLE_FORMATS:
+        return WRITERS[output_format](output_path, compression)
+    return WRITERS[output_format](output_path)
+
+def write_dataframe(df, output_path, output_format=None, compression=None):
+    """
+    DataFrame 전체를 한 번에 저장합니다.
+
+    Args:
+        df (pandas.DataFrame): 저장할 DataFrame
+        output_path (str): 출력 파일 경로
+        output_format (str): 출력 형식 이름 (없으면 확장자로 결정)
+        compression (str): Parquet/Feather 압축 방식 (다른 형식에서는 무시)
+    """
+    with open_writer(output_path, output_format, compression) as writer:
+        writer.write(df)
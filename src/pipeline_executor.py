@@ -0,0 +1,265 @@
+import os
+import queue
+import threading
+import time
+
+from batch_processor import PROGRESS_POLL_SECONDS, _empty_result
+from channel_stats import ChannelStats, stats_output_path
+from decimation import ChartDecimator, chart_output_path, count_csv_rows, decimate_dataframe
+from excel_processor import (
+    default_output_path,
+    iter_processed_csv_chunks,
+    load_file,
+    process_data,
+)
+from instrumentation import PipelineStats
+from output_writers import open_writer, write_dataframe
+from process_manifest import file_sha256
+
+# 단계 사이 큐에 쌓아 둘 수 있는 최대 항목 수 (일반 모드는 파일 전체, 스트리밍은 조각 하나가 한 항목)
+DEFAULT_QUEUE_SIZE = 2
+
+# 단계 사이에 오가는 항목 종류
+CHUNK, END = 'chunk', 'end'
+
+class PipelineJob:
+    """
+    파이프라인을 지나는 작업(파일 또는 엑셀 시트) 하나의 상태.
+
+    세 단계 스레드가 같은 객체를 차례로 넘겨받으며 결과 사전과 단계 기록을 채웁니다.
+    앞 단계에서 오류가 나면 error가 설정되고, 뒤 단계는 남은 조각을 버린 뒤
+    END 항목에서 결과를 마무리합니다.
+    """
+    def __init__(self, input_path, sheet_name, options, sheet_suffix=True):
+        self.input_path = input_path
+        self.sheet_name = sheet_name
+        self.streaming = options['streaming'] and input_path.lower().endswith('.csv')
+        self.output_path = default_output_path(input_path, options['output_extension'], options['output_dir'],
+                                               sheet_name if sheet_suffix else None)
+        self.result = _empty_result(input_path, sheet_name=sheet_name)
+        self.stats = PipelineStats(input_path)
+        self.channel_stats = ChannelStats() if options['stats_format'] else None
+        self.decimator = None
+        self.chart_df = None
+        self.error = None
+        self.start = time.perf_counter()
+
+    def fail(self, e):
+        """첫 오류만 기록합니다."""
+        if self.error is None:
+            self.error = f"{type(e).__name__}: {e}"
+
+def _read_stage(jobs, options, transform_queue, events, stop_event):
+    """
+    읽기 단계: 파일을 읽어 다음 단계로 넘깁니다.
+
+    스트리밍 모드의 CSV는 조각마다 넘기므로, 첫 조각을 변환하는 동안 다음 조각을 읽습니다.
+    """
+    for job in jobs:
+        if stop_event.is_set():
+            break
+        try:
+            stat = os.stat(job.input_path)
+            job.result['bytes_read'] = stat.st_size
+            job.result['input_mtime_ns'] = stat.st_mtime_ns
+            if options['use_hash']:
+                job.result['sha256'] = file_sha256(job.input_path)
+
+            if job.streaming:
+                if options['chart_points']:
+                    job.decimator = ChartDecimator(count_csv_rows(job.input_path), options['chart_points'],
+                                                   options['chart_method'])
+
+                def progress(rows, bytes_read, total_bytes, job=job):
+                    events.put(('progress', (job.input_path, job.sheet_name, rows, bytes_read, total_bytes)))
+
+                chunks = iter_processed_csv_chunks(job.input_path, options['chunk_size'], require_sample=True,
+                                                   progress_callback=progress, compact=options['compact'])
+                read_bytes = stat.st_size
+                try:
+                    while job.error is None:
+                        begin = time.perf_counter()
+                        chunk = next(chunks, None)
+                        if chunk is None:
+                            break
+                        job.stats.add('read', time.perf_counter() - begin, rows=len(chunk), bytes_read=read_bytes)
+                        # 파일 크기는 첫 조각에만 셉니다
+                        read_bytes = None
+                        transform_queue.put((job, CHUNK, chunk))
+                finally:
+                    chunks.close()
+            else:
+                with job.stats.stage('read', bytes_read=stat.st_size) as record:
+                    df = load_file(job.input_path, compact=options['compact'], sheet_name=job.sheet_name,
+                                   csv_engine=options['csv_engine'])
+                    record['rows'] = len(df)
+                transform_queue.put((job, CHUNK, df))
+        except Exception as e:
+            job.fail(e)
+        transform_queue.put((job, END, None))
+    transform_queue.put(None)
+
+def _transform_stage(options, transform_queue, write_queue):
+    """변환 단계: 열 정리와 Time 열 추가, 채널 통계, 차트용 축소를 계산합니다."""
+    while True:
+        item = transform_queue.get()
+        if item is None:
+            break
+        job, kind, data = item
+        if kind == CHUNK and job.error is None:
+            try:
+                with job.stats.stage('transform', rows=len(data)):
+                    if not job.streaming:
+                        # 스트리밍 조각은 읽기 단계에서 이미 열 정리와 Time 열 추가가 끝나 있습니다
+                        data = process_data(data, require_sample=True)
+                    if job.channel_stats is not None:
+                        job.channel_stats.update(data)
+                    if job.decimator is not None:
+                        job.decimator.update(data)
+                    elif options['chart_points']:
+                        job.chart_df = decimate_dataframe(data, options['chart_points'], options['chart_method'])
+            except Exception as e:
+                job.fail(e)
+                continue
+        elif kind == END and job.error is None and job.decimator is not None:
+            try:
+                with job.stats.stage('transform'):
+                    job.chart_df = job.decimator.finish()
+            except Exception as e:
+                job.fail(e)
+        write_queue.put((job, kind, data))
+    write_queue.put(None)
+
+def _finish_job(job, writer, options):
+    """쓰기 단계에서 작업 하나를 마무리하고 결과 사전을 완성합니다."""
+    result = job.result
+    if writer is not None:
+        try:
+            with job.stats.stage('write') as record:
+                writer.close()
+                record['bytes_written'] = os.path.getsize(job.output_path)
+        except Exception as e:
+            job.fail(e)
+
+    if job.error is None:
+        try:
+            output_path = job.output_path
+            compression = options['compression']
+            if job.chart_df is not None:
+                chart_path = chart_output_path(output_path)
+                with job.stats.stage('chart', rows=len(job.chart_df)) as record:
+                    write_dataframe(job.chart_df, chart_path, compression=compression)
+                    record['bytes_written'] = os.path.getsize(chart_path)
+                result['chart_output'] = os.path.abspath(chart_path)
+            if job.channel_stats is not None:
+                stats_path = stats_output_path(output_path, options['stats_format'])
+                job.channel_stats.save(stats_path)
+                result['stats_output'] = os.path.abspath(stats_path)
+                result['channel_stats'] = job.channel_stats.to_dict()
+            result['output'] = os.path.abspath(output_path)
+            result['rows'] = writer.rows_written if writer is not None else 0
+            result['bytes_written'] = os.path.getsize(output_path)
+            print(f"처리된 파일이 성공적으로 저장되었습니다: {output_path} ({result['rows']}행)")
+        except Exception as e:
+            job.fail(e)
+
+    if job.error is not None:
+        # 중간까지 쓴 출력 파일은 남기지 않습니다
+        if writer is not None and os.path.exists(job.output_path):
+            os.remove(job.output_path)
+        result['output'] = None
+        result['rows'] = 0
+        result['error'] = job.error
+    result['seconds'] = time.perf_counter() - job.start
+    result['stages'] = job.stats.stages
+    return result
+
+def _write_stage(options, write_queue, events):
+    """쓰기 단계: 출력 파일에 이어 쓰고 작업이 끝나면 결과를 주 스레드로 보냅니다."""
+    writers = {}
+    while True:
+        item = write_queue.get()
+        if item is None:
+            break
+        job, kind, data = item
+        if kind == CHUNK:
+            if job.error is not None:
+                continue
+            try:
+                with job.stats.stage('write', rows=len(data)):
+                    writer = writers.get(job)
+                    if writer is None:
+                        writer = writers[job] = open_writer(job.output_path, compression=options['compression'])
+                    writer.write(data)
+            except Exception as e:
+                job.fail(e)
+            continue
+        events.put(('done', _finish_job(job, writers.pop(job, None), options)))
+    events.put(None)
+
+def run_pipeline(jobs, options, finish, fail_fast=False, chunk_callback=None, queue_size=DEFAULT_QUEUE_SIZE):
+    """
+    읽기 → 변환 → 쓰기 세 단계를 각각의 스레드에서 동시에 실행하며 작업을 차례로 처리합니다.
+
+    단계 사이는 크기가 제한된 큐로 이어져 있어, 파일 N을 변환하고 쓰는 동안 파일 N+1을
+    읽습니다 (스트리밍 모드에서는 조각 단위로 겹칩니다). 파싱, 압축, 디스크/네트워크 쓰기는
+    대부분 GIL을 놓고 실행되므로 한 프로세스 안에서도 단계들이 실제로 겹쳐 실행되며,
+    느린 공유 폴더에 쓰는 동안 CPU가 쉬지 않습니다.
+    앞 단계가 너무 앞서가지 않도록 큐가 차면 기다리므로 메모리는 queue_size에 비례합니다.
+
+    Args:
+        jobs (list): (입력 파일 경로, 시트 이름 또는 None, 출력 이름에 시트 이름을 붙일지 여부) 목록
+        options (dict): batch_processor.DEFAULT_OPTIONS 형식의 설정 (모든 항목이 채워져 있어야 함)
+        finish (callable): 작업 하나가 끝날 때마다 이 함수를 호출한 스레드에서 finish(결과)로 호출
+        fail_fast (bool): True이면 첫 오류 이후 아직 읽기 시작하지 않은 작업을 건너뜁니다
+        chunk_callback (callable): 스트리밍 모드에서 조각마다 이 함수를 호출한 스레드에서
+            chunk_callback(입력 파일, 시트, 누적 행 수, 읽은 바이트, 전체 바이트)로 호출
+        queue_size (int): 단계 사이 큐의 최대 항목 수
+    """
+    pipeline_jobs = []
+    for path, sheet_name, sheet_suffix in jobs:
+        try:
+            pipeline_jobs.append(PipelineJob(path, sheet_name, options, sheet_suffix))
+        except Exception as e:
+            finish(_empty_result(path, f"{type(e).__name__}: {e}", sheet_name))
+            if fail_fast:
+                return
+
+    transform_queue = queue.Queue(maxsize=queue_size)
+    write_queue = queue.Queue(maxsize=queue_size)
+    # 진행률과 완료 결과는 주 스레드가 받아 콜백을 호출합니다 (단계 스레드를 막지 않도록 크기 제한 없음)
+    events = queue.Queue()
+    stop_event = threading.Event()
+
+    threads = [
+        threading.Thread(target=_read_stage, args=(pipeline_jobs, options, transform_queue, events, stop_event),
+                         name='pipeline-read', daemon=True),
+        threading.Thread(target=_transform_stage, args=(options, transform_queue, write_queue),
+                         name='pipeline-transform', daemon=True),
+        threading.Thread(target=_write_stage, args=(options, write_queue, events),
+                         name='pipeline-write', daemon=True),
+    ]
+    for thread in threads:
+        thread.start()
+
+    try:
+        while True:
+            try:
+                event = events.get(timeout=PROGRESS_POLL_SECONDS)
+            except queue.Empty:
+                continue
+            if event is None:
+                break
+            kind, payload = event
+            if kind == 'progress':
+                if chunk_callback is not None:
+                    chunk_callback(*payload)
+                continue
+            finish(payload)
+            if fail_fast and payload['error']:
+                stop_event.set()
+    finally:
+        # 주 스레드에서 예외가 나도 읽기 단계가 새 작업을 시작하지 않도록 합니다
+        stop_event.set()
+        for thread in threads:
+            thread.join()
@@ -0,0 +1,142 @@
+import hashlib
+import json
+import os
+
+# 출력 폴더에 저장되는 처리 기록 파일 이름
+MANIFEST_FILE_NAME = '.processed_manifest.json'
+
+def file_sha256(file_path, block_size=1024 * 1024):
+    """
+    파일 내용의 SHA-256 해시를 계산합니다.
+
+    Args:
+        file_path (str): 파일 경로
+        block_size (int): 한 번에 읽는 바이트 수
+
+    Returns:
+        str: 16진수 해시 문자열
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def settings_key(settings):
+    """
+    처리 설정 사전을 비교 가능한 짧은 해시 문자열로 만듭니다.
+
+    Args:
+        settings (dict): 출력 결과에 영향을 주는 설정
+
+    Returns:
+        str: 설정 해시
+    """
+    encoded = json.dumps(settings, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+class ProcessManifest:
+    """
+    '_processed' 출력 폴더에 두는 처리 기록.
+
+    입력 파일의 경로, 크기, 수정 시각(선택적으로 내용 해시)과 처리 설정을
+    출력 파일 정보와 함께 기록해 두고, 다음 실행에서 입력과 설정이 그대로이며
+    출력 파일과 함께 만든 차트용/통계 파일도 남아 있으면 다시 처리하지 않도록 판단합니다.
+    """
+    def __init__(self, directory):
+        self.path = os.path.join(directory, MANIFEST_FILE_NAME)
+        self.entries = {}
+        self.changed = False
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError):
+                print(f"경고: 처리 기록 파일을 읽을 수 없어 새로 만듭니다: {self.path}")
+
+    @staticmethod
+    def _key(input_path, sheet_name=None):
+        key = os.path.normcase(os.path.abspath(input_path))
+        # 여러 시트를 따로 처리한 엑셀 파일은 시트마다 기록을 남깁니다
+        return f"{key}#{sheet_name}" if sheet_name else key
+
+    def lookup(self, input_path, settings, use_hash=False, sheet_name=None):
+        """
+        입력 파일이 같은 설정으로 이미 처리되었고 출력도 그대로인지 확인합니다.
+
+        크기와 수정 시각이 같으면 바로 일치로 봅니다. use_hash가 True이면
+        수정 시각만 달라진 경우(복사, touch 등) 내용 해시로 다시 비교합니다.
+
+        Args:
+            input_path (str): 입력 파일 경로
+            settings (str): settings_key로 만든 설정 해시
+            use_hash (bool): 내용 해시 비교 사용 여부
+            sheet_name (str): 시트별로 처리한 경우 시트 이름
+
+        Returns:
+            dict: 일치하는 기록 (없거나 달라졌으면 None)
+        """
+        entry = self.entries.get(self._key(input_path, sheet_name))
+        if entry is None or entry['settings'] != settings:
+            return None
+        try:
+            stat = os.stat(input_path)
+            output_stat = os.stat(entry['output'])
+        except OSError:
+            return None
+        if output_stat.st_size != entry['output_size']:
+            return None
+        if not all(os.path.exists(path) for path in entry.get('sidecars', [])):
+            return None
+        if stat.st_size != entry['size']:
+            return None
+        if stat.st_mtime_ns != entry['mtime_ns']:
+            if not (use_hash and entry.get('sha256')):
+                return None
+            if file_sha256(input_path) != entry['sha256']:
+                return None
+            # 내용이 같으면 다음에는 해시 계산 없이 바로 일치하도록 시각 갱신
+            entry['mtime_ns'] = stat.st_mtime_ns
+            self.changed = True
+        return entry
+
+    def record(self, input_path, settings, output_path, rows, sha256=None, size=None, mtime_ns=None,
+               sheet_name=None, sidecars=None):
+        """
+        처리가 끝난 입력 파일의 기록을 남깁니다.
+
+        Args:
+            input_path (str): 입력 파일 경로
+            settings (str): settings_key로 만든 설정 해시
+            output_path (str): 출력 파일 경로
+            rows (int): 처리된 행 수
+            sha256 (str): 입력 파일 내용 해시 (선택)
+            size (int): 처리 시작 시점의 입력 파일 크기 (없으면 지금 확인)
+            mtime_ns (int): 처리 시작 시점의 입력 파일 수정 시각 (없으면 지금 확인)
+            sheet_name (str): 시트별로 처리한 경우 시트 이름
+            sidecars (list): 함께 만든 차트용/통계 파일 경로 (하나라도 없어지면 다시 처리)
+        """
+        if size is None or mtime_ns is None:
+            stat = os.stat(input_path)
+            size, mtime_ns = stat.st_size, stat.st_mtime_ns
+        self.entries[self._key(input_path, sheet_name)] = {
+            'size': size,
+            'mtime_ns': mtime_ns,
+            'sha256': sha256,
+            'settings': settings,
+            'output': os.path.abspath(output_path),
+            'output_size': os.path.getsize(output_path),
+            'rows': rows,
+            'sidecars': [os.path.abspath(path) for path in sidecars or []],
+        }
+        self.changed = True
+
+    def save(self):
+        """변경된 기록을 파일에 저장합니다."""
+        if not self.changed:
+            return
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.path)
+        self.changed = False
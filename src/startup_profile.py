@@ -0,0 +1,102 @@
+import importlib
+import json
+import os
+import sys
+import time
+
+# 시작 시각 기준점 (GUI 모듈이 가장 먼저 불러오므로 GUI 모듈 로드 시작과 거의 같습니다)
+START_TIME = time.perf_counter()
+
+# 창이 처음 그려지기까지의 목표 시간 (초)
+FIRST_PAINT_TARGET_SECONDS = 1.0
+
+# 이 환경 변수가 있으면 시작 시간 보고서를 남깁니다 ('-'이면 표준 오류, 그 밖에는 JSON 파일 경로)
+PROFILE_ENV_VAR = 'LABVIEW_STARTUP_PROFILE'
+
+class StartupProfile:
+    """
+    GUI 시작 과정의 시점(창 생성, 첫 화면 표시 등)과 모듈별 불러오기 시간을 기록합니다.
+
+    시간은 모두 이 모듈을 불러온 시점부터의 초 단위입니다. 파이썬 인터프리터 자체의
+    시작 시간(PyInstaller 실행 파일의 압축 해제 포함)은 들어 있지 않으므로, 그 부분은
+    'python -X importtime'이나 실행 파일 전체 시간 측정으로 따로 확인합니다.
+    """
+    def __init__(self, start=None):
+        self.start = START_TIME if start is None else start
+        self.marks = {}
+        self.imports = {}
+
+    def elapsed(self):
+        """기준점부터 지금까지 걸린 시간 (초)"""
+        return time.perf_counter() - self.start
+
+    def mark(self, name):
+        """시점 하나를 기록합니다 (같은 이름은 처음 한 번만 기록)."""
+        self.marks.setdefault(name, self.elapsed())
+
+    def import_module(self, name):
+        """
+        모듈을 불러오며 걸린 시간을 기록합니다.
+
+        앞서 불러온 모듈이 이미 가져온 하위 모듈은 다시 세지 않으므로,
+        기록되는 값은 그 모듈 때문에 추가로 걸린 시간입니다.
+
+        Args:
+            name (str): 모듈 이름
+
+        Returns:
+            module: 불러온 모듈
+        """
+        already_loaded = name in sys.modules
+        begin = time.perf_counter()
+        module = importlib.import_module(name)
+        if not already_loaded:
+            self.imports[name] = time.perf_counter() - begin
+        return module
+
+    def report(self):
+        """
+        시작 시간 보고서.
+
+        Returns:
+            dict: marks(시점별 경과 시간), imports(모듈별 불러오기 시간), target_seconds,
+                within_target(첫 화면 표시가 목표 시간 안에 끝났는지) 항목을 가진 사전
+        """
+        first_paint = self.marks.get('first_paint')
+        return {
+            'marks': dict(self.marks),
+            'imports': dict(self.imports),
+            'target_seconds': FIRST_PAINT_TARGET_SECONDS,
+            'within_target': first_paint is not None and first_paint <= FIRST_PAINT_TARGET_SECONDS,
+        }
+
+    def format_report(self):
+        """사람이 읽기 쉬운 여러 줄 문자열로 만든 보고서"""
+        lines = ["시작 시간 보고서"]
+        for name, seconds in sorted(self.marks.items(), key=lambda item: item[1]):
+            lines.append(f"  {name:<20} {seconds * 1000:8.1f} ms")
+        if self.imports:
+            lines.append("모듈 불러오기 (느린 순)")
+            for name, seconds in sorted(self.imports.items(), key=lambda item: -item[1]):
+                lines.append(f"  {name:<20} {seconds * 1000:8.1f} ms")
+        first_paint = self.marks.get('first_paint')
+        if first_paint is not None and first_paint > FIRST_PAINT_TARGET_SECONDS:
+            lines.append(f"경고: 첫 화면 표시가 목표({FIRST_PAINT_TARGET_SECONDS:.1f}초)보다 느립니다")
+        return "\n".join(lines)
+
+    def write_report(self, destination=None):
+        """
+        보고서를 기록합니다. destination이 없으면 PROFILE_ENV_VAR 환경 변수를 따르고,
+        둘 다 없으면 아무것도 하지 않습니다.
+
+        Args:
+            destination (str): '-'이면 표준 오류에 표로, 그 밖에는 JSON 파일 경로
+        """
+        destination = destination or os.environ.get(PROFILE_ENV_VAR)
+        if not destination:
+            return
+        if destination == '-':
+            print(self.format_report(), file=sys.stderr)
+            return
+        with open(destination, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, ensure_ascii=False, indent=2)
@@ -0,0 +1,205 @@
+import io
+import mmap
+from tkinter import ttk
+
+# 이 모듈의 표 위젯은 GUI 창을 만들 때 바로 필요하므로, 창이 빨리 뜨도록
+# numpy/pandas는 CSV 원본을 열 때 불러옵니다
+
+# 줄 위치 색인을 만들 때 한 번에 검사하는 바이트 수
+INDEX_BLOCK_BYTES = 64 * 1024 * 1024
+
+class DataFrameSource:
+    """메모리에 있는 DataFrame에서 필요한 행 구간만 꺼내 주는 미리보기 데이터 원본."""
+    def __init__(self, df):
+        self.df = df
+        self.columns = [str(col) for col in df.columns]
+        self.row_count = len(df)
+
+    def rows(self, start, stop):
+        """start 이상 stop 미만 행의 값 목록"""
+        return list(self.df.iloc[start:stop].itertuples(index=False, name=None))
+
+    def close(self):
+        self.df = None
+
+class CsvFileSource:
+    """
+    디스크의 CSV 파일에서 필요한 행 구간만 읽어 주는 미리보기 데이터 원본.
+
+    처음 한 번 파일을 메모리 맵으로 훑어 각 줄의 시작 위치(행당 8바이트)만
+    색인해 두고, 이후에는 화면에 보이는 행의 바이트 구간만 파싱합니다.
+    구분자, 소수점 기호, 인코딩, 헤더 행 위치는 처리 단계와 같이 sniff_csv로 정합니다.
+    """
+    def __init__(self, file_path):
+        import pandas as pd
+        from csv_backends import sniff_csv
+        self.file_path = file_path
+        self.file = open(file_path, 'rb')
+        self.mm = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.csv_options = sniff_csv(file_path)
+        header_row = self.csv_options.pop('header')
+        self.columns = [str(col) for col in
+                        pd.read_csv(file_path, nrows=0, header=header_row, **self.csv_options).columns]
+        self.line_starts = self._index_lines()
+        self.header_line = self._physical_line(header_row)
+        # 헤더 줄과 그 앞의 설명 줄을 제외한 데이터 행 수
+        self.row_count = max(len(self.line_starts) - 2 - self.header_line, 0)
+
+    def _physical_line(self, row):
+        """pandas처럼 빈 줄을 빼고 센 row번째 줄의 실제 줄 번호"""
+        non_blank = 0
+        for line in range(len(self.line_starts) - 1):
+            if self.mm[int(self.line_starts[line]):int(self.line_starts[line + 1])].strip():
+                if non_blank == row:
+                    return line
+                non_blank += 1
+        return 0
+
+    def _index_lines(self):
+        import numpy as np
+        size = len(self.mm)
+        starts = [np.array([0], dtype=np.int64)]
+        for offset in range(0, size, INDEX_BLOCK_BYTES):
+            block = np.frombuffer(self.mm, dtype=np.uint8,
+                                  count=min(INDEX_BLOCK_BYTES, size - offset), offset=offset)
+            starts.append(np.flatnonzero(block == ord('\n')).astype(np.int64) + offset + 1)
+        line_starts = np.concatenate(starts)
+        # 마지막 줄이 줄바꿈으로 끝나지 않으면 파일 끝을 마지막 줄의 끝으로 추가
+        if line_starts[-1] != size:
+            line_starts = np.append(line_starts, size)
+        return line_starts
+
+    def rows(self, start, stop):
+        """start 이상 stop 미만 행의 값 목록"""
+        stop = min(stop, self.row_count)
+        if start >= stop:
+            return []
+        import pandas as pd
+        first = self.header_line + 1
+        begin = int(self.line_starts[first + start])
+        end = int(self.line_starts[first + stop])
+        # 줄 끝 구분자로 생기는 빈 열은 읽지 않습니다
+        frame = pd.read_csv(io.BytesIO(self.mm[begin:end]), header=None,
+                            usecols=range(len(self.columns)), **self.csv_options)
+        return list(frame.itertuples(index=False, name=None))
+
+    def close(self):
+        self.mm.close()
+        self.file.close()
+
+class VirtualTable(ttk.Frame):
+    """
+    행 수와 관계없이 화면에 보이는 행만 Treeview에 채우는 가상 스크롤 표.
+
+    Treeview에는 항상 보이는 만큼의 행만 들어 있고, 세로 스크롤바 위치를
+    전체 행 수에 대응시켜 스크롤할 때마다 해당 구간을 데이터 원본에서
+    가져옵니다. 수백만 행이어도 메모리와 응답 속도가 일정합니다.
+    """
+    def __init__(self, parent, style=None, height=12, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=1)
+        self.source = None
+        self.first_row = 0
+        self.visible_rows = height
+
+        self.tree = ttk.Treeview(self, style=style, show="headings", height=height)
+        self.vsb = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        hsb = ttk.Scrollbar(self, orient="horizontal", command=self.tree.xview)
+        self.tree.configure(xscrollcommand=hsb.set)
+        self.tree.grid(row=0, column=0, sticky='nsew')
+        self.vsb.grid(row=0, column=1, sticky='ns')
+        hsb.grid(row=1, column=0, sticky='ew')
+
+        self.tree.bind('<MouseWheel>', self._on_mousewheel)
+        self.tree.bind('<Button-4>', lambda e: self.scroll_to(self.first_row - 3))
+        self.tree.bind('<Button-5>', lambda e: self.scroll_to(self.first_row + 3))
+        self.tree.bind('<Configure>', self._on_resize)
+        for key, delta in (('<Up>', -1), ('<Down>', 1)):
+            self.tree.bind(key, lambda e, d=delta: self.scroll_to(self.first_row + d) or 'break')
+        self.tree.bind('<Prior>', lambda e: self.scroll_to(self.first_row - self.visible_rows) or 'break')
+        self.tree.bind('<Next>', lambda e: self.scroll_to(self.first_row + self.visible_rows) or 'break')
+
+    def show_message(self, message):
+        """데이터 대신 안내 문구를 표시합니다."""
+        self.set_source(None)
+        self.tree["columns"] = ["message"]
+        self.tree.heading("message", text="")
+        self.tree.column("message", width=400)
+        self.tree.insert("", "end", values=[message])
+
+    def set_source(self, source):
+        """
+        표시할 데이터 원본을 바꿉니다.
+
+        Args:
+            source: columns, row_count, rows(start, stop)을 가진 데이터 원본 (None이면 비움)
+        """
+        if self.source is not None and self.source is not source:
+            self.source.close()
+        self.source = source
+        self.first_row = 0
+        self.tree.delete(*self.tree.get_children())
+        if source is None:
+            self.vsb.set(0, 1)
+            return
+
+        # 같은 이름의 열이 있어도 구분되도록 Treeview 식별자는 위치로 만듭니다
+        columns = ["#"] + [f"c{i}" for i in range(len(source.columns))]
+        self.tree["columns"] = columns
+        self.tree.heading("#", text="#")
+        self.tree.column("#", width=80, minwidth=50, anchor='e', stretch=False)
+        for column_id, col in zip(columns[1:], source.columns):
+            self.tree.heading(column_id, text=col)
+            self.tree.column(column_id, width=100, minwidth=50)
+        self._render()
+
+    def scroll_to(self, first_row):
+        """first_row 행이 맨 위에 오도록 스크롤합니다."""
+        if self.source is None:
+            return
+        last_first = max(self.source.row_count - self.visible_rows, 0)
+        first_row = min(max(int(first_row), 0), last_first)
+        if first_row != self.first_row:
+            self.first_row = first_row
+            self._render()
+
+    def _render(self):
+        rows = self.source.rows(self.first_row, self.first_row + self.visible_rows)
+        items = self.tree.get_children()
+        for i, values in enumerate(rows):
+            values = (self.first_row + i,) + tuple(values)
+            if i < len(items):
+                self.tree.item(items[i], values=values)
+            else:
+                self.tree.insert("", "end", values=values)
+        if len(items) > len(rows):
+            self.tree.delete(*items[len(rows):])
+
+        total = max(self.source.row_count, 1)
+        self.vsb.set(self.first_row / total, min((self.first_row + self.visible_rows) / total, 1.0))
+
+    def _on_scrollbar(self, action, *args):
+        if self.source is None:
+            return
+        if action == 'moveto':
+            self.scroll_to(float(args[0]) * self.source.row_count)
+        elif action == 'scroll':
+            amount, unit = int(args[0]), args[1]
+            step = self.visible_rows if unit == 'pages' else 1
+            self.scroll_to(self.first_row + amount * step)
+
+    def _on_mousewheel(self, event):
+        self.scroll_to(self.first_row - int(event.delta / 120) * 3)
+        return 'break'
+
+    def _on_resize(self, event):
+        # 창 크기에 맞춰 보이는 행 수 조정
+        style = ttk.Style()
+        row_height = style.lookup(self.tree.cget('style') or 'Treeview', 'rowheight') or 20
+        visible = max(int(event.height / int(row_height)) - 1, 1)
+        if visible != self.visible_rows:
+            self.visible_rows = visible
+            if self.source is not None:
+                self.scroll_to(self.first_row)
+                self._render()
@@ -0,0 +1,249 @@
+import argparse
+import io
+import json
+import os
+import sys
+import time
+import pandas as pd
+
+from csv_backends import sniff_csv
+from excel_processor import OUTPUT_NAME_SUFFIXES, default_output_path, select_columns, transform_chunk
+from output_writers import CsvChunkWriter
+
+# 감시 상태(파일별 처리 위치)를 저장하는 파일 이름
+STATE_FILE_NAME = '.watch_state.json'
+
+# 기본 폴더 검사 주기 (초)
+DEFAULT_INTERVAL = 2.0
+
+# 한 번에 읽어 처리하는 최대 바이트 수 (큰 파일을 처음 처리할 때 메모리 제한)
+MAX_READ_BYTES = 64 * 1024 * 1024
+
+class FolderWatcher:
+    """
+    폴더를 주기적으로 검사하여 새로 생기거나 길어진 CSV 파일의 추가된 행만 처리합니다.
+
+    파일마다 이미 처리한 바이트 위치와 행 수를 상태 파일에 기록해 두고,
+    다음 검사 때는 그 위치부터 마지막 완성된 줄까지만 읽어 '_processed.csv'
+    뒤에 이어 씁니다. Time 열은 sample 열에서 계산되므로 이어 쓴 행에서도
+    자연스럽게 연속됩니다. 파일이 줄어들거나 헤더가 바뀌면 처음부터 다시 처리합니다.
+
+    상태에는 출력 파일 크기도 기록합니다. 행을 이어 쓴 뒤 상태를 저장하기 전에
+    종료되었다면 다음 검사 때 출력 파일을 기록된 크기로 잘라낸 뒤 다시 이어 쓰므로
+    같은 행이 두 번 들어가지 않습니다.
+    """
+    def __init__(self, directory, output_dir=None, state_path=None):
+        self.directory = directory
+        self.output_dir = output_dir
+        self.state_path = state_path or os.path.join(output_dir or directory, STATE_FILE_NAME)
+        self.state = self._load_state()
+
+    def _load_state(self):
+        if os.path.exists(self.state_path):
+            try:
+                with open(self.state_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                print(f"경고: 감시 상태 파일을 읽을 수 없어 처음부터 처리합니다: {self.state_path}")
+        return {}
+
+    def _save_state(self):
+        # 중간에 종료되어도 상태 파일이 깨지지 않도록 임시 파일에 쓴 뒤 교체
+        temp_path = self.state_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.state_path)
+
+    def candidate_files(self):
+        """감시 대상 CSV 파일 목록 ('_processed' 출력 파일 제외)"""
+        files = []
+        for name in sorted(os.listdir(self.directory)):
+            path = os.path.join(self.directory, name)
+            base_name, extension = os.path.splitext(name)
+            if (extension.lower() == '.csv' and not base_name.endswith(OUTPUT_NAME_SUFFIXES)
+                    and os.path.isfile(path)):
+                files.append(path)
+        return files
+
+    def _start_file(self, path):
+        """
+        헤더 줄을 찾아 새 파일의 처리 상태를 만듭니다. 첫 데이터 줄이 아직 없으면 None.
+
+        구분자, 소수점 기호, 인코딩은 첫 데이터 줄까지 쓰인 뒤 sniff_csv로 한 번 정해
+        상태에 기록하고, 이어 읽는 행에도 같은 설정을 씁니다. 헤더 앞의 설명 줄은 건너뜁니다.
+        """
+        csv_options = sniff_csv(path)
+        header_row = csv_options.pop('header')
+        header_line = None
+        offset = 0
+        non_blank = 0
+        with open(path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    return None
+                if line.strip():
+                    if header_line is not None:
+                        break
+                    # pandas처럼 빈 줄은 빼고 헤더 위치를 셉니다
+                    if non_blank == header_row:
+                        header_line = line
+                    non_blank += 1
+                offset += len(line)
+            else:
+                return None
+        header = list(pd.read_csv(io.BytesIO(header_line), nrows=0, **csv_options).columns)
+        return {
+            'header': header,
+            'offset': offset,
+            'rows': 0,
+            'output': default_output_path(path, '.csv', self.output_dir),
+            'csv_options': csv_options,
+        }
+
+    def process_file(self, path):
+        """
+        파일 하나에서 아직 처리하지 않은 완성된 줄을 처리합니다.
+
+        Args:
+            path (str): 입력 CSV 파일 경로
+
+        Returns:
+            int: 이번에 새로 처리한 행 수
+        """
+        key = os.path.abspath(path)
+        size = os.path.getsize(path)
+        entry = self.state.get(key)
+
+        if entry is not None:
+            restart = size < entry['offset'] or not os.path.exists(entry['output'])
+            if not restart:
+                current = self._start_file(path)
+                restart = current is None or current['header'] != entry['header']
+            if not restart:
+                restart = not self._rewind_output(entry)
+            if restart:
+                print(f"파일이 다시 작성되어 처음부터 처리합니다: {path}")
+                entry = None
+
+        if entry is None:
+            entry = self._start_file(path)
+            if entry is None:
+                return 0
+            append = False
+        else:
+            # 처리 중 오류가 나면 상태가 바뀌지 않도록 사본에서 작업합니다
+            entry = dict(entry)
+            append = True
+        csv_options = entry.get('csv_options', {})
+
+        keep_positions, keep_names, sample_column_name = select_columns(entry['header'])
+        new_rows = 0
+        with open(path, 'rb') as f, CsvChunkWriter(entry['output'], append=append) as writer:
+            while entry['offset'] < size:
+                f.seek(entry['offset'])
+                data = f.read(min(MAX_READ_BYTES, size - entry['offset']))
+
+                # 기록 중인 마지막 줄은 다음 검사 때 처리
+                last_newline = data.rfind(b'\n')
+                if last_newline == -1:
+                    break
+                data = data[:last_newline + 1]
+
+                if data.strip():
+                    chunk = pd.read_csv(io.BytesIO(data), header=None, usecols=keep_positions, **csv_options)
+                    chunk = transform_chunk(chunk, keep_names, sample_column_name)
+                    writer.write(chunk)
+                    new_rows += len(chunk)
+                    entry['rows'] += len(chunk)
+
+                entry['offset'] += len(data)
+
+            if not append and writer.rows_written == 0:
+                # 헤더만 있는 새 파일도 출력 파일(헤더)을 만들어 둡니다
+                header = (['Time'] if sample_column_name else []) + keep_names
+                writer.write(pd.DataFrame(columns=header))
+
+        entry['output_bytes'] = os.path.getsize(entry['output'])
+        self.state[key] = entry
+        return new_rows
+
+    def _rewind_output(self, entry):
+        """
+        출력 파일을 상태에 기록된 크기로 맞춥니다.
+
+        기록보다 크면 상태 저장 전에 이어 쓴 행이 있다는 뜻이므로 잘라냅니다.
+
+        Returns:
+            bool: 이어 쓸 수 있으면 True, 출력 파일이 기록보다 작아져 처음부터 처리해야 하면 False
+        """
+        recorded = entry.get('output_bytes')
+        if recorded is None:
+            return True
+        actual = os.path.getsize(entry['output'])
+        if actual < recorded:
+            return False
+        if actual > recorded:
+            print(f"저장되지 않은 이어 쓰기를 되돌립니다: {entry['output']} ({actual - recorded}바이트)")
+            with open(entry['output'], 'r+b') as f:
+                f.truncate(recorded)
+        return True
+
+    def scan_once(self):
+        """
+        폴더를 한 번 검사합니다.
+
+        Returns:
+            dict: 파일 경로별 새로 처리한 행 수 (변화가 있는 파일만)
+        """
+        updates = {}
+        for path in self.candidate_files():
+            try:
+                rows = self.process_file(path)
+            except Exception as e:
+                print(f"파일 처리 중 오류가 발생했습니다: {path} - {e}")
+                continue
+            if rows:
+                updates[path] = rows
+                print(f"{os.path.basename(path)}: {rows}행 추가 "
+                      f"(누적 {self.state[os.path.abspath(path)]['rows']}행)")
+                # 다시 처리할 범위가 작도록 파일마다 바로 저장합니다
+                self._save_state()
+        return updates
+
+    def run(self, interval=DEFAULT_INTERVAL):
+        """Ctrl+C로 중단할 때까지 주기적으로 폴더를 검사합니다."""
+        print(f"폴더 감시를 시작합니다: {os.path.abspath(self.directory)} ({interval}초 간격)")
+        try:
+            while True:
+                self.scan_once()
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            print("\n폴더 감시를 종료합니다.")
+
+def main(argv=None):
+    """폴더 감시 모드 진입점"""
+    parser = argparse.ArgumentParser(description="CSV 내보내기 폴더를 감시하여 추가된 행만 처리합니다")
+    parser.add_argument('directory', help="감시할 폴더")
+    parser.add_argument('-o', '--output-dir', default=None,
+                        help="출력 폴더 (기본값: 감시 폴더)")
+    parser.add_argument('-i', '--interval', type=float, default=DEFAULT_INTERVAL,
+                        help=f"검사 주기(초) (기본값: {DEFAULT_INTERVAL})")
+    parser.add_argument('--once', action='store_true',
+                        help="한 번만 검사하고 종료합니다 (스케줄러용)")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.directory):
+        print(f"폴더를 찾을 수 없습니다: {args.directory}", file=sys.stderr)
+        return 2
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    watcher = FolderWatcher(args.directory, args.output_dir)
+    if args.once:
+        watcher.scan_once()
+    else:
+        watcher.run(args.interval)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,30 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# 소스 모듈은 src 폴더 안에서 서로를 최상위 모듈로 불러옵니다
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+def sample_frame(rows=1000, channels=2, seed=0):
+    """LabVIEW 차트 내보내기와 같은 열 구성 (' sample 수 ', DOF1, ' sample 1 ', DOF2, ...)"""
+    rng = np.random.default_rng(seed)
+    columns = {' sample 수 ': np.arange(rows)}
+    for i in range(1, channels + 1):
+        columns[f'DOF{i}'] = rng.random(rows)
+        if i == 1:
+            columns[' sample 1 '] = np.arange(rows)
+    return pd.DataFrame(columns)
+
+@pytest.fixture
+def labview_csv(tmp_path):
+    """sample_frame을 CSV로 저장하고 경로를 돌려주는 함수"""
+    def make(name='run.csv', rows=1000, channels=2, seed=0, **to_csv_options):
+        path = tmp_path / name
+        sample_frame(rows, channels, seed).to_csv(path, index=False, **to_csv_options)
+        return str(path)
+    return make
@@ -0,0 +1,56 @@
+import os
+
+import pandas as pd
+
+from batch_processor import process_one, run_batch
+
+def test_run_batch_processes_files_in_parallel_and_keeps_input_order(labview_csv, tmp_path):
+    paths = [labview_csv(f'run_{i}.csv', rows=300, seed=i) for i in range(3)]
+    bad = tmp_path / 'bad.csv'
+    bad.write_text('a,b\n1,2\n', encoding='utf-8')
+    paths.insert(1, str(bad))
+
+    summary = run_batch(paths, {'output_extension': '.csv'}, workers=2)
+
+    assert [r['input'] for r in summary['results']] == paths
+    assert summary['succeeded'] == 3
+    assert summary['failed'] == 1
+    assert summary['rows'] == 900
+    assert summary['results'][1]['error'].startswith('ValueError')
+    for result in summary['results']:
+        if not result['error']:
+            assert pd.read_csv(result['output']).shape == (300, 4)
+
+def test_fail_fast_skips_remaining_files(labview_csv, tmp_path):
+    bad = tmp_path / 'bad.csv'
+    bad.write_text('a,b\n1,2\n', encoding='utf-8')
+    paths = [str(bad)] + [labview_csv(f'run_{i}.csv', rows=10) for i in range(3)]
+
+    summary = run_batch(paths, {'output_extension': '.csv'}, workers=1, fail_fast=True)
+
+    assert summary['failed'] == 1
+    assert summary['skipped'] == 3
+
+def test_process_one_reports_errors_instead_of_raising(tmp_path):
+    result = process_one(str(tmp_path / 'missing.csv'), {'output_extension': '.csv'})
+
+    assert result['output'] is None
+    assert result['error'].startswith('FileNotFoundError')
+    assert not os.path.exists(tmp_path / 'missing_processed.csv')
+
+def test_unchanged_inputs_are_skipped_until_output_or_sidecar_is_removed(labview_csv):
+    path = labview_csv(rows=50)
+    options = {'output_extension': '.csv', 'chart_points': 10, 'stats_format': 'json'}
+
+    first = run_batch([path], options, workers=1)['results'][0]
+    assert run_batch([path], options, workers=1)['cached'] == 1
+
+    os.remove(first['stats_output'])
+    again = run_batch([path], options, workers=1)['results'][0]
+    assert not again['cached']
+    assert os.path.exists(first['stats_output'])
+
+    os.remove(first['chart_output'])
+    assert run_batch([path], options, workers=1)['cached'] == 0
+    assert run_batch([path], {**options, 'chart_points': 20}, workers=1)['cached'] == 0
+    assert run_batch([path], {**options, 'chart_points': 20, 'force': True}, workers=1)['cached'] == 0
@@ -0,0 +1,23 @@
+import json
+
+from benchmark_pipeline import SIZE_PRESETS, benchmark_file, estimated_frame_bytes, main
+
+def test_large_presets_exceed_default_in_memory_limit():
+    assert estimated_frame_bytes(*SIZE_PRESETS['medium']) < 4 * 1024 ** 3
+    assert estimated_frame_bytes(*SIZE_PRESETS['xlarge']) > 50 * 1024 ** 3
+
+def test_streaming_only_benchmark_skips_full_load(labview_csv, tmp_path):
+    case = benchmark_file(labview_csv(rows=300), ['csv', 'parquet'], str(tmp_path), in_memory=False)
+
+    assert case['rows'] == 300
+    assert list(case['stages']) == ['stream_csv', 'stream_parquet']
+
+def test_main_switches_to_streaming_above_memory_limit(tmp_path):
+    report_path = tmp_path / 'report.json'
+    main(['--sizes', 'tiny', '--data-dir', str(tmp_path), '--no-memory', '--max-memory-gb', '0.0001',
+          '--json', str(report_path)])
+
+    case = json.loads(report_path.read_text(encoding='utf-8'))['cases'][0]
+    assert case['rows'] == SIZE_PRESETS['tiny'][0]
+    assert 'load_file' not in case['stages']
+    assert 'stream_csv' in case['stages']
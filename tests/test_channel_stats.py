@@ -0,0 +1,68 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from channel_stats import ChannelStats, stats_output_path
+from conftest import sample_frame
+
+def _frame(rows=5000, seed=0):
+    df = sample_frame(rows, channels=2, seed=seed)
+    df['DOF2'] = df['DOF2'] * 1e6 + 1e9  # 큰 평균에서도 분산이 정확해야 함
+    df.loc[::7, 'DOF1'] = np.nan
+    df.insert(0, 'Time', df[' sample 수 '] * 0.01)
+    return df
+
+def test_chunked_updates_match_numpy():
+    df = _frame()
+    stats = ChannelStats()
+    for start in range(0, len(df), 333):
+        stats.update(df.iloc[start:start + 333])
+
+    result = stats.to_dict()
+    assert list(result) == ['DOF1', 'DOF2']
+    for column in result:
+        values = df[column].dropna().to_numpy()
+        assert result[column]['count'] == len(values)
+        assert result[column]['min'] == values.min()
+        assert result[column]['max'] == values.max()
+        assert result[column]['mean'] == pytest.approx(values.mean(), rel=1e-12)
+        assert result[column]['std'] == pytest.approx(values.std(ddof=1), rel=1e-9)
+        assert result[column]['rms'] == pytest.approx(np.sqrt((values ** 2).mean()), rel=1e-12)
+
+def test_merge_equals_single_pass():
+    first, second = _frame(seed=1), _frame(rows=17, seed=2)
+    left, right, whole = ChannelStats(), ChannelStats(), ChannelStats()
+    left.update(first)
+    right.update(second)
+    whole.update(pd.concat([first, second], ignore_index=True))
+
+    left.merge(right)
+
+    for column, expected in whole.to_dict().items():
+        assert left.to_dict()[column] == pytest.approx(expected, rel=1e-12)
+
+def test_empty_and_single_value_channels():
+    stats = ChannelStats()
+    stats.update(pd.DataFrame({'sample': [0, 1], 'DOF1': [np.nan, np.nan], 'DOF2': [np.nan, 3.0]}))
+
+    result = stats.to_dict()
+    assert result['DOF1'] == {'count': 0, 'min': None, 'max': None, 'mean': None, 'rms': None, 'std': None}
+    assert result['DOF2']['std'] is None
+    assert 'DOF1: 값 없음' in stats.format_summary()
+
+def test_save_json_and_csv(tmp_path):
+    stats = ChannelStats()
+    stats.update(_frame(rows=100))
+    json_path = stats_output_path(str(tmp_path / 'run_processed.xlsx'))
+    csv_path = stats_output_path(str(tmp_path / 'run_processed.csv.gz'), 'csv')
+
+    stats.save(json_path)
+    stats.save(csv_path)
+
+    assert json_path.endswith('run_processed_stats.json')
+    assert csv_path.endswith('run_processed_stats.csv')
+    with open(json_path, encoding='utf-8') as f:
+        assert json.load(f) == stats.to_dict()
+    assert pd.read_csv(csv_path, index_col='channel').loc['DOF2', 'count'] == 100
@@ -0,0 +1,31 @@
+import json
+import os
+
+from excel_processor_cli import collect_input_files, main
+
+def test_collect_input_files_orders_naturally_and_skips_outputs_in_dirs_and_globs(tmp_path):
+    for name in ('run_10.csv', 'run_2.csv', 'run_2_processed.csv', 'notes.txt'):
+        (tmp_path / name).write_text('x', encoding='utf-8')
+    nested = tmp_path / 'day2'
+    nested.mkdir()
+    (nested / 'run_1.csv').write_text('x', encoding='utf-8')
+
+    flat = collect_input_files([str(tmp_path)])
+    deep = collect_input_files([str(tmp_path)], recursive=True)
+
+    assert [os.path.basename(p) for p in flat] == ['run_2.csv', 'run_10.csv']
+    assert len(deep) == 3
+    assert collect_input_files([str(tmp_path / '*'), str(tmp_path / 'run_2.csv')]) == [
+        str(tmp_path / 'run_2.csv'), str(tmp_path / 'run_10.csv')]
+
+def test_main_prints_json_summary_and_sets_exit_code(labview_csv, tmp_path, capsys):
+    good = labview_csv('good.csv', rows=20)
+    out_dir = tmp_path / 'out'
+
+    assert main([good, '-f', 'csv', '-o', str(out_dir), '-j', '1']) == 0
+    summary = json.loads(capsys.readouterr().out)
+    assert summary['succeeded'] == 1
+    assert os.path.exists(out_dir / 'good_processed.csv')
+
+    assert main([str(tmp_path / 'missing.csv'), '-j', '1', '--no-skip']) == 1
+    assert main([str(tmp_path / 'nothing_*.csv')]) == 2
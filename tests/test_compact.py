@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+
+from conftest import sample_frame
+from excel_processor import compact_dtypes, iter_processed_csv_chunks, load_file
+
+def test_compact_dtypes_shrinks_channels_and_sample_counter():
+    df = sample_frame(rows=1000)
+
+    compacted, saved = compact_dtypes(df.copy())
+
+    assert compacted['DOF1'].dtype == np.float32
+    assert compacted[' sample 수 '].dtype == np.int16
+    assert saved > 0
+    np.testing.assert_allclose(compacted['DOF1'], df['DOF1'], rtol=1e-6)
+
+def test_float_sample_column_keeps_exact_values():
+    df = pd.DataFrame({'sample': [0.0, 1.0, np.nan], 'DOF1': [0.1, 0.2, 0.3]})
+
+    compacted, _ = compact_dtypes(df)
+
+    assert compacted['sample'].dtype == np.float64
+    assert compacted['DOF1'].dtype == np.float32
+
+def test_compact_load_and_streaming_chunks_share_schema(labview_csv):
+    path = labview_csv(rows=500)
+
+    df = load_file(path, compact=True)
+    chunks = list(iter_processed_csv_chunks(path, chunksize=200, compact=True))
+
+    assert df['DOF1'].dtype == np.float32
+    assert {str(chunk['sample 수'].dtype) for chunk in chunks} == {'int32'}
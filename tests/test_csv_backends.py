@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from csv_backends import read_csv, sniff_csv
+from excel_processor import iter_processed_csv_chunks
+
+def test_sniff_skips_description_lines_and_detects_decimal_comma(tmp_path):
+    path = tmp_path / 'run.csv'
+    path.write_text('측정 장비: A\n\nsample;DOF1\n0;-0,75\n1;1,5E-3\n', encoding='cp949')
+
+    options = sniff_csv(str(path))
+
+    assert {key: options[key] for key in ('sep', 'decimal', 'encoding', 'header')} == \
+        {'sep': ';', 'decimal': ',', 'encoding': 'cp949', 'header': 1}
+    assert read_csv(str(path))['DOF1'].tolist() == [-0.75, 0.0015]
+
+def test_trailing_tab_on_data_rows_keeps_header_row(tmp_path):
+    path = tmp_path / 'run.txt'
+    path.write_text('sample\tDOF1\tDOF2\n' + ''.join(f'{i}\t{i / 3}\t{i * 2}\t\n' for i in range(5)),
+                    encoding='utf-8')
+
+    options = sniff_csv(str(path))
+    df = read_csv(str(path))
+
+    assert options['header'] == 0
+    assert options['index_col'] is False
+    assert list(df.columns) == ['sample', 'DOF1', 'DOF2']
+    assert df['sample'].tolist() == list(range(5))
+
+def test_partial_last_line_does_not_move_header(tmp_path):
+    path = tmp_path / 'run.csv'
+    path.write_text('sample,DOF1,DOF2\n0,1,2\n1,2,3\n2,3', encoding='utf-8')
+
+    assert sniff_csv(str(path))['header'] == 0
+
+def test_auto_and_streaming_parsers_read_equal_values(tmp_path):
+    values = np.random.default_rng(0).normal(size=(2000, 2)) * 10.0 ** np.arange(-3, 3, 3)
+    path = tmp_path / 'run.csv'
+    pd.DataFrame({'sample': np.arange(2000), 'DOF1': values[:, 0], 'DOF2': values[:, 1]}).to_csv(path, index=False)
+
+    frames = {engine: read_csv(str(path), engine=engine) for engine in ('auto', 'c')}
+    streamed = pd.concat(iter_processed_csv_chunks(str(path), chunksize=300), ignore_index=True)
+
+    for column, original in (('DOF1', values[:, 0]), ('DOF2', values[:, 1])):
+        # C 파서 기본 설정은 아래 자리가 조금 다를 수 있어 근사 비교합니다
+        np.testing.assert_allclose(frames['auto'][column].to_numpy(), original, rtol=1e-12)
+        np.testing.assert_allclose(frames['c'][column].to_numpy(), original, rtol=1e-12)
+        np.testing.assert_allclose(streamed[column].to_numpy(), original, rtol=1e-12)
+
+def test_quoted_fields_do_not_count_as_delimiters(tmp_path):
+    path = tmp_path / 'run.csv'
+    path.write_text('sample,"Force, N",DOF2\n0,1.5,2\n1,2.5,3\n', encoding='utf-8')
+
+    options = sniff_csv(str(path))
+    df = read_csv(str(path))
+
+    assert (options['sep'], options['header']) == (',', 0)
+    assert 'index_col' not in options
+    assert list(df.columns) == ['sample', 'Force, N', 'DOF2']
+    assert df['Force, N'].tolist() == [1.5, 2.5]
+
+def test_quoted_decimal_comma_values_are_detected(tmp_path):
+    path = tmp_path / 'run.csv'
+    path.write_text('sample;"Force; N";DOF2\n0;"1,5";2\n1;"-0,25";3\n', encoding='utf-8')
+
+    options = sniff_csv(str(path))
+
+    assert {key: options[key] for key in ('sep', 'decimal', 'header')} == {'sep': ';', 'decimal': ',', 'header': 0}
+    assert read_csv(str(path), engine='c')['Force; N'].tolist() == [1.5, -0.25]
+
+def test_unknown_engine_raises(tmp_path):
+    with pytest.raises(ValueError):
+        read_csv(str(tmp_path / 'run.csv'), engine='python')
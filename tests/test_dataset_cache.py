@@ -0,0 +1,78 @@
+import os
+import shutil
+
+import pandas as pd
+import pytest
+
+import dataset_cache
+from conftest import sample_frame
+from dataset_cache import DatasetCache
+
+@pytest.fixture
+def cache(tmp_path):
+    return DatasetCache(str(tmp_path / 'cache'), max_bytes=10 * 1024 * 1024)
+
+def _input(tmp_path, name='run.csv'):
+    path = tmp_path / name
+    path.write_text('sample,DOF1\n0,1\n', encoding='utf-8')
+    return str(path)
+
+def test_stored_frame_reopens_with_same_values(cache, tmp_path):
+    input_path = _input(tmp_path)
+    df = sample_frame(rows=100)
+
+    assert cache.store(df, input_path, settings={'compact': False})
+
+    loaded = cache.load(input_path, settings={'compact': False})
+    pd.testing.assert_frame_equal(loaded.copy(), df)
+    assert cache.load(input_path, settings={'compact': True}) is None
+    assert not cache.store(df.assign(note='x'), input_path)
+
+def test_recorded_output_is_current_until_rewritten(cache, tmp_path):
+    input_path = _input(tmp_path)
+    output_path = tmp_path / 'run_processed.csv'
+    output_path.write_text('a\n1\n', encoding='utf-8')
+    cache.store(sample_frame(rows=10), input_path)
+
+    assert not cache.has_output(str(output_path), input_path)
+    assert cache.record_output(str(output_path), input_path)
+    assert cache.has_output(str(output_path), input_path)
+    assert not cache.has_output(str(output_path), input_path, settings={'compact': True})
+
+    output_path.write_text('a\n1\n2\n', encoding='utf-8')
+    assert not cache.has_output(str(output_path), input_path)
+
+def test_evict_skips_entries_in_use(cache, tmp_path, monkeypatch):
+    cache.max_bytes = sample_frame(rows=1000).memory_usage(index=False).sum()
+    inputs = [_input(tmp_path, f'run_{i}.csv') for i in range(3)]
+    cache.store(sample_frame(rows=1000), inputs[0])
+    in_use = cache.entries()[0][2]
+
+    # Windows에서 메모리 맵으로 열린 항목은 이름을 바꿀 수 없습니다
+    replace = os.replace
+    def locked_replace(src, dst):
+        if src == in_use:
+            raise PermissionError(src)
+        return replace(src, dst)
+    monkeypatch.setattr(dataset_cache.os, 'replace', locked_replace)
+
+    cache.store(sample_frame(rows=1000), inputs[1])
+    cache.store(sample_frame(rows=1000), inputs[2])
+
+    remaining = [entry_dir for _, _, entry_dir in cache.entries()]
+    assert in_use in remaining
+    assert len(remaining) == 2
+    assert cache.clear() == 1
+
+def test_failed_removal_is_reported(cache, tmp_path, monkeypatch, capsys):
+    cache.store(sample_frame(rows=10), _input(tmp_path))
+    def failing_rmtree(path, *args, **kwargs):
+        raise PermissionError(path)
+    monkeypatch.setattr(dataset_cache.shutil, 'rmtree', failing_rmtree)
+
+    assert cache.clear() == 0
+
+    assert '캐시 항목을 모두 지우지 못했습니다' in capsys.readouterr().out
+    assert cache.entries() == []
+    monkeypatch.undo()
+    shutil.rmtree(cache.cache_dir)
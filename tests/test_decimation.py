@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from decimation import ChartDecimator, chart_output_path, count_csv_rows, decimate_dataframe
+
+def _signal(rows=10_000, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({'Time': np.arange(rows) * 0.01, 'sample': np.arange(rows),
+                         'DOF1': rng.normal(size=rows), 'DOF2': np.sin(np.arange(rows) / 100)})
+
+def test_minmax_keeps_every_channel_extreme_within_target():
+    df = _signal()
+    df.loc[4321, 'DOF1'] = 50.0
+    df.loc[1234, 'DOF2'] = -50.0
+
+    chart = decimate_dataframe(df, target_points=200, method='minmax')
+
+    assert chart['DOF1'].max() == 50.0
+    assert chart['DOF2'].min() == -50.0
+    assert chart['Time'].is_monotonic_increasing
+    assert len(chart) <= 2 * 200
+
+def test_lttb_keeps_endpoints_and_isolated_spike():
+    df = _signal()[['Time', 'sample', 'DOF2']]
+    df['DOF2'] = 0.0
+    df.loc[5000, 'DOF2'] = 10.0
+
+    chart = decimate_dataframe(df, target_points=100, method='lttb')
+
+    assert chart['sample'].iloc[0] == 0
+    assert chart['sample'].iloc[-1] == len(df) - 1
+    assert 5000 in chart['sample'].tolist()
+    assert len(chart) <= 100
+
+@pytest.mark.parametrize('method', ['minmax', 'lttb'])
+def test_chunked_updates_equal_single_pass(method):
+    df = _signal(rows=9_999)
+    decimator = ChartDecimator(len(df), 300, method)
+    for start in range(0, len(df), 1_234):
+        decimator.update(df.iloc[start:start + 1_234].reset_index(drop=True))
+
+    pd.testing.assert_frame_equal(decimator.finish(), decimate_dataframe(df, 300, method))
+
+def test_invalid_settings_raise():
+    with pytest.raises(ValueError):
+        ChartDecimator(100, 100, 'average')
+    with pytest.raises(ValueError):
+        ChartDecimator(100, 2)
+
+def test_count_csv_rows_and_chart_path(tmp_path):
+    path = tmp_path / 'run.csv'
+    path.write_text('a\n1\n2\n3', encoding='utf-8')
+
+    assert count_csv_rows(str(path)) == 3
+    assert chart_output_path('out/run_processed.csv.gz') == 'out/run_processed_chart.csv.gz'
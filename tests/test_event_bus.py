@@ -0,0 +1,89 @@
+import threading
+
+import pytest
+
+from event_bus import EventBus
+from instrumentation import estimate_remaining_seconds, format_duration
+
+class FakeRoot:
+    """Tk root 대신 after 예약만 기록하는 객체"""
+    def __init__(self):
+        self.scheduled = []
+        self.cancelled = []
+
+    def after(self, interval_ms, callback):
+        self.scheduled.append((interval_ms, callback))
+        return len(self.scheduled)
+
+    def after_cancel(self, after_id):
+        self.cancelled.append(after_id)
+
+def test_calls_run_in_order_and_progress_keeps_last_value_per_channel():
+    bus = EventBus(FakeRoot())
+    seen = []
+    bus.call(seen.append, 'start')
+    for value in range(100):
+        bus.progress(seen.append, value)
+    bus.progress(seen.append, 'other', channel='status')
+    bus.call(seen.append, 'done')
+
+    assert bus.drain() == 4
+    assert seen == ['start', 99, 'other', 'done']
+    assert bus.drain() == 0
+
+def test_worker_threads_only_enqueue():
+    bus = EventBus(FakeRoot())
+    seen = []
+    workers = [threading.Thread(target=bus.call, args=(seen.append, i)) for i in range(8)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert seen == []
+    assert bus.drain() == 8
+    assert sorted(seen) == list(range(8))
+
+def test_failing_callback_does_not_stop_delivery(capsys):
+    bus = EventBus(FakeRoot())
+    seen = []
+    bus.call(lambda: 1 / 0)
+    bus.call(seen.append, 'after')
+
+    bus.drain()
+
+    assert seen == ['after']
+    assert 'ZeroDivisionError' in capsys.readouterr().err
+
+def test_poll_reschedules_until_stopped():
+    root = FakeRoot()
+    bus = EventBus(root, interval_ms=20)
+    bus.start()
+    bus.start()
+    assert len(root.scheduled) == 1
+
+    interval, poll = root.scheduled[0]
+    poll()
+    assert interval == 20
+    assert len(root.scheduled) == 2
+
+    bus.stop()
+    assert root.cancelled == [2]
+    assert bus.after_id is None
+
+@pytest.mark.parametrize('elapsed, fraction, expected', [
+    (10.0, 0.25, 30.0),
+    (10.0, 1.0, 0.0),
+    (10.0, 0.0, None),
+])
+def test_estimate_remaining_seconds(elapsed, fraction, expected):
+    assert estimate_remaining_seconds(elapsed, fraction) == expected
+
+@pytest.mark.parametrize('seconds, expected', [
+    (None, '계산 중'),
+    (12.4, '12초'),
+    (200, '3분 20초'),
+    (3725, '1시간 2분'),
+])
+def test_format_duration(seconds, expected):
+    assert format_duration(seconds) == expected
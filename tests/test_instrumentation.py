@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+from instrumentation import PipelineStats, merge_stage_totals
+
+def test_stage_records_rows_bytes_and_rate():
+    stats = PipelineStats('run.csv')
+    with stats.stage('load', bytes_read=100) as record:
+        record['rows'] = 50
+
+    stage = stats.stages['load']
+    assert stage['rows'] == 50
+    assert stage['bytes_read'] == 100
+    assert stage['rows_per_second'] == pytest.approx(50 / stage['seconds'])
+    assert json.loads(stats.to_json())['label'] == 'run.csv'
+
+def test_add_accumulates_same_stage():
+    stats = PipelineStats()
+    stats.add('read', 1.0, rows=10, bytes_read=100)
+    stats.add('read', 2.0, rows=20)
+
+    stage = stats.stages['read']
+    assert stage['seconds'] == 3.0
+    assert stage['rows'] == 30
+    assert stage['bytes_read'] == 100
+    assert stage['bytes_written'] is None
+    assert stats.total_seconds() == 3.0
+
+def test_stage_is_recorded_even_when_it_raises():
+    stats = PipelineStats()
+    with pytest.raises(RuntimeError):
+        with stats.stage('save'):
+            raise RuntimeError
+    assert 'save' in stats.stages
+
+def test_merge_stage_totals_sums_per_stage():
+    first = PipelineStats()
+    first.add('load', 1.0, rows=10, bytes_read=5)
+    second = PipelineStats()
+    second.add('load', 3.0, rows=30)
+    second.add('save', 1.0, bytes_written=7)
+
+    totals = merge_stage_totals([first.stages, second.stages])
+
+    assert totals['load']['seconds'] == 4.0
+    assert totals['load']['rows'] == 40
+    assert totals['load']['rows_per_second'] == 10.0
+    assert totals['save']['bytes_written'] == 7
@@ -0,0 +1,150 @@
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import Future
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from job_service import JobRequestHandler, JobService, QueueFull
+
+class PendingExecutor:
+    """작업을 실행하지 않고 Future만 돌려주는 프로세스 풀 대역"""
+    def __init__(self):
+        self.futures = []
+
+    def submit(self, fn, *args):
+        future = Future()
+        self.futures.append(future)
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+@pytest.fixture
+def service(tmp_path):
+    service = JobService(str(tmp_path / 'work'), workers=1, queue_limit=2,
+                         allowed_roots=[str(tmp_path / 'shared')])
+    service.executor.shutdown()
+    service.executor = PendingExecutor()
+    return service
+
+@pytest.fixture
+def server(service):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), JobRequestHandler)
+    server.service = service
+    server.max_upload_bytes = 1024 * 1024
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+def _post(url, body, content_type='application/json'):
+    request = urllib.request.Request(url, data=body, method='POST', headers={'Content-Type': content_type})
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+def test_allowed_paths_are_resolved_before_comparison(service, tmp_path):
+    shared = tmp_path / 'shared'
+    shared.mkdir()
+    (shared / 'run.csv').write_text('a\n', encoding='utf-8')
+    outside = tmp_path / 'secret.csv'
+    outside.write_text('a\n', encoding='utf-8')
+    os.symlink(outside, shared / 'link.csv')
+
+    assert service.is_allowed_path(str(shared / 'run.csv'))
+    assert not service.is_allowed_path(str(shared / '..' / 'secret.csv'))
+    assert not service.is_allowed_path(str(shared / 'link.csv'))
+
+def test_paths_on_other_drives_are_rejected(service, monkeypatch):
+    def different_drives(paths):
+        raise ValueError("Paths don't have the same drive")
+    monkeypatch.setattr(os.path, 'commonpath', different_drives)
+
+    assert not service.is_allowed_path('D:\\data\\run.csv')
+
+def test_concurrent_submits_respect_queue_limit(service, tmp_path):
+    results = []
+    def submit(i):
+        try:
+            results.append(service.submit(f'job{i}', str(tmp_path / 'run.csv'), 'path'))
+        except QueueFull:
+            results.append(None)
+    threads = [threading.Thread(target=submit, args=(i,)) for i in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum(result is not None for result in results) == 2
+    assert service.pending_count() == 2
+
+def test_finished_upload_is_removed_and_old_results_are_swept(service, tmp_path):
+    upload_dir = service.upload_dir('job1')
+    os.makedirs(upload_dir)
+    service.submit('job1', os.path.join(upload_dir, 'run.csv'), 'upload')
+    result_path = os.path.join(service.result_dir('job1'), 'run_processed.csv')
+    with open(result_path, 'w', encoding='utf-8') as f:
+        f.write('a\n')
+    leftover = service.result_dir('from_previous_run')
+    os.makedirs(leftover)
+    os.utime(leftover, (0, 0))
+
+    service.executor.futures[0].set_result({'results': [{'output': result_path, 'bytes_read': 1, 'bytes_written': 2,
+                                                         'error': None}], 'rows': 1, 'seconds': 0.1})
+
+    assert not os.path.exists(upload_dir)
+    assert service.status('job1')['outputs'] == ['run_processed.csv']
+    assert service.sweep() == 0
+    assert not os.path.exists(leftover)
+
+    assert service.sweep(now=time.time() + service.result_ttl + 1) == 1
+    assert service.status('job1') is None
+    assert not os.path.exists(service.result_dir('job1'))
+
+@pytest.mark.parametrize('body', [b'[]', b'"x"', b'{"path": 3}'])
+def test_non_object_json_bodies_are_rejected(server, body):
+    status, payload = _post(f"{server}/jobs", body)
+
+    assert status == 400
+    assert 'error' in payload
+
+def test_full_queue_returns_503(server, service, tmp_path):
+    shared = tmp_path / 'shared'
+    shared.mkdir()
+    (shared / 'run.csv').write_text('a\n', encoding='utf-8')
+    body = json.dumps({'path': str(shared / 'run.csv')}).encode('utf-8')
+
+    assert [_post(f"{server}/jobs", body)[0] for _ in range(3)] == [202, 202, 503]
+    assert _post(f"{server}/jobs", json.dumps({'path': str(tmp_path / 'x.csv')}).encode())[0] == 503
+
+def test_uploaded_file_is_processed_end_to_end(tmp_path, labview_csv):
+    service = JobService(str(tmp_path / 'work'), workers=1, options={'output_extension': '.csv'})
+    try:
+        with open(labview_csv(rows=20), 'rb') as f:
+            upload_dir = service.upload_dir('job1')
+            os.makedirs(upload_dir)
+            path = os.path.join(upload_dir, 'run.csv')
+            with open(path, 'wb') as out:
+                out.write(f.read())
+        service.submit('job1', path, 'upload')
+        service.futures['job1'].result(timeout=60)
+        # 완료 콜백은 풀 관리 스레드에서 실행되므로 업로드 폴더가 지워질 때까지 기다립니다
+        deadline = time.time() + 10
+        while os.path.exists(upload_dir) and time.time() < deadline:
+            time.sleep(0.05)
+
+        status = service.status('job1')
+        assert status['state'] == 'succeeded'
+        assert status['rows'] == 20
+        assert status['outputs'] == ['run_processed.csv']
+        assert not os.path.exists(upload_dir)
+    finally:
+        service.shutdown()
@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from excel_processor import output_extension_for
+from labview_readers import read_lvm, read_lvm_columns, read_tdms, read_tdms_columns
+
+FILE_HEADER = (
+    "LabVIEW Measurement\t\n"
+    "Writer_Version\t2\n"
+    "Separator\tTab\n"
+    "Decimal_Separator\t.\n"
+    "***End_of_Header***\t\n"
+)
+
+def _segment(names, rows):
+    """세그먼트 헤더와 데이터 (names가 None이면 열 이름 줄 없음)"""
+    width = len(rows[0])
+    lines = ["", f"Channels\t{width - 1}\t", "***End_of_Header***\t"]
+    if names is not None:
+        lines.append("\t".join(names) + "\tComment")
+    for row in rows:
+        lines.append("\t".join(str(value) for value in row) + "\t")
+    return "\n".join(lines) + "\n"
+
+def _write(tmp_path, *segments):
+    path = tmp_path / 'run.lvm'
+    path.write_text(FILE_HEADER + "".join(segments), encoding='utf-8')
+    return str(path)
+
+def test_lvm_segments_are_concatenated_with_sample_counter(tmp_path):
+    path = _write(tmp_path,
+                  _segment(['X_Value', 'Ch1', 'Ch2'], [(0, 1.5, 2.5), (1, 1.6, 2.6)]),
+                  _segment(['X_Value', 'Ch1', 'Ch2'], [(2, 1.7, 2.7)]))
+
+    df = read_lvm(path)
+
+    assert list(df.columns) == ['sample', 'X_Value', 'Ch1', 'Ch2']
+    assert df['sample'].tolist() == [0, 1, 2]
+    assert df['Ch2'].tolist() == [2.5, 2.6, 2.7]
+
+def test_lvm_segment_without_names_inherits_previous_names(tmp_path):
+    path = _write(tmp_path,
+                  _segment(['X_Value', 'Ch1'], [(0, 1.0), (1, 2.0)]),
+                  _segment(None, [(2, 3.0)]))
+
+    df = read_lvm(path)
+
+    assert list(df.columns) == ['sample', 'X_Value', 'Ch1']
+    assert df['Ch1'].tolist() == [1.0, 2.0, 3.0]
+
+def test_lvm_segments_with_different_columns_raise(tmp_path):
+    path = _write(tmp_path,
+                  _segment(['X_Value', 'Ch1'], [(0, 1.0)]),
+                  _segment(['X_Value', 'Ch1', 'Ch2'], [(1, 2.0, 3.0)]))
+
+    with pytest.raises(ValueError, match="세그먼트 2"):
+        read_lvm(path)
+
+@pytest.mark.parametrize('names', [['X_Value', 'Ch1'], None])
+def test_lvm_columns_match_read_lvm_without_loading_data(tmp_path, names):
+    path = _write(tmp_path, _segment(names, [(0, 1.0), (1, 2.0)]))
+
+    assert read_lvm_columns(path) == list(read_lvm(path).columns)
+
+def test_tdms_group_is_read_with_sample_counter(tmp_path):
+    nptdms = pytest.importorskip('nptdms')
+    path = tmp_path / 'run.tdms'
+    with nptdms.TdmsWriter(str(path)) as writer:
+        writer.write_segment([nptdms.ChannelObject('Group', 'Ch1', np.array([1.0, 2.0, 3.0])),
+                              nptdms.ChannelObject('Group', 'Ch2', np.array([4.0, 5.0, 6.0]))])
+
+    df = read_tdms(str(path))
+
+    pd.testing.assert_frame_equal(df, pd.DataFrame({'sample': [0, 1, 2], 'Ch1': [1.0, 2.0, 3.0],
+                                                    'Ch2': [4.0, 5.0, 6.0]}))
+    assert read_tdms_columns(str(path)) == ['sample', 'Ch1', 'Ch2']
+
+@pytest.mark.parametrize('input_path, choice, expected', [
+    ('run.csv', '', '.csv'),
+    ('run.lvm', '', '.xlsx'),
+    ('run.tdms', None, '.xlsx'),
+    ('run.lvm', 'parquet', '.parquet'),
+])
+def test_output_extension_falls_back_for_unwritable_inputs(input_path, choice, expected):
+    assert output_extension_for(input_path, choice) == expected
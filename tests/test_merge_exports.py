@@ -0,0 +1,53 @@
+import pandas as pd
+import pytest
+
+import merge_exports
+from conftest import sample_frame
+from merge_exports import merge_files
+
+def test_merge_continues_time_and_aligns_channels(tmp_path):
+    first = sample_frame(rows=100, channels=2, seed=1)
+    second = sample_frame(rows=50, channels=3, seed=2)
+    first.to_csv(tmp_path / 'part_1.csv', index=False)
+    second.to_csv(tmp_path / 'part_2.csv', index=False)
+    output_path = str(tmp_path / 'merged.parquet')
+
+    summary = merge_files([str(tmp_path / 'part_1.csv'), str(tmp_path / 'part_2.csv')], output_path,
+                          chunksize=30)
+
+    merged = pd.read_parquet(output_path)
+    assert summary['rows'] == 150
+    assert summary['columns'] == ['Time', 'sample 수', 'DOF1', 'DOF2', 'DOF3']
+    assert str(merged['sample 수'].dtype) == 'Int64'
+    assert merged['sample 수'].tolist() == list(range(150))
+    assert merged['Time'].iloc[-1] == pytest.approx(1.49)
+    assert merged['DOF3'].iloc[:100].isna().all()
+    assert merged['DOF3'].iloc[100:].tolist() == pytest.approx(second['DOF3'].tolist())
+
+def test_merge_keeps_missing_samples_and_text_columns(tmp_path):
+    path = tmp_path / 'part.csv'
+    pd.DataFrame({'sample': [0, 1, None, 3], 'DOF1': [0.5, 1.5, 2.5, 3.5],
+                  'Note': ['a', 'b', 'c', 'd']}).to_csv(path, index=False)
+    output_path = str(tmp_path / 'merged.parquet')
+
+    merge_files([str(path), str(path)], output_path)
+
+    merged = pd.read_parquet(output_path)
+    assert merged['sample'].isna().tolist() == [False, False, True, False] * 2
+    assert merged['sample'].dropna().tolist() == [0, 1, 3, 4, 5, 7]
+    assert merged['Note'].tolist() == list('abcd') * 2
+
+def test_labview_inputs_are_loaded_once(tmp_path, monkeypatch):
+    path = tmp_path / 'run.lvm'
+    path.write_text("LabVIEW Measurement\t\nSeparator\tTab\n***End_of_Header***\t\n\n"
+                    "Channels\t2\t\n***End_of_Header***\t\nX_Value\tCh1\tCh2\tComment\n"
+                    "0\t1.0\t2.0\t\n1\t1.5\t2.5\t\n", encoding='utf-8')
+    loads = []
+    original = merge_exports.load_file
+    monkeypatch.setattr(merge_exports, 'load_file', lambda *args, **kwargs: loads.append(args) or original(*args, **kwargs))
+
+    summary = merge_files([str(path), str(path)], str(tmp_path / 'merged.parquet'))
+
+    assert len(loads) == 2
+    assert summary['columns'] == ['Time', 'sample', 'X_Value', 'Ch1', 'Ch2']
+    assert pd.read_parquet(tmp_path / 'merged.parquet')['sample'].tolist() == [0, 1, 2, 3]
@@ -0,0 +1,58 @@
+import os
+
+import pandas as pd
+import pytest
+
+from batch_processor import DEFAULT_OPTIONS, expand_jobs, run_batch
+from conftest import sample_frame
+from excel_processor import default_output_path, list_sheets
+
+def _workbook(tmp_path):
+    path = tmp_path / 'run.xlsx'
+    with pd.ExcelWriter(path) as writer:
+        sample_frame(20, seed=1).to_excel(writer, sheet_name='Left arm', index=False)
+        pd.DataFrame().to_excel(writer, sheet_name='Empty', index=False)
+        sample_frame(30, seed=2).to_excel(writer, sheet_name='Right', index=False)
+    return str(path)
+
+def test_list_sheets_skips_empty_sheets(tmp_path):
+    assert list_sheets(_workbook(tmp_path)) == ['Left arm', 'Right']
+
+def test_expand_jobs_splits_multi_sheet_workbooks_only(tmp_path, labview_csv):
+    workbook, csv_path = _workbook(tmp_path), labview_csv()
+
+    jobs = expand_jobs([workbook, csv_path], DEFAULT_OPTIONS)
+
+    assert jobs == [(workbook, 'Left arm', True), (workbook, 'Right', True), (csv_path, None, False)]
+    assert expand_jobs([workbook], {**DEFAULT_OPTIONS, 'all_sheets': False}) == [(workbook, None, False)]
+
+def test_each_sheet_is_written_to_its_own_output(tmp_path):
+    workbook = _workbook(tmp_path)
+
+    summary = run_batch([workbook], {'output_extension': '.csv'}, workers=2)
+
+    assert [(r['sheet'], r['rows']) for r in summary['results']] == [('Left arm', 20), ('Right', 30)]
+    assert summary['results'][0]['output'].endswith('run_Left_arm_processed.csv')
+    for result in summary['results']:
+        assert pd.read_csv(result['output']).shape == (result['rows'], 4)
+    assert run_batch([workbook], {'output_extension': '.csv'}, workers=1)['cached'] == 2
+
+@pytest.mark.parametrize('pipeline', [False, True])
+def test_single_data_sheet_after_empty_cover_keeps_plain_output_name(tmp_path, pipeline):
+    workbook = str(tmp_path / 'run.xlsx')
+    with pd.ExcelWriter(workbook) as writer:
+        pd.DataFrame().to_excel(writer, sheet_name='Cover', index=False)
+        sample_frame(25, seed=3).to_excel(writer, sheet_name='Data', index=False)
+
+    assert expand_jobs([workbook], DEFAULT_OPTIONS) == [(workbook, 'Data', False)]
+    summary = run_batch([workbook], {'output_extension': '.csv', 'pipeline': pipeline}, workers=1)
+
+    [result] = summary['results']
+    assert result['error'] is None
+    assert (result['sheet'], result['rows']) == ('Data', 25)
+    assert os.path.basename(result['output']) == 'run_processed.csv'
+
+def test_default_output_path_sanitizes_sheet_names(tmp_path):
+    path = default_output_path(str(tmp_path / 'run.xlsx'), '.csv', sheet_name='a/b: c')
+
+    assert os.path.basename(path) == 'run_a_b_c_processed.csv'
@@ -0,0 +1,87 @@
+import pandas as pd
+import pytest
+
+from app_defaults import split_output_extension
+from conftest import sample_frame
+from output_writers import format_from_path, open_writer, write_dataframe
+
+@pytest.mark.parametrize('extension, reader', [
+    ('.csv', pd.read_csv),
+    ('.parquet', pd.read_parquet),
+    ('.feather', pd.read_feather),
+    ('.xlsx', pd.read_excel),
+])
+def test_chunked_writes_equal_single_write(tmp_path, extension, reader):
+    df = sample_frame(rows=300).drop(columns=[' sample 1 '])
+    path = tmp_path / f'out{extension}'
+
+    with open_writer(str(path)) as writer:
+        for start in range(0, len(df), 120):
+            writer.write(df.iloc[start:start + 120])
+
+    assert writer.rows_written == 300
+    pd.testing.assert_frame_equal(reader(path), df, check_dtype=False)
+
+def test_format_from_path_rejects_unknown_extension():
+    assert format_from_path('a/b.ARROW') == 'feather'
+    with pytest.raises(ValueError):
+        format_from_path('out.txt')
+
+def test_arrow_writer_rejects_chunk_with_different_schema(tmp_path):
+    df = sample_frame(rows=10)
+    with pytest.raises(ValueError):
+        with open_writer(str(tmp_path / 'out.parquet')) as writer:
+            writer.write(df)
+            writer.write(df.assign(DOF1='not a number'))
+
+def test_write_dataframe_uses_extension(tmp_path):
+    df = sample_frame(rows=5)
+    write_dataframe(df, str(tmp_path / 'out.parquet'))
+    assert len(pd.read_parquet(tmp_path / 'out.parquet')) == 5
+
+@pytest.mark.parametrize('extension', ['.csv.gz', '.csv.zst'])
+def test_compressed_csv_chunks_form_one_readable_stream(tmp_path, extension):
+    pa = pytest.importorskip('pyarrow')
+    df = sample_frame(rows=300)
+    path = str(tmp_path / f'out{extension}')
+
+    with open_writer(path) as writer:
+        for start in range(0, len(df), 120):
+            writer.write(df.iloc[start:start + 120])
+
+    with pa.input_stream(path, compression='detect') as stream:
+        pd.testing.assert_frame_equal(pd.read_csv(stream), df)
+
+@pytest.mark.parametrize('compression, expected', [('zstd', 'ZSTD'), ('gzip', 'GZIP'), ('none', 'UNCOMPRESSED')])
+def test_parquet_compression_is_applied(tmp_path, compression, expected):
+    pq = pytest.importorskip('pyarrow.parquet')
+    path = str(tmp_path / 'out.parquet')
+
+    write_dataframe(sample_frame(rows=50), path, compression=compression)
+
+    assert pq.ParquetFile(path).metadata.row_group(0).column(0).compression == expected
+
+def test_feather_accepts_only_arrow_ipc_codecs(tmp_path):
+    df = sample_frame(rows=50)
+    write_dataframe(df, str(tmp_path / 'out.feather'), compression='lz4')
+    pd.testing.assert_frame_equal(pd.read_feather(tmp_path / 'out.feather'), df)
+
+    with pytest.raises(ValueError):
+        write_dataframe(df, str(tmp_path / 'bad.feather'), compression='snappy')
+    with pytest.raises(ValueError):
+        write_dataframe(df, str(tmp_path / 'bad.parquet'), compression='brotli')
+
+@pytest.mark.parametrize('path, expected', [
+    ('out/run_processed.csv.gz', ('out/run_processed', '.csv.gz')),
+    ('run.CSV.ZST', ('run', '.CSV.ZST')),
+    ('run.v2.parquet', ('run.v2', '.parquet')),
+    ('run.txt', ('run', '.txt')),
+])
+def test_split_output_extension_keeps_double_extensions(path, expected):
+    assert split_output_extension(path) == expected
+
+def test_arrow_writer_reports_duplicate_column_names(tmp_path):
+    df = pd.DataFrame([[1.0, 2.0]], columns=['DOF1', 'DOF1'])
+    with pytest.raises(ValueError, match='중복'):
+        with open_writer(str(tmp_path / 'out.parquet')) as writer:
+            writer.write(df)
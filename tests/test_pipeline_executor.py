@@ -0,0 +1,41 @@
+import json
+
+import pandas as pd
+import pytest
+
+from batch_processor import run_batch
+
+@pytest.mark.parametrize('streaming', [False, True])
+def test_pipeline_matches_process_pool_outputs(labview_csv, tmp_path, streaming):
+    paths = [labview_csv(f'run_{i}.csv', rows=700, seed=i) for i in range(3)]
+    options = {'output_extension': '.parquet', 'streaming': streaming, 'chunk_size': 200, 'chart_points': 50,
+               'stats_format': 'json', 'skip_unchanged': False}
+
+    (tmp_path / 'pool').mkdir()
+    (tmp_path / 'pipe').mkdir()
+    pooled = run_batch(paths, {**options, 'output_dir': str(tmp_path / 'pool')}, workers=2)
+    piped = run_batch(paths, {**options, 'output_dir': str(tmp_path / 'pipe'), 'pipeline': True})
+
+    assert [r['input'] for r in piped['results']] == paths
+    assert piped['rows'] == pooled['rows'] == 2100
+    for expected, result in zip(pooled['results'], piped['results']):
+        assert result['error'] is None
+        pd.testing.assert_frame_equal(pd.read_parquet(result['output']), pd.read_parquet(expected['output']))
+        pd.testing.assert_frame_equal(pd.read_parquet(result['chart_output']),
+                                      pd.read_parquet(expected['chart_output']))
+        with open(result['stats_output'], encoding='utf-8') as a, open(expected['stats_output'], encoding='utf-8') as b:
+            piped_stats, pooled_stats = json.load(a), json.load(b)
+        assert list(piped_stats) == list(pooled_stats)
+        for channel, stats in pooled_stats.items():
+            assert piped_stats[channel] == pytest.approx(stats)
+
+def test_pipeline_isolates_failing_file(labview_csv, tmp_path):
+    bad = tmp_path / 'bad.csv'
+    bad.write_text('a,b\n1,2\n', encoding='utf-8')
+    paths = [labview_csv('run_0.csv', rows=100), str(bad), labview_csv('run_1.csv', rows=100)]
+
+    summary = run_batch(paths, {'output_extension': '.csv', 'pipeline': True, 'streaming': True})
+
+    assert [r['error'] is None for r in summary['results']] == [True, False, True]
+    assert summary['succeeded'] == 2
+    assert summary['rows'] == 200
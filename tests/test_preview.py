@@ -0,0 +1,20 @@
+from conftest import sample_frame
+from excel_processor import load_preview
+
+def test_csv_preview_reads_only_first_rows_and_processes_them(labview_csv):
+    preview = load_preview(labview_csv(rows=5000), nrows=50)
+
+    assert len(preview) == 50
+    assert list(preview.columns) == ['Time', 'sample 수', 'DOF1', 'DOF2']
+
+def test_xlsx_preview_limits_rows(tmp_path):
+    path = tmp_path / 'run.xlsx'
+    sample_frame(rows=300).to_excel(path, index=False)
+
+    preview = load_preview(str(path), nrows=20)
+
+    assert len(preview) == 20
+    assert preview.columns[0] == 'Time'
+
+def test_formats_without_partial_read_have_no_preview(tmp_path):
+    assert load_preview(str(tmp_path / 'run.tdms')) is None
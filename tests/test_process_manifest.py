@@ -0,0 +1,48 @@
+import os
+
+from process_manifest import ProcessManifest, file_sha256, settings_key
+
+
+def _processed(tmp_path):
+    source = tmp_path / 'run.csv'
+    source.write_text('a\n1\n', encoding='utf-8')
+    output = tmp_path / 'run_processed.csv'
+    output.write_text('a\n1\n', encoding='utf-8')
+    return str(source), str(output)
+
+def test_lookup_matches_only_same_input_settings_and_output(tmp_path):
+    source, output = _processed(tmp_path)
+    settings = settings_key({'compact': False})
+    manifest = ProcessManifest(str(tmp_path))
+    manifest.record(source, settings, output, rows=1)
+    manifest.save()
+
+    reloaded = ProcessManifest(str(tmp_path))
+    assert reloaded.lookup(source, settings) is not None
+    assert reloaded.lookup(source, settings_key({'compact': True})) is None
+
+    with open(output, 'a', encoding='utf-8') as f:
+        f.write('2\n')
+    assert reloaded.lookup(source, settings) is None
+
+def test_touched_input_matches_by_hash_only_when_enabled(tmp_path):
+    source, output = _processed(tmp_path)
+    manifest = ProcessManifest(str(tmp_path))
+    manifest.record(source, 's', output, rows=1, sha256=file_sha256(source))
+    stat = os.stat(source)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    assert manifest.lookup(source, 's') is None
+    assert manifest.lookup(source, 's', use_hash=True) is not None
+    assert manifest.lookup(source, 's') is not None
+
+def test_missing_sidecar_invalidates_entry(tmp_path):
+    source, output = _processed(tmp_path)
+    sidecar = tmp_path / 'run_processed_stats.json'
+    sidecar.write_text('{}', encoding='utf-8')
+    manifest = ProcessManifest(str(tmp_path))
+    manifest.record(source, 's', output, rows=1, sidecars=[str(sidecar)])
+
+    assert manifest.lookup(source, 's') is not None
+    sidecar.unlink()
+    assert manifest.lookup(source, 's') is None
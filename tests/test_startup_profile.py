@@ -0,0 +1,56 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import startup_profile
+from startup_profile import StartupProfile
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+def test_marks_keep_first_time_and_report_target(monkeypatch):
+    monkeypatch.setattr(startup_profile, 'FIRST_PAINT_TARGET_SECONDS', 1.0)
+    profile = StartupProfile(start=0.0)
+    profile.marks['first_paint'] = 0.4
+    profile.mark('first_paint')
+
+    assert profile.report()['marks'] == {'first_paint': 0.4}
+    assert profile.report()['within_target'] is True
+
+    profile.marks['first_paint'] = 1.5
+    assert profile.report()['within_target'] is False
+    assert '경고' in profile.format_report()
+
+def test_import_module_records_only_new_imports():
+    profile = StartupProfile()
+    profile.import_module('json')
+    profile.import_module('colorsys')
+
+    assert 'json' not in profile.imports
+    assert set(profile.imports) <= {'colorsys'}
+
+def test_write_report_follows_environment(tmp_path, monkeypatch, capsys):
+    profile = StartupProfile()
+    profile.mark('window')
+    monkeypatch.delenv(startup_profile.PROFILE_ENV_VAR, raising=False)
+    profile.write_report()
+    assert capsys.readouterr().err == ''
+
+    monkeypatch.setenv(startup_profile.PROFILE_ENV_VAR, '-')
+    profile.write_report()
+    assert 'window' in capsys.readouterr().err
+
+    path = tmp_path / 'startup.json'
+    monkeypatch.setenv(startup_profile.PROFILE_ENV_VAR, str(path))
+    profile.write_report()
+    assert 'window' in json.loads(path.read_text(encoding='utf-8'))['marks']
+
+def test_gui_module_does_not_import_data_libraries():
+    pytest.importorskip('tkinter')
+    code = ("import sys; import excel_processor_gui_v4; "
+            "print([name for name in ('pandas', 'numpy', 'openpyxl') if name in sys.modules])")
+    result = subprocess.run([sys.executable, '-c', code], cwd=SRC, capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == '[]'
@@ -0,0 +1,73 @@
+import os
+import threading
+
+import pandas as pd
+import pytest
+
+from excel_processor import (
+    ProcessingCancelled,
+    iter_processed_csv_chunks,
+    load_file,
+    process_data,
+    process_file_streaming,
+)
+
+def _saved(df, tmp_path):
+    path = tmp_path / 'expected.csv'
+    df.to_csv(path, index=False)
+    return path
+
+def test_streaming_output_matches_in_memory_processing(labview_csv, tmp_path):
+    input_path = labview_csv(rows=2500)
+    output_path = str(tmp_path / 'run_processed.csv')
+
+    rows = process_file_streaming(input_path, output_path, chunksize=700, require_sample=True)
+
+    expected = process_data(load_file(input_path), require_sample=True)
+    streamed = pd.read_csv(output_path)
+    assert rows == 2500
+    assert list(streamed.columns) == ['Time', 'sample 수', 'DOF1', 'DOF2']
+    pd.testing.assert_frame_equal(streamed, pd.read_csv(_saved(expected, tmp_path)))
+
+def test_chunks_drop_duplicate_sample_columns_and_add_time(labview_csv):
+    chunks = list(iter_processed_csv_chunks(labview_csv(rows=250), chunksize=100))
+
+    assert [len(chunk) for chunk in chunks] == [100, 100, 50]
+    last = chunks[-1]
+    assert 'sample 1' not in last.columns
+    assert last['Time'].iloc[-1] == pytest.approx(2.49)
+
+def test_require_sample_raises_without_sample_column(tmp_path):
+    path = tmp_path / 'no_sample.csv'
+    pd.DataFrame({'a': [1, 2], 'b': [3, 4]}).to_csv(path, index=False)
+
+    with pytest.raises(ValueError):
+        list(iter_processed_csv_chunks(str(path), require_sample=True))
+
+def test_cancel_removes_partial_output(labview_csv, tmp_path):
+    output_path = str(tmp_path / 'cancelled.csv')
+    cancel_event = threading.Event()
+    cancel_event.set()
+
+    with pytest.raises(ProcessingCancelled):
+        process_file_streaming(labview_csv(rows=500), output_path, chunksize=100, cancel_event=cancel_event)
+    assert not os.path.exists(output_path)
+
+@pytest.mark.parametrize('extension', ['.parquet', '.feather'])
+@pytest.mark.parametrize('compact', [False, True])
+def test_later_fractional_chunk_fits_arrow_schema(tmp_path, extension, compact):
+    path = tmp_path / 'run.csv'
+    dof = [0] * 150 + [0.5] * 100
+    # 앞 조각은 '0'만 있어 정수로 읽히고, 뒤 조각에서 소수가 나옵니다
+    lines = ['sample,DOF1,Note'] + [f'{i},{value},a' for i, value in enumerate(dof)]
+    path.write_text('\n'.join(lines) + '\n')
+    output_path = str(tmp_path / f'run_processed{extension}')
+
+    rows = process_file_streaming(str(path), output_path, chunksize=100, compact=compact)
+
+    reader = pd.read_parquet if extension == '.parquet' else pd.read_feather
+    result = reader(output_path)
+    assert rows == 250
+    assert result['DOF1'].dtype == ('float32' if compact else 'float64')
+    assert result['DOF1'].tolist() == dof
+    assert result['Note'].tolist() == ['a'] * 250
@@ -0,0 +1,45 @@
+import pytest
+
+from conftest import sample_frame
+from virtual_preview import CsvFileSource, DataFrameSource
+
+def test_csv_source_reads_only_requested_rows(labview_csv):
+    path = labview_csv(rows=1000)
+    expected = sample_frame(rows=1000)
+    source = CsvFileSource(path)
+    try:
+        assert source.row_count == 1000
+        assert source.columns == [str(col) for col in expected.columns]
+        assert source.rows(500, 503) == [
+            pytest.approx(row, rel=1e-12) for row in expected.iloc[500:503].itertuples(index=False, name=None)]
+        assert len(source.rows(995, 1010)) == 5
+        assert source.rows(1000, 1010) == []
+    finally:
+        source.close()
+
+def test_csv_source_counts_last_row_without_trailing_newline(tmp_path):
+    path = tmp_path / 'run.csv'
+    path.write_text('a,b\n1,2\n3,4', encoding='utf-8')
+    source = CsvFileSource(str(path))
+    try:
+        assert source.row_count == 2
+        assert source.rows(1, 2) == [(3, 4)]
+    finally:
+        source.close()
+
+def test_csv_source_uses_sniffed_format(tmp_path):
+    path = tmp_path / 'run.csv'
+    path.write_text('LabVIEW chart export\n\nsample\tDOF1\n0\t0,5\t\n1\t1,5\t\n', encoding='utf-8')
+    source = CsvFileSource(str(path))
+    try:
+        assert source.columns == ['sample', 'DOF1']
+        assert source.row_count == 2
+        assert source.rows(0, 2) == [(0, 0.5), (1, 1.5)]
+    finally:
+        source.close()
+
+def test_dataframe_source_slices_rows():
+    df = sample_frame(rows=20)
+    source = DataFrameSource(df)
+    assert source.row_count == 20
+    assert source.rows(18, 30) == list(df.iloc[18:].itertuples(index=False, name=None))
@@ -0,0 +1,65 @@
+import pandas as pd
+
+from watch_folder import FolderWatcher
+
+HEADER = " sample 수 ,DOF1, sample 1 \n"
+
+def _rows(start, stop):
+    return "".join(f"{i},{i * 0.5},{i}\n" for i in range(start, stop))
+
+def test_only_new_complete_rows_are_appended(tmp_path):
+    source = tmp_path / 'run.csv'
+    source.write_text(HEADER + _rows(0, 3) + "3,1.", encoding='utf-8')
+    watcher = FolderWatcher(str(tmp_path))
+
+    assert watcher.scan_once() == {str(source): 3}
+    with open(source, 'a', encoding='utf-8') as f:
+        f.write("5,3\n" + _rows(4, 6))
+    assert watcher.scan_once() == {str(source): 3}
+    assert watcher.scan_once() == {}
+
+    output = pd.read_csv(tmp_path / 'run_processed.csv')
+    assert list(output.columns) == ['Time', 'sample 수', 'DOF1']
+    assert output['sample 수'].tolist() == [0, 1, 2, 3, 4, 5]
+    assert output['Time'].iloc[-1] == 0.05
+
+def test_append_is_not_repeated_after_crash_before_state_save(tmp_path):
+    source = tmp_path / 'run.csv'
+    source.write_text(HEADER + _rows(0, 3), encoding='utf-8')
+    FolderWatcher(str(tmp_path)).scan_once()
+
+    with open(source, 'a', encoding='utf-8') as f:
+        f.write(_rows(3, 5))
+    # 이어 쓰기는 끝났지만 상태를 저장하기 전에 종료된 경우
+    crashed = FolderWatcher(str(tmp_path))
+    crashed.process_file(str(source))
+
+    FolderWatcher(str(tmp_path)).scan_once()
+
+    output = pd.read_csv(tmp_path / 'run_processed.csv')
+    assert output['sample 수'].tolist() == [0, 1, 2, 3, 4]
+
+def test_rewritten_file_is_processed_from_scratch(tmp_path):
+    source = tmp_path / 'run.csv'
+    source.write_text(HEADER + _rows(0, 5), encoding='utf-8')
+    watcher = FolderWatcher(str(tmp_path))
+    watcher.scan_once()
+
+    source.write_text(HEADER + _rows(0, 2), encoding='utf-8')
+    watcher.scan_once()
+
+    assert len(pd.read_csv(tmp_path / 'run_processed.csv')) == 2
+
+def test_sniffed_format_is_used_for_appended_rows(tmp_path):
+    source = tmp_path / 'run.csv'
+    source.write_text("LabVIEW export\n\nsample\tDOF1\n0\t0,5\t\n", encoding='utf-8')
+    watcher = FolderWatcher(str(tmp_path))
+    assert watcher.scan_once() == {str(source): 1}
+
+    with open(source, 'a', encoding='utf-8') as f:
+        f.write("1\t1,5\t\n2\t2,5\t\n")
+    assert watcher.scan_once() == {str(source): 2}
+
+    output = pd.read_csv(tmp_path / 'run_processed.csv')
+    assert list(output.columns) == ['Time', 'sample', 'DOF1']
+    assert output['DOF1'].tolist() == [0.5, 1.5, 2.5]
@@ -0,0 +1,40 @@
+import pandas as pd
+import pytest
+
+from conftest import sample_frame
+from excel_processor import load_xlsx_projected, process_data
+
+def test_projected_xlsx_load_matches_read_excel(tmp_path):
+    path = tmp_path / 'run.xlsx'
+    sample_frame(rows=200).to_excel(path, index=False)
+
+    projected = process_data(load_xlsx_projected(str(path)))
+    expected = process_data(pd.read_excel(path))
+
+    pd.testing.assert_frame_equal(projected, expected, check_dtype=False)
+
+def test_projected_xlsx_skips_duplicate_sample_columns_and_limits_rows(tmp_path):
+    path = tmp_path / 'run.xlsx'
+    sample_frame(rows=200).to_excel(path, index=False)
+
+    df = load_xlsx_projected(str(path), max_rows=50)
+
+    assert len(df) == 50
+    assert [str(col).strip() for col in df.columns] == ['sample 수', 'DOF1', 'DOF2']
+
+def test_duplicate_channel_names_are_renamed_like_read_excel(tmp_path):
+    path = tmp_path / 'run.xlsx'
+    df = pd.DataFrame([[0, 1.0, 2.0, 3.0], [1, 4.0, 5.0, 6.0]], columns=['sample', 'Voltage', 'Voltage', 'Voltage'])
+    df.to_excel(path, index=False)
+
+    projected = load_xlsx_projected(str(path))
+
+    assert list(projected.columns) == ['sample', 'Voltage', 'Voltage.1', 'Voltage.2']
+    pd.testing.assert_frame_equal(process_data(projected), process_data(pd.read_excel(path)), check_dtype=False)
+
+def test_sheet_without_header_raises(tmp_path):
+    path = tmp_path / 'empty.xlsx'
+    pd.DataFrame().to_excel(path, index=False)
+
+    with pytest.raises(ValueError, match="열 이름이 없습니다"):
+        load_xlsx_projected(str(path))